@@ -2,30 +2,51 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import contextmanager
 from functools import partial
 import logging
+import time
+from typing import Iterator
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.loader import async_get_integration
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers.storage import Store
 
 from .const import (
+    CONF_API_BASE_URL,
+    CONF_BLOCKING_DETECTOR,
+    CONF_BLOCKING_THRESHOLD,
+    CONF_CALENDAR_URL,
+    CONF_DIAGNOSTICS_LEVEL,
     CONF_FIXTURE_BASE_URL,
     CONF_MITID_USERNAME,
     CONF_PASSWORD,
     CONF_REAUTH_REQUIRED,
+    CONF_TOKEN_URL,
+    CONF_TRACE_JOURNAL,
+    DEFAULT_BLOCKING_DETECTOR,
+    DEFAULT_BLOCKING_THRESHOLD,
+    DEFAULT_DIAGNOSTICS_LEVEL,
+    DEFAULT_TRACE_JOURNAL,
     DOMAIN,
     STARTUP,
 )
 from .client import EasyIQAuthError, EasyIQClient
+from .loop_blocking import LoopBlockingDetector
+from .message_index import MessageThreadIndex
 from .migration import migrate_legacy_password_entry_data
 from .mitid_auth import AulaTokenRefresher, AulaTokenState, MitIDAuthError
 from .sensor import EasyIQDataUpdateCoordinator
+from .trace_journal import TraceJournal
 
 _LOGGER = logging.getLogger(__name__)
 
+MESSAGE_INDEX_STORAGE_VERSION = 1
+MESSAGE_INDEX_SAVE_DELAY = 30
+
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
@@ -46,19 +67,44 @@ def _schedule_token_state_persist(
     )
 
 
+def _schedule_message_index_persist(
+    hass: HomeAssistant,
+    store: Store,
+    message_index: MessageThreadIndex,
+) -> None:
+    """Persist the message thread index from the client's executor thread."""
+    data = message_index.as_dict()
+    hass.loop.call_soon_threadsafe(
+        partial(store.async_delay_save, lambda: data, MESSAGE_INDEX_SAVE_DELAY)
+    )
+
+
+@contextmanager
+def _setup_phase(setup_timings: dict[str, float], phase: str) -> Iterator[None]:
+    """Record the wall time of one async_setup_entry phase in milliseconds."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        setup_timings[phase] = round((time.perf_counter() - started) * 1000, 1)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up EasyIQ from a config entry."""
+    setup_started = time.perf_counter()
+    setup_timings: dict[str, float] = {}
     integration = await async_get_integration(hass, DOMAIN)
     _LOGGER.info(STARTUP, integration.version)
     
     hass.data.setdefault(DOMAIN, {})
 
-    try:
-        from .views import async_register_auth_views
+    with _setup_phase(setup_timings, "register_views"):
+        try:
+            from .views import async_register_auth_views
 
-        await async_register_auth_views(hass)
-    except Exception as err:  # pylint: disable=broad-except
-        _LOGGER.debug("Could not register MitID auth views during setup: %s", err)
+            await async_register_auth_views(hass)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Could not register MitID auth views during setup: %s", err)
 
     fixture_base_url = entry.data.get(CONF_FIXTURE_BASE_URL)
 
@@ -83,26 +129,66 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     def _handle_token_update(new_token_state: AulaTokenState) -> None:
         runtime_data["token_state"] = new_token_state
         _schedule_token_state_persist(hass, entry, new_token_state)
+
+    with _setup_phase(setup_timings, "client"):
+        # Message threads already seen survive restarts, so polling stays incremental
+        message_store = Store(
+            hass,
+            MESSAGE_INDEX_STORAGE_VERSION,
+            f"{DOMAIN}.{entry.entry_id}.messages",
+        )
+        message_index = MessageThreadIndex.from_dict(await message_store.async_load())
+
+        token_url = entry.data.get(CONF_TOKEN_URL)
+        trace_journal = (
+            TraceJournal(hass.config.path(DOMAIN, f"trace_{entry.entry_id}.jsonl"))
+            if entry.options.get(CONF_TRACE_JOURNAL, DEFAULT_TRACE_JOURNAL)
+            else None
+        )
     
-    # Create the EasyIQ client
-    client = EasyIQClient(
-        mitid_username=mitid_username,
-        token_state=token_state,
-        token_refresher=AulaTokenRefresher(),
-        on_token_update=_handle_token_update,
-        fixture_base_url=fixture_base_url,
-    )
+        # Create the EasyIQ client
+        client = EasyIQClient(
+            mitid_username=mitid_username,
+            token_state=token_state,
+            token_refresher=AulaTokenRefresher(token_url) if token_url else AulaTokenRefresher(),
+            on_token_update=_handle_token_update,
+            fixture_base_url=fixture_base_url,
+            message_index=message_index,
+            on_message_index_update=partial(
+                _schedule_message_index_persist, hass, message_store
+            ),
+            api_base_url=entry.data.get(CONF_API_BASE_URL),
+            calendar_url=entry.data.get(CONF_CALENDAR_URL),
+            trace_journal=trace_journal,
+            diagnostics_level=entry.options.get(
+                CONF_DIAGNOSTICS_LEVEL, DEFAULT_DIAGNOSTICS_LEVEL
+            ),
+        )
     
-    # Create the data update coordinator
-    coordinator = EasyIQDataUpdateCoordinator(hass, client, entry)
+        blocking_detector = (
+            LoopBlockingDetector(
+                entry.options.get(CONF_BLOCKING_THRESHOLD, DEFAULT_BLOCKING_THRESHOLD)
+            )
+            if entry.options.get(CONF_BLOCKING_DETECTOR, DEFAULT_BLOCKING_DETECTOR)
+            else None
+        )
+
+        # Create the data update coordinator
+        coordinator = EasyIQDataUpdateCoordinator(
+            hass, client, entry, blocking_detector=blocking_detector
+        )
     
     # Perform initial data fetch
     try:
-        await coordinator.async_config_entry_first_refresh()
-    except (EasyIQAuthError, MitIDAuthError) as err:
-        _LOGGER.error("EasyIQ authentication failed during setup: %s", err)
-        raise ConfigEntryAuthFailed from err
+        with _setup_phase(setup_timings, "first_refresh"):
+            await coordinator.async_config_entry_first_refresh()
     except Exception as err:
+        # Every setup attempt creates its own detector, so stop this one's sampler thread.
+        if blocking_detector is not None:
+            blocking_detector.close()
+        if isinstance(err, (EasyIQAuthError, MitIDAuthError)):
+            _LOGGER.error("EasyIQ authentication failed during setup: %s", err)
+            raise ConfigEntryAuthFailed from err
         _LOGGER.error("Failed to perform initial data fetch: %s", err)
         raise ConfigEntryNotReady from err
     
@@ -110,6 +196,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass_data = {
         "coordinator": coordinator,
         "client": client,
+        "setup_timings": setup_timings,
     }
     
     # Registers update listener to update config entry when options are updated.
@@ -119,8 +206,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     runtime_data.update(hass_data)
 
     # Forward the setup to the sensor, binary_sensor, and calendar platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    
+    with _setup_phase(setup_timings, "forward_platforms"):
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    setup_timings["total"] = round((time.perf_counter() - setup_started) * 1000, 1)
+    _LOGGER.debug("EasyIQ setup of %s took %s ms", entry.title, setup_timings)
     return True
 
 
@@ -141,7 +231,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     # Remove options_update_listener.
-    hass.data[DOMAIN][entry.entry_id]["unsub_options_update_listener"]()
+    runtime_data = hass.data[DOMAIN][entry.entry_id]
+    runtime_data["unsub_options_update_listener"]()
+
+    # Stop the blocking detector's sampler thread even if a platform failed to unload.
+    if runtime_data["coordinator"].blocking_detector is not None:
+        runtime_data["coordinator"].blocking_detector.close()
 
     # Remove config entry from domain.
     if unload_ok:
@@ -6,7 +6,7 @@ from typing import Any
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -52,12 +52,18 @@ async def async_setup_entry(
             _LOGGER.info("Created presence sensor for child: %s (ID: %s)", child_name, child_id)
     
     _LOGGER.info("Adding %d binary sensor entities to Home Assistant", len(entities))
+    if coordinator.blocking_detector is not None:
+        for entity in entities:
+            coordinator.blocking_detector.instrument_entity(entity)
     async_add_entities(entities)
 
 
 class EasyIQMessageBinarySensor(CoordinatorEntity, BinarySensorEntity):
     """Representation of an EasyIQ message binary sensor."""
 
+    # The message body stays in state for notifications but is not recorded.
+    _unrecorded_attributes = frozenset({"text"})
+
     def __init__(self, coordinator) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
@@ -65,6 +71,25 @@ class EasyIQMessageBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_unique_id = "easyiq_messages"
         # Remove device_class to avoid "Disconnected" status
         # self._attr_device_class = "connectivity"
+        self._message_state = self._current_message_state()
+
+    def _current_message_state(self) -> tuple[Any, ...]:
+        """Return what the sensor shows: availability, unread count, and newest message."""
+        data = self.coordinator.data or {}
+        return (
+            self.coordinator.last_update_success,
+            data.get("unread_messages", 0),
+            data.get("message_key"),
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the unread count or newest unread message changed."""
+        message_state = self._current_message_state()
+        if message_state == self._message_state:
+            return
+        self._message_state = message_state
+        super()._handle_coordinator_update()
 
     @property
     def is_on(self) -> bool:
@@ -93,7 +118,7 @@ class EasyIQMessageBinarySensor(CoordinatorEntity, BinarySensorEntity):
         }
         
         # Add message details if available
-        if message_data:
+        if message_data and message_data.get("content_available", True):
             attributes.update({
                 "subject": message_data.get("subject", ""),
                 "text": message_data.get("text", ""),
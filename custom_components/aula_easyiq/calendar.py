@@ -1,10 +1,11 @@
 """Calendar platform for EasyIQ integration."""
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 import logging
 import html as html_lib
 import re
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
@@ -14,6 +15,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
+from .calendar_index import CalendarTimeline
+from .calendar_window import RANGE_CACHE_WEEKS, CalendarWeek, business_dates
+from .event_store import view_events, view_revision
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -134,42 +138,34 @@ async def async_setup_entry(
     else:
         _LOGGER.warning("No children data available for calendar setup")
     
+    if coordinator.blocking_detector is not None:
+        for entity in entities:
+            coordinator.blocking_detector.instrument_entity(entity)
     async_add_entities(entities)
 
 
-class EasyIQWeekplanCalendarEntity(CalendarEntity):
-    """EasyIQ weekplan calendar entity."""
+class _EasyIQCalendarEntity(CalendarEntity, ABC):
+    """Shared EasyIQ calendar entity backed by a cached, start-sorted timeline."""
+
+    _view_key = ""
+    _event_label = "calendar"
 
     def __init__(self, coordinator, child_id: str, child_name: str) -> None:
-        """Initialize the weekplan calendar entity."""
+        """Initialize the calendar entity."""
         self._coordinator = coordinator
         self._child_id = child_id
         self._child_name = child_name
-        self._attr_name = f"EasyIQ {child_name} Weekplan"
-        self._attr_unique_id = f"easyiq_weekplan_{child_id}"
+        self._timeline: CalendarTimeline[CalendarEvent] = CalendarTimeline()
+        self._timeline_key: tuple[Any, ...] | None = None
+        self._week_timelines: dict[date, tuple[CalendarWeek, CalendarTimeline[CalendarEvent]]] = {}
 
     @property
     def event(self) -> CalendarEvent | None:
-        """Return the next upcoming weekplan event."""
+        """Return the next upcoming event."""
         try:
-            # Get weekplan events for this child
-            all_events = self._get_weekplan_events()
-            
-            if not all_events:
-                return None
-            
-            # Find the next upcoming event
-            now = dt_util.now()  # Use timezone-aware current time
-            upcoming_events = [event for event in all_events if event.start > now]
-            
-            if upcoming_events:
-                # Sort by start time and return the earliest
-                upcoming_events.sort(key=lambda x: x.start)
-                return upcoming_events[0]
-            
+            return self._get_timeline().next_after(dt_util.now())
         except Exception as err:
-            _LOGGER.error("Error getting next weekplan event: %s", err)
-        
+            _LOGGER.error("Error getting next %s event: %s", self._event_label, err)
         return None
 
     async def async_get_events(
@@ -178,26 +174,131 @@ class EasyIQWeekplanCalendarEntity(CalendarEntity):
         start_date: datetime,
         end_date: datetime,
     ) -> list[CalendarEvent]:
-        """Return weekplan calendar events within a datetime range."""
+        """Return calendar events within a datetime range.
+
+        Days in the coordinator's polling window come from the cached
+        timeline; other weeks in the range are fetched on demand and cached
+        by the client, so browsing does not widen the polling window.
+        """
         try:
-            # Get weekplan events for this child
-            all_events = self._get_weekplan_events()
-            
-            # Filter events within the requested date range
-            filtered_events = []
-            for event in all_events:
-                if event.end >= start_date and event.start <= end_date:
-                    filtered_events.append(event)
-            
-            _LOGGER.debug("Found %d weekplan events for %s between %s and %s",
-                         len(filtered_events), self._child_name, start_date, end_date)
-            
+            filtered_events = self._get_timeline().between(start_date, end_date)
+            range_events = await self._get_range_events(start_date, end_date)
+            if range_events:
+                filtered_events = sorted(
+                    [*filtered_events, *range_events],
+                    key=lambda event: event.start,
+                )
+            _LOGGER.debug("Found %d %s events for %s between %s and %s",
+                         len(filtered_events), self._event_label, self._child_name,
+                         start_date, end_date)
             return filtered_events
-                    
         except Exception as err:
-            _LOGGER.error("Error fetching weekplan calendar events: %s", err)
+            _LOGGER.error("Error fetching %s calendar events: %s", self._event_label, err)
+            return []
+
+    def _current_timeline_key(self) -> tuple[Any, ...] | None:
+        """Return what the parsed events depend on, or None when uncacheable."""
+        revision = view_revision(self._coordinator.data, self._view_key, self._child_id)
+        if revision is None:
+            return None
+        return (revision,)
+
+    def _get_timeline(self) -> CalendarTimeline[CalendarEvent]:
+        """Return the cached timeline, rebuilding it only when the view changed."""
+        key = self._current_timeline_key()
+        if key is None or key != self._timeline_key:
+            self._timeline = CalendarTimeline(self._build_events())
+            self._timeline_key = key
+        return self._timeline
+
+    @abstractmethod
+    def _build_events(self) -> list[CalendarEvent]:
+        """Parse the child's view into calendar events."""
+
+    def _covered_dates(self) -> frozenset[date]:
+        """Return the dates the child's polled view already covers."""
+        data = self._coordinator.data or {}
+        view = (data.get(self._view_key) or {}).get(self._child_id) or {}
+        days = view.get("days")
+        if not days:
+            return frozenset()
+        return frozenset(business_dates(dt_util.now().date(), days))
+
+    async def _get_range_events(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        """Return events from on-demand weeks outside the polling window."""
+        client = getattr(self._coordinator, "client", None)
+        if client is None or not hasattr(client, "get_calendar_weeks"):
             return []
 
+        covered = self._covered_dates()
+        weeks = await client.get_calendar_weeks(
+            self._child_id,
+            dt_util.as_local(start_date).date(),
+            dt_util.as_local(end_date).date(),
+            skip_dates=covered,
+        )
+        events: list[CalendarEvent] = []
+        for week in weeks:
+            events.extend(
+                event
+                for event in self._get_week_timeline(week).between(start_date, end_date)
+                if event.start.date() not in covered
+            )
+        return events
+
+    def _get_week_timeline(self, week: CalendarWeek) -> CalendarTimeline[CalendarEvent]:
+        """Return the parsed timeline for an on-demand week, rebuilt on refetch."""
+        cached = self._week_timelines.get(week.monday)
+        if cached is not None and cached[0] is week:
+            return cached[1]
+        timeline = CalendarTimeline(
+            event
+            for event_data in self._week_source(week)
+            if (event := self._parse_source_event(event_data)) is not None
+        )
+        self._week_timelines.pop(week.monday, None)
+        self._week_timelines[week.monday] = (week, timeline)
+        while len(self._week_timelines) > RANGE_CACHE_WEEKS:
+            self._week_timelines.pop(next(iter(self._week_timelines)))
+        return timeline
+
+    @abstractmethod
+    def _week_source(self, week: CalendarWeek) -> tuple[dict[str, Any], ...]:
+        """Return this calendar's event data from an on-demand week."""
+
+    @abstractmethod
+    def _parse_source_event(self, event_data: dict[str, Any]) -> CalendarEvent | None:
+        """Parse one event data dict from this calendar's source."""
+
+
+class EasyIQWeekplanCalendarEntity(_EasyIQCalendarEntity):
+    """EasyIQ weekplan calendar entity."""
+
+    _view_key = "weekplan_data"
+    _event_label = "weekplan"
+
+    def __init__(self, coordinator, child_id: str, child_name: str) -> None:
+        """Initialize the weekplan calendar entity."""
+        super().__init__(coordinator, child_id, child_name)
+        self._attr_name = f"EasyIQ {child_name} Weekplan"
+        self._attr_unique_id = f"easyiq_weekplan_{child_id}"
+
+    def _build_events(self) -> list[CalendarEvent]:
+        """Parse the child's weekplan view into calendar events."""
+        return self._get_weekplan_events()
+
+    def _week_source(self, week: CalendarWeek) -> tuple[dict[str, Any], ...]:
+        """Return weekplan events from an on-demand week."""
+        return week.weekplan
+
+    def _parse_source_event(self, event_data: dict[str, Any]) -> CalendarEvent | None:
+        """Parse one weekplan event."""
+        return self._parse_weekplan_event(event_data)
+
     def _get_weekplan_events(self) -> list[CalendarEvent]:
         """Get weekplan events for this child."""
         events = []
@@ -206,8 +307,7 @@ class EasyIQWeekplanCalendarEntity(CalendarEntity):
             return events
         
         # Get weekplan events for this specific child
-        weekplan_data = self._coordinator.data.get("weekplan_data", {}).get(self._child_id, {})
-        weekplan_events = weekplan_data.get('events', [])
+        weekplan_events = view_events(self._coordinator.data, "weekplan_data", self._child_id)
         
         _LOGGER.debug(f"Found {len(weekplan_events)} weekplan events for child {self._child_name} (ID: {self._child_id})")
         
@@ -275,119 +375,37 @@ class EasyIQWeekplanCalendarEntity(CalendarEntity):
             _LOGGER.error("Error parsing weekplan event: %s", err)
             return None
 
-    def _parse_homework_event(self, assignment_data: dict[str, Any]) -> CalendarEvent | None:
-        """Parse a homework assignment as a calendar event."""
-        try:
-            # Get assignment details
-            title = assignment_data.get('title', assignment_data.get('subject', 'Homework'))
-            subject = assignment_data.get('subject', 'Unknown Subject')
-            description = assignment_data.get('description', '')
-            activities = assignment_data.get('activities', '')
-            start_time_str = assignment_data.get('start_time', '')
-            
-            # If we have a start time, use it; otherwise create an all-day event
-            if start_time_str:
-                try:
-                    event_start = _parse_easyiq_datetime(start_time_str)
-                    if event_start is None:
-                        raise ValueError("Unsupported EasyIQ date format")
-                    event_end = event_start + timedelta(hours=1)
-                except ValueError:
-                    # If parsing fails, create all-day event for today
-                    now = dt_util.now()
-                    event_start = now.replace(hour=9, minute=0, second=0, microsecond=0)
-                    event_end = event_start.replace(hour=10)
-            else:
-                # Create all-day homework event for today
-                now = dt_util.now()
-                event_start = now.replace(hour=9, minute=0, second=0, microsecond=0)
-                event_end = event_start.replace(hour=10)
-            
-            # Build description
-            description_parts = []
-            description_parts.append(f"📚 Subject: {subject}")
-            
-            if activities:
-                description_parts.append(f"📝 Activities: {activities}")
-            
-            if description:
-                description_parts.append(f"📋 Description: {description}")
-            
-            # Add homework indicator
-            description_parts.append("🏠 Type: Homework Assignment")
-            
-            return CalendarEvent(
-                start=event_start,
-                end=event_end,
-                summary=f"📚 {title}",
-                description="\n".join(description_parts),
-            )
-            
-        except Exception as err:
-            _LOGGER.error("Error parsing weekplan event: %s", err)
-            return None
-
 
-class EasyIQHomeworkCalendarEntity(CalendarEntity):
+class EasyIQHomeworkCalendarEntity(_EasyIQCalendarEntity):
     """EasyIQ homework calendar entity."""
 
+    _view_key = "homework_data"
+    _event_label = "homework"
+
     def __init__(self, coordinator, child_id: str, child_name: str) -> None:
         """Initialize the homework calendar entity."""
-        self._coordinator = coordinator
-        self._child_id = child_id
-        self._child_name = child_name
+        super().__init__(coordinator, child_id, child_name)
         self._attr_name = f"EasyIQ {child_name} Homework"
         self._attr_unique_id = f"easyiq_homework_{child_id}"
 
-    @property
-    def event(self) -> CalendarEvent | None:
-        """Return the next upcoming homework event."""
-        try:
-            # Get homework events for this child
-            all_events = self._get_homework_events()
-            
-            if not all_events:
-                return None
-            
-            # Find the next upcoming event
-            now = dt_util.now()  # Use timezone-aware current time
-            upcoming_events = [event for event in all_events if event.start > now]
-            
-            if upcoming_events:
-                # Sort by start time and return the earliest
-                upcoming_events.sort(key=lambda x: x.start)
-                return upcoming_events[0]
-            
-        except Exception as err:
-            _LOGGER.error("Error getting next homework event: %s", err)
-        
-        return None
+    def _current_timeline_key(self) -> tuple[Any, ...] | None:
+        """Include today, since undated assignments are placed on today."""
+        key = super()._current_timeline_key()
+        if key is None:
+            return None
+        return (*key, dt_util.now().date())
 
-    async def async_get_events(
-        self,
-        hass: HomeAssistant,
-        start_date: datetime,
-        end_date: datetime,
-    ) -> list[CalendarEvent]:
-        """Return homework calendar events within a datetime range."""
-        try:
-            # Get homework events for this child
-            all_events = self._get_homework_events()
-            
-            # Filter events within the requested date range
-            filtered_events = []
-            for event in all_events:
-                if event.end >= start_date and event.start <= end_date:
-                    filtered_events.append(event)
-            
-            _LOGGER.debug("Found %d homework events for %s between %s and %s",
-                         len(filtered_events), self._child_name, start_date, end_date)
-            
-            return filtered_events
-                    
-        except Exception as err:
-            _LOGGER.error("Error fetching homework calendar events: %s", err)
-            return []
+    def _build_events(self) -> list[CalendarEvent]:
+        """Parse the child's homework view into calendar events."""
+        return self._get_homework_events()
+
+    def _week_source(self, week: CalendarWeek) -> tuple[dict[str, Any], ...]:
+        """Return homework assignments from an on-demand week."""
+        return week.homework
+
+    def _parse_source_event(self, event_data: dict[str, Any]) -> CalendarEvent | None:
+        """Parse one homework assignment."""
+        return self._parse_homework_event(event_data)
 
     def _get_homework_events(self) -> list[CalendarEvent]:
         """Get homework events for this child."""
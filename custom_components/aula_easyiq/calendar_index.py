@@ -0,0 +1,62 @@
+"""Start-sorted calendar event index used by the EasyIQ calendar entities."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Generic, Iterable, Protocol, TypeVar
+
+
+class _TimedEvent(Protocol):
+    """Anything with ``start`` and ``end`` datetimes, such as ``CalendarEvent``."""
+
+    start: datetime
+    end: datetime
+
+
+EventT = TypeVar("EventT", bound=_TimedEvent)
+
+
+class CalendarTimeline(Generic[EventT]):
+    """Immutable, start-sorted list of calendar events with bisect lookups.
+
+    The entities build one timeline per view revision, so the Home Assistant
+    frontend can query ``event`` and date ranges repeatedly without
+    re-parsing or re-sorting the child's events.
+    """
+
+    __slots__ = ("_events", "_starts", "_max_duration")
+
+    def __init__(self, events: Iterable[EventT] = ()) -> None:
+        """Sort events by start time and remember the longest duration."""
+        self._events: tuple[EventT, ...] = tuple(sorted(events, key=lambda event: event.start))
+        self._starts: list[datetime] = [event.start for event in self._events]
+        self._max_duration = max(
+            (event.end - event.start for event in self._events),
+            default=timedelta(0),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of indexed events."""
+        return len(self._events)
+
+    @property
+    def events(self) -> tuple[EventT, ...]:
+        """Return all indexed events in start order."""
+        return self._events
+
+    def next_after(self, moment: datetime) -> EventT | None:
+        """Return the earliest event starting strictly after ``moment``."""
+        position = bisect_right(self._starts, moment)
+        if position < len(self._events):
+            return self._events[position]
+        return None
+
+    def between(self, start: datetime, end: datetime) -> list[EventT]:
+        """Return events overlapping ``start``..``end``, inclusive, in start order.
+
+        Events that start before ``start`` can still overlap it, so the scan
+        begins at ``start`` minus the longest indexed event duration.
+        """
+        first = bisect_left(self._starts, start - self._max_duration)
+        last = bisect_right(self._starts, end)
+        return [event for event in self._events[first:last] if event.end >= start]
@@ -0,0 +1,191 @@
+"""Calendar date windows and the bounded cache for on-demand EasyIQ week fetches."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+import time
+from typing import Any, Callable, Iterable
+
+# Weeks fetched for calendar browsing outside the polling window.
+RANGE_CACHE_WEEKS = 26
+RANGE_CACHE_MAX_AGE = 3600
+
+
+def week_monday(day: date) -> date:
+    """Return the Monday of the ISO week containing ``day``."""
+    return day - timedelta(days=day.weekday())
+
+
+def week_offset(monday: date, today: date) -> int:
+    """Return how many weeks ``monday`` lies after the current week."""
+    return (monday - week_monday(today)).days // 7
+
+
+def business_dates(start: date, days: int) -> list[date]:
+    """Return the first ``days`` Monday-Friday dates on or after ``start``."""
+    dates: list[date] = []
+    check_date = start
+    while len(dates) < days:
+        if check_date.weekday() < 5:
+            dates.append(check_date)
+        check_date += timedelta(days=1)
+    return dates
+
+
+def weeks_in_range(start: date, end: date) -> list[date]:
+    """Return the Mondays of every ISO week overlapping ``start``..``end``."""
+    mondays: list[date] = []
+    monday = week_monday(start)
+    while monday <= end:
+        mondays.append(monday)
+        monday += timedelta(days=7)
+    return mondays
+
+
+def week_is_covered(
+    monday: date,
+    start: date,
+    end: date,
+    covered_dates: Iterable[date],
+) -> bool:
+    """Return true when every weekday of a week inside the range is already covered."""
+    covered = set(covered_dates)
+    return all(
+        day in covered
+        for offset in range(5)
+        if start <= (day := monday + timedelta(days=offset)) <= end
+    )
+
+
+class CalendarWindow:
+    """Sliding business-day window over one child's polled calendar weeks.
+
+    Target dates are advanced incrementally as days pass, and fetched weeks
+    are kept until they fall out of the window, so a day or week rollover
+    only exposes the new week that still has to be fetched.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty window."""
+        self._start: date | None = None
+        self._days = 0
+        self._dates: list[date] = []
+        self._weeks: dict[date, tuple[datetime, list[dict[str, Any]]]] = {}
+
+    @property
+    def dates(self) -> list[date]:
+        """Return the window's business dates in order."""
+        return self._dates
+
+    def move_to(self, start: date, days: int) -> list[date]:
+        """Move the window to ``days`` business dates from ``start``.
+
+        Moving forward with the same length drops the dates that passed and
+        appends only the newly exposed business days. Weeks that no longer
+        overlap the window are forgotten.
+        """
+        if start == self._start and days == self._days:
+            return self._dates
+
+        if self._start is not None and days == self._days and start > self._start:
+            dates = [day for day in self._dates if day >= start]
+            next_day = dates[-1] + timedelta(days=1) if dates else start
+            dates.extend(business_dates(next_day, days - len(dates)))
+        else:
+            dates = business_dates(start, days)
+
+        self._start = start
+        self._days = days
+        self._dates = dates
+        current_weeks = set(self.weeks())
+        for monday in [monday for monday in self._weeks if monday not in current_weeks]:
+            del self._weeks[monday]
+        return dates
+
+    def weeks(self) -> list[date]:
+        """Return the Mondays of the weeks covering the window's dates."""
+        mondays: list[date] = []
+        for day in self._dates:
+            monday = week_monday(day)
+            if not mondays or mondays[-1] != monday:
+                mondays.append(monday)
+        return mondays
+
+    def get(self, monday: date) -> tuple[datetime, list[dict[str, Any]]] | None:
+        """Return when a window week was fetched and its events, if known."""
+        return self._weeks.get(monday)
+
+    def put(self, monday: date, fetched_at: datetime, events: list[dict[str, Any]]) -> None:
+        """Remember the events fetched for a window week."""
+        self._weeks[monday] = (fetched_at, events)
+
+    def discard(self, monday: date) -> None:
+        """Forget a window week so it is fetched again next time."""
+        self._weeks.pop(monday, None)
+
+
+@dataclass(frozen=True)
+class CalendarWeek:
+    """Normalized EasyIQ events fetched on demand for one child and ISO week."""
+
+    monday: date
+    weekplan: tuple[dict[str, Any], ...]
+    homework: tuple[dict[str, Any], ...]
+    fetched_at: float
+
+
+class CalendarWeekCache:
+    """Bounded, least-recently-used cache of on-demand calendar weeks."""
+
+    def __init__(
+        self,
+        max_weeks: int = RANGE_CACHE_WEEKS,
+        max_age: float = RANGE_CACHE_MAX_AGE,
+        *,
+        max_age_for: Callable[[date], float | None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        ``max_age_for`` overrides ``max_age`` per week; returning None keeps
+        that week until it is evicted.
+        """
+        self.max_weeks = max_weeks
+        self.max_age = max_age
+        self._max_age_for = max_age_for
+        self._clock = clock
+        self._weeks: OrderedDict[tuple[str, date], CalendarWeek] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached weeks."""
+        return len(self._weeks)
+
+    def now(self) -> float:
+        """Return the cache clock reading used for ``fetched_at``."""
+        return self._clock()
+
+    def get(self, child_id: str, monday: date) -> CalendarWeek | None:
+        """Return a cached week unless it is missing or too old."""
+        key = (str(child_id), monday)
+        week = self._weeks.get(key)
+        if week is None:
+            return None
+        max_age = self.max_age if self._max_age_for is None else self._max_age_for(monday)
+        if max_age is not None and self._clock() - week.fetched_at > max_age:
+            del self._weeks[key]
+            return None
+        self._weeks.move_to_end(key)
+        return week
+
+    def put(self, child_id: str, week: CalendarWeek) -> None:
+        """Store a week, evicting the least recently used weeks past the bound."""
+        key = (str(child_id), week.monday)
+        self._weeks[key] = week
+        self._weeks.move_to_end(key)
+        while len(self._weeks) > self.max_weeks:
+            self._weeks.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached week."""
+        self._weeks.clear()
@@ -2,41 +2,23 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
+import hashlib
 import html as html_lib
 import logging
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 from urllib.parse import urljoin
 import datetime
+import functools
+import itertools
 import json
 import re
+import threading
+import time
 
-# Import dependencies with better error handling
-aiohttp = None
-pytz = None
-requests = None
-
-# Try to import each dependency individually
-try:
+if TYPE_CHECKING:
     import aiohttp
-except ImportError:
-    aiohttp = None
-
-try:
-    import pytz
-except ImportError:
-    pytz = None
-
-# For requests, try different approaches
-try:
     import requests
-except ImportError:
-    try:
-        # Try importing without any potential conflicts
-        import sys
-        import importlib
-        requests = importlib.import_module('requests')
-    except ImportError:
-        requests = None
 
 try:
     from .mitid_auth import (
@@ -56,10 +38,74 @@ except ImportError:
         TokenRefresher,
     )
 
+try:
+    from .event_store import ChildEventStore, diff_event_stores
+except ImportError:
+    # For standalone script execution from custom_components/aula_easyiq.
+    from event_store import ChildEventStore, diff_event_stores  # type: ignore[no-redef]
+
+try:
+    from .metrics import IntegrationMetrics
+    from .recording import TrafficRecorder
+    from .timing import CycleTimings
+    from .trace_journal import TraceJournal
+except ImportError:
+    # For standalone script execution from custom_components/aula_easyiq.
+    from metrics import IntegrationMetrics  # type: ignore[no-redef]
+    from recording import TrafficRecorder  # type: ignore[no-redef]
+    from timing import CycleTimings  # type: ignore[no-redef]
+    from trace_journal import TraceJournal  # type: ignore[no-redef]
+
+try:
+    from .calendar_window import (
+        RANGE_CACHE_MAX_AGE,
+        CalendarWeek,
+        CalendarWeekCache,
+        CalendarWindow,
+        business_dates,
+        week_is_covered,
+        week_monday,
+        week_offset,
+        weeks_in_range,
+    )
+except ImportError:
+    # For standalone script execution from custom_components/aula_easyiq.
+    from calendar_window import (  # type: ignore[no-redef]
+        RANGE_CACHE_MAX_AGE,
+        CalendarWeek,
+        CalendarWeekCache,
+        CalendarWindow,
+        business_dates,
+        week_is_covered,
+        week_monday,
+        week_offset,
+        weeks_in_range,
+    )
+
+try:
+    from .message_index import MessageThreadIndex
+except ImportError:
+    # For standalone script execution from custom_components/aula_easyiq.
+    from message_index import MessageThreadIndex  # type: ignore[no-redef]
+
+try:
+    from .update_policy import calendar_week_interval, should_update_calendar_week
+except ImportError:
+    # For standalone script execution from custom_components/aula_easyiq.
+    from update_policy import (  # type: ignore[no-redef]
+        calendar_week_interval,
+        should_update_calendar_week,
+    )
+
 try:
     from .const import (
         API,
         API_VERSION,
+        DEFAULT_DIAGNOSTICS_LEVEL,
+        DIAGNOSTICS_FULL,
+        DIAGNOSTICS_LEVELS,
+        DIAGNOSTICS_OFF,
+        DIAGNOSTICS_SUMMARY,
         EASYIQ_API,
         EASYIQ_WEEKPLAN_WIDGET_ID,
         EASYIQ_HOMEWORK_WIDGET_ID,
@@ -70,6 +116,11 @@ except ImportError:
     # For standalone testing
     API = "https://www.aula.dk/api/v"
     API_VERSION = "22"
+    DIAGNOSTICS_OFF = "off"
+    DIAGNOSTICS_SUMMARY = "summary"
+    DIAGNOSTICS_FULL = "full"
+    DIAGNOSTICS_LEVELS = [DIAGNOSTICS_OFF, DIAGNOSTICS_SUMMARY, DIAGNOSTICS_FULL]
+    DEFAULT_DIAGNOSTICS_LEVEL = DIAGNOSTICS_SUMMARY
     EASYIQ_API = "https://api.easyiqcloud.dk/api/aula"
     EASYIQ_WEEKPLAN_WIDGET_ID = "0128"
     EASYIQ_HOMEWORK_WIDGET_ID = "0142"
@@ -89,6 +140,13 @@ except ImportError:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bounds for calendar diagnostics. At the full level, event previews are taken
+# from one successful week fetch in every DIAGNOSTICS_PREVIEW_EVERY per child.
+DIAGNOSTICS_PREVIEW_EVERY = 10
+DIAGNOSTICS_PREVIEW_KEYS = 30
+DIAGNOSTICS_PREVIEW_CHARS = 160
+DIAGNOSTICS_MAX_ATTEMPTS = 8
+
 
 _START_DATETIME_KEYS = (
     "start",
@@ -214,8 +272,46 @@ _DESCRIPTION_KEYS = (
     "body",
     "comment",
 )
+_EVENT_ID_KEYS = (
+    "id",
+    "eventId",
+    "calendarEventId",
+    "calendarItemId",
+    "itemId",
+    "entryId",
+    "uid",
+    "guid",
+)
 _WEEKPLAN_EVENT_TYPES = (8, 9)
 _HOMEWORK_EVENT_TYPES = (4,)
+_HTML_CACHE_SIZE = 32
+# Event fields that may name the child a calendar row belongs to, used to
+# split a combined multi-child calendar response.
+_EVENT_OWNER_KEYS = (
+    "childId",
+    "ChildId",
+    "userId",
+    "UserId",
+    "loginId",
+    "LoginId",
+    "studentId",
+    "StudentId",
+    "ownerId",
+    "OwnerId",
+    "personId",
+    "PersonId",
+)
+_MESSAGE_MAX_PAGES = 3
+# Seconds between polls that sweep all message pages to refresh read flags.
+_MESSAGE_FULL_SYNC_SECONDS = 3600
+_MESSAGE_CACHE_SIZE = 16
+# Combined calendar responses that mean EasyIQ rejects the comma-joined filter.
+_COMBINED_CALENDAR_UNSUPPORTED_STATUSES = frozenset({400, 403, 404, 405, 422})
+# Seconds to use per-child requests after a transient combined request failure.
+_COMBINED_CALENDAR_RETRY_SECONDS = 1800
+_FIXTURE_PREFIX = "aula_easyiq/"
+_FIXTURE_SNAPSHOT_PATH = "aula_easyiq/snapshot"
+_CALENDAR_EVENTS_URL = "https://skoleportal.easyiqcloud.dk/Calendar/CalendarGetWeekplanEvents"
 
 
 def _clean_text(value: Any) -> str:
@@ -479,26 +575,117 @@ def _preview_value(value: Any) -> Any:
     """Return a small JSON-friendly preview value for diagnostics."""
     if isinstance(value, dict):
         preview: dict[str, Any] = {}
-        for key, nested_value in list(value.items())[:8]:
+        for key, nested_value in itertools.islice(value.items(), 8):
             preview[str(key)] = _preview_value(nested_value)
         return preview
     if isinstance(value, list):
         return [_preview_value(item) for item in value[:3]]
     text = str(value)
-    return text[:160] if len(text) > 160 else text
+    return text[:DIAGNOSTICS_PREVIEW_CHARS]
 
 
 def _event_preview(event: dict[str, Any]) -> dict[str, Any]:
     """Return a compact event preview for diagnostics."""
     return {
         str(key): _preview_value(value)
-        for key, value in list(event.items())[:60]
+        for key, value in itertools.islice(event.items(), DIAGNOSTICS_PREVIEW_KEYS)
     }
 
 
+def _content_digest(data: bytes) -> str:
+    """Return a short, stable digest for change detection."""
+    return hashlib.blake2b(data, digest_size=10).hexdigest()
+
+
+def _json_content_hash(value: Any) -> str:
+    """Return a stable digest of a JSON-compatible value."""
+    return _content_digest(
+        json.dumps(
+            value,
+            sort_keys=True,
+            default=str,
+            separators=(",", ":"),
+        ).encode("utf-8")
+    )
+
+
+def _response_content_hash(response: Any) -> str | None:
+    """Return a digest of the raw response body when it is available."""
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)) and content:
+        return _content_digest(bytes(content))
+    return None
+
+
+def _event_content_hash(event: dict[str, Any]) -> str:
+    """Return a stable hash of the payload fields of an EasyIQ event."""
+    content_hash = event.get("_easyiq_content_hash")
+    if content_hash:
+        return str(content_hash)
+    return _json_content_hash(
+        {
+            str(key): value
+            for key, value in event.items()
+            if not str(key).startswith("_easyiq_")
+        }
+    )
+
+
+def _event_series_id(event: dict[str, Any]) -> str | None:
+    """Return ``id:<item type>:<payload id>``, shared by every occurrence of a series."""
+    payload_id = _event_value(event, _EVENT_ID_KEYS)
+    if payload_id is None or isinstance(payload_id, (dict, list)):
+        return None
+    item_type = _event_item_type(event)
+    return f"id:{'' if item_type is None else item_type}:{payload_id}"
+
+
+def _event_identity(event: dict[str, Any], content_hash: str | None = None) -> str:
+    """Return a stable identity from the payload id and times, or the event content.
+
+    Recurring lessons share one payload id, so the start and end are part of
+    the identity; otherwise merging would keep only one occurrence.
+    """
+    identity = event.get("_easyiq_event_id")
+    if identity:
+        return str(identity)
+
+    series_id = _event_series_id(event)
+    if series_id is not None:
+        start = _event_start_datetime(event)
+        end = _event_end_datetime(event)
+        return (
+            f"{series_id}@{'' if start is None else start.isoformat()}"
+            f"/{'' if end is None else end.isoformat()}"
+        )
+    return f"hash:{content_hash or _event_content_hash(event)}"
+
+
+def _merge_unique_events(
+    event_lists: Iterable[list[dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """Merge event lists in order, keeping the first copy of each identity."""
+    seen: set[str] = set()
+    merged: list[dict[str, Any]] = []
+    for events in event_lists:
+        for event in events:
+            identity = _event_identity(event)
+            if identity in seen:
+                continue
+            seen.add(identity)
+            merged.append(event)
+    return merged
+
+
 def _normalize_calendar_event(event: dict[str, Any]) -> dict[str, Any]:
     """Populate the legacy fields this integration expects from newer shapes."""
     normalized = dict(event)
+    content_hash = _event_content_hash(event)
+    normalized["_easyiq_event_id"] = _event_identity(event, content_hash)
+    series_id = _event_series_id(event)
+    if series_id is not None:
+        normalized["_easyiq_series_id"] = series_id
+    normalized["_easyiq_content_hash"] = content_hash
     start = _event_start_datetime(event)
     end = _event_end_datetime(event)
 
@@ -528,6 +715,17 @@ def _normalize_calendar_event(event: dict[str, Any]) -> dict[str, Any]:
     return normalized
 
 
+def _sample_event_summary(raw_event: dict[str, Any], event: dict[str, Any]) -> dict[str, Any]:
+    """Return the bounded sample-event fields of a full-level payload summary."""
+    return {
+        "sample_event_keys": [
+            str(key) for key in itertools.islice(raw_event.keys(), DIAGNOSTICS_PREVIEW_KEYS)
+        ],
+        "sample_event_preview": _event_preview(raw_event),
+        "normalized_sample_event_id": _event_identity(event),
+    }
+
+
 def _payload_summary(payload: Any) -> dict[str, Any]:
     """Return a small, serializable description of an API payload."""
     if isinstance(payload, list):
@@ -576,6 +774,58 @@ def _extract_calendar_event_list(
     return events
 
 
+def _fixture_snapshot_lookup(snapshot: dict[str, Any], path: str) -> tuple[bool, Any]:
+    """Return whether a fixture path is present in a snapshot, and its value."""
+    if path.startswith(_FIXTURE_PREFIX):
+        path = path[len(_FIXTURE_PREFIX):]
+    value: Any = snapshot
+    for part in path.strip("/").split("/"):
+        if not isinstance(value, dict) or part not in value:
+            return False, None
+        value = value[part]
+    return True, value
+
+
+def _split_events_by_owner(
+    events: list[dict[str, Any]],
+    owners: dict[str, str],
+) -> dict[str, list[dict[str, Any]]] | None:
+    """Split combined calendar events per child by their ownership fields.
+
+    ``owners`` maps every known identifier of each child to that child's id.
+    Returns None when any event cannot be attributed to exactly one child.
+    """
+    split: dict[str, list[dict[str, Any]]] = {child_id: [] for child_id in owners.values()}
+    for event in events:
+        owner = None
+        for key in _EVENT_OWNER_KEYS:
+            value = event.get(key)
+            if value not in (None, "") and str(value) in owners:
+                owner = owners[str(value)]
+                break
+        if owner is None:
+            return None
+        split[owner].append(event)
+    return split
+
+
+def _homework_assignment(event: dict[str, Any]) -> dict[str, Any]:
+    """Return the compact homework view of a stored calendar event."""
+    return {
+        "title": event.get("courses", ""),
+        "subject": event.get("courses", ""),
+        "description": event.get("description", ""),
+        "start_time": event.get("start", ""),
+        "activities": event.get("activities", ""),
+        "event_id": _event_identity(event),
+    }
+
+
+def _business_days_text(days: int) -> str:
+    """Return the visible view title for a business-day window."""
+    return f"Next {days} Business Day{'s' if days != 1 else ''}"
+
+
 class EasyIQAuthError(MitIDAuthError):
     """Raised when EasyIQ cannot authenticate with Aula token state."""
 
@@ -592,10 +842,31 @@ class EasyIQClient:
         on_token_update: Callable[[AulaTokenState], None] | None = None,
         fixture_base_url: str | None = None,
         session_factory: Callable[[], Any] | None = None,
+        message_index: MessageThreadIndex | None = None,
+        on_message_index_update: Callable[[MessageThreadIndex], None] | None = None,
+        api_base_url: str | None = None,
+        calendar_url: str | None = None,
+        trace_journal: TraceJournal | None = None,
+        recorder: TrafficRecorder | None = None,
+        diagnostics_level: str = DEFAULT_DIAGNOSTICS_LEVEL,
     ) -> None:
-        """Initialize the client."""
+        """Initialize the client.
+
+        ``api_base_url`` (the Aula API prefix the version number is appended
+        to) and ``calendar_url`` point the client at another backend, such
+        as the local stand-in server used for load testing. A
+        ``trace_journal`` receives one line per request and update cycle,
+        and a ``recorder`` captures sanitized request/response pairs for
+        offline replay. ``diagnostics_level`` (off, summary, or full)
+        decides how much of each calendar fetch is kept in
+        ``calendar_diagnostics``.
+        """
         self.username = mitid_username
+        self.api_base_url = api_base_url or API
+        self.calendar_url = calendar_url or _CALENDAR_EVENTS_URL
         self.fixture_base_url = fixture_base_url.rstrip("/") if fixture_base_url else None
+        self._fixture_snapshot: dict[str, Any] | None = None
+        self._fixture_snapshot_supported: bool | None = None
         self.token_state = (
             None
             if token_state is None
@@ -606,13 +877,11 @@ class EasyIQClient:
         self._token_refresher = token_refresher or AulaTokenRefresher()
         self._on_token_update = on_token_update
         self.session: aiohttp.ClientSession | None = None
+        # requests is imported with the first live request, in an executor job.
         self._session: requests.Session | None = (
-            session_factory()
-            if session_factory is not None
-            else requests.Session()
-            if requests is not None
-            else None
+            session_factory() if session_factory is not None else None
         )
+        self._session_lock = threading.Lock()
         self._authenticated = False
         
         # Authentication data
@@ -629,6 +898,14 @@ class EasyIQClient:
         self._calendar_login_id_cache = {}
         self._calendar_request_variant_cache = {}
         self._calendar_zero_warning_emitted: set[str] = set()
+        self._calendar_response_cache: dict[tuple[str, int], tuple[str, list[dict[str, Any]]]] = {}
+        self._calendar_view_keys: dict[tuple[str, str], tuple[Any, ...]] = {}
+        self._html_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self.calendar_week_cache = CalendarWeekCache(max_age_for=self._range_week_max_age)
+        self._calendar_windows: dict[str, CalendarWindow] = {}
+        self._combined_calendar_supported: bool | None = None
+        self._combined_calendar_retry_at = 0.0
+        self._calendar_week_fetches: dict[tuple[str, datetime.date], asyncio.Future] = {}
         
         # Data storage
         self.children = []
@@ -637,24 +914,65 @@ class EasyIQClient:
         self._childids = []
         self.unread_messages = 0
         self.message = {}
+        self.message_index = message_index or MessageThreadIndex()
+        self._on_message_index_update = on_message_index_update
+        self.message_key: tuple[str, str] | None = None
+        self._message_full_sync_at = 0.0
+        self._message_cache: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
         self.weekplan_data = {}
         self.homework_data = {}
+        self.event_store: dict[str, ChildEventStore] = {}
+        self.calendar_changed: dict[str, bool] = {}
+        self.calendar_changes: dict[str, dict[str, list[dict[str, Any]]]] = {}
+        self._calendar_target_dates: dict[str, list[str]] = {}
         self.presence_status = {}  # Stores presence status codes (0-8)
         self.presence_data = {}    # Stores detailed presence information
         self.update_diagnostics: dict[str, Any] = {}
         self.calendar_diagnostics: dict[str, Any] = {}
+        self.diagnostics_level = (
+            diagnostics_level if diagnostics_level in DIAGNOSTICS_LEVELS else DEFAULT_DIAGNOSTICS_LEVEL
+        )
+        self._diagnostics_previews: dict[str, int] = {}
+        self.timings = CycleTimings()
+        self.metrics = IntegrationMetrics()
+        self.trace_journal = trace_journal
+        self.recorder = recorder
+        if recorder is not None:
+            recorder.add_known_value(mitid_username)
+        self._cycle_cache_baseline: dict[Any, float] = {}
+        self.update_timings: dict[str, Any] = {}
 
     def _now_text(self) -> str:
         """Return a serializable timestamp for diagnostics."""
         return datetime.datetime.now().isoformat()
 
+    def _diagnostics_at(self, level: str) -> bool:
+        """Return whether calendar diagnostics are captured at ``level``."""
+        return DIAGNOSTICS_LEVELS.index(self.diagnostics_level) >= DIAGNOSTICS_LEVELS.index(level)
+
+    def _sample_diagnostics_preview(self, child_id: str) -> bool:
+        """Return whether this successful fetch should keep event previews."""
+        if self.diagnostics_level != DIAGNOSTICS_FULL:
+            return False
+        key = str(child_id)
+        count = self._diagnostics_previews.get(key, 0)
+        self._diagnostics_previews[key] = count + 1
+        return count % DIAGNOSTICS_PREVIEW_EVERY == 0
+
     def _record_calendar_week_diagnostic(
         self,
         child_id: str,
         weeks_ahead: int,
+        *,
+        failure: bool = False,
         **values: Any,
     ) -> None:
-        """Store diagnostic details for a single calendar week request."""
+        """Store diagnostic details for a single calendar week request.
+
+        Failures are always kept; other stages only from the summary level.
+        """
+        if not failure and self.diagnostics_level == DIAGNOSTICS_OFF:
+            return
         child_diag = self.calendar_diagnostics.setdefault(str(child_id), {})
         week_offsets = child_diag.setdefault("week_offsets", {})
         week_diag = week_offsets.setdefault(str(weeks_ahead), {})
@@ -683,7 +1001,7 @@ class EasyIQClient:
         _LOGGER.warning(
             "EasyIQ calendar returned no business-day events for child %s "
             "(raw=%d, business_days=%d, item_types=%s). Diagnostics are "
-            "available on the EasyIQ Status and Weekplan sensor attributes.",
+            "in the EasyIQ entry's diagnostics download.",
             child_id,
             raw_event_count,
             business_day_event_count,
@@ -692,15 +1010,20 @@ class EasyIQClient:
 
     def _ensure_sync_session(self) -> Any:
         """Return an initialized synchronous requests-like session."""
-        if self._session is None:
-            if requests is None:
-                raise EasyIQAuthError("requests is not available")
-            self._session = requests.Session()
-        return self._session
+        with self._session_lock:
+            if self._session is None:
+                try:
+                    import requests
+                except ImportError as err:
+                    raise EasyIQAuthError("requests is not available") from err
+                self._session = requests.Session()
+            return self._session
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         """Ensure we have an active aiohttp session."""
         if self.session is None or self.session.closed:
+            import aiohttp
+
             # Create session with cookie jar to maintain authentication
             connector = aiohttp.TCPConnector(ssl=True)
             timeout = aiohttp.ClientTimeout(total=30)
@@ -723,7 +1046,45 @@ class EasyIQClient:
         return urljoin(f"{self.fixture_base_url}/", path.lstrip("/"))
 
     async def _fixture_json(self, path: str, default: Any) -> Any:
-        """Load JSON from the configured fixture server."""
+        """Load fixture JSON from this cycle's snapshot, or from its own endpoint."""
+        snapshot = await self._load_fixture_snapshot()
+        if snapshot is not None:
+            found, value = _fixture_snapshot_lookup(snapshot, path)
+            if found:
+                return value
+        return await self._fixture_request(path, default)
+
+    async def _load_fixture_snapshot(self) -> dict[str, Any] | None:
+        """Return the bulk fixture document for the current update cycle.
+
+        The snapshot is requested once per cycle and mirrors the per-path
+        endpoints, for example ``{"profile": {...}, "calendar": {"<child>":
+        [...]}, "presence": {"<child>": {...}}, "messages": {...}}``. Servers
+        without ``aula_easyiq/snapshot`` are remembered and not asked again.
+        Any other failure only skips the snapshot for the current cycle.
+        """
+        if self._fixture_snapshot_supported is False:
+            return None
+        if self._fixture_snapshot is None:
+            try:
+                snapshot = await self._fixture_request(_FIXTURE_SNAPSHOT_PATH, None)
+            except Exception as err:
+                _LOGGER.warning(
+                    "Fixture snapshot request failed (%s); using per-path endpoints this cycle", err
+                )
+                # An empty snapshot sends every lookup to its own endpoint until the next cycle.
+                self._fixture_snapshot = {}
+                return self._fixture_snapshot
+            if not isinstance(snapshot, dict):
+                _LOGGER.debug("Fixture server has no snapshot document; using per-path endpoints")
+                self._fixture_snapshot_supported = False
+                return None
+            self._fixture_snapshot = snapshot
+            self._fixture_snapshot_supported = True
+        return self._fixture_snapshot
+
+    async def _fixture_request(self, path: str, default: Any) -> Any:
+        """Request one JSON document from the configured fixture server."""
         session = await self._ensure_session()
         url = self._fixture_url(path)
         async with session.get(url) as response:
@@ -734,7 +1095,12 @@ class EasyIQClient:
             return await response.json()
 
     async def _authenticate_fixture(self) -> bool:
-        """Load fixture profile data and mark the client authenticated."""
+        """Load fixture profile data and mark the client authenticated.
+
+        This starts each fixture update cycle, so the bulk snapshot is dropped
+        here and reloaded on first use.
+        """
+        self._fixture_snapshot = None
         profile = await self._fixture_json("aula_easyiq/profile", {})
         children = profile.get("children", []) if isinstance(profile, dict) else []
         institution_profiles = profile.get("institution_profiles", []) if isinstance(profile, dict) else []
@@ -783,15 +1149,22 @@ class EasyIQClient:
 
         try:
             _LOGGER.debug("Refreshing Aula access token")
-            self.token_state = self._token_refresher.refresh(self.token_state)
+            with self.timings.span("token_refresh"):
+                started = time.perf_counter()
+                self.token_state = self._token_refresher.refresh(self.token_state)
+                self.timings.record_request(time.perf_counter() - started)
+            self.metrics.inc("token_refreshes_total", {"result": "success"})
             self.tokens.clear()
             if self._on_token_update is not None:
                 self._on_token_update(self.token_state)
         except MitIDAuthRejected:
+            self.metrics.inc("token_refreshes_total", {"result": "rejected"})
             raise
         except MitIDAuthError:
+            self.metrics.inc("token_refreshes_total", {"result": "error"})
             raise
         except Exception as err:
+            self.metrics.inc("token_refreshes_total", {"result": "error"})
             raise EasyIQAuthError(f"Aula token refresh failed: {err}") from err
 
     def _aula_get(
@@ -806,12 +1179,65 @@ class EasyIQClient:
         request_params = dict(params or {})
         request_params["method"] = method
         request_params["access_token"] = self.token_state.access_token
-        return self._ensure_sync_session().get(
+        return self._session_get(
             apiurl or self.apiurl,
             params=request_params,
             verify=True,
         )
 
+    def _session_get(self, url: str, **kwargs: Any) -> Any:
+        """GET through the sync session, counting the request in spans and metrics."""
+        params = kwargs.get("params") or {}
+        endpoint = params.get("method") or url.rstrip("/").rsplit("/", 1)[-1]
+        started = time.perf_counter()
+        try:
+            response = self._ensure_sync_session().get(url, **kwargs)
+        except Exception as err:
+            self.metrics.inc("requests_total", {"endpoint": endpoint, "status": "error"})
+            if self.trace_journal is not None:
+                self.trace_journal.record(
+                    "request",
+                    phase=self.timings.current_phase(),
+                    endpoint=endpoint,
+                    status="error",
+                    error=type(err).__name__,
+                    ms=round((time.perf_counter() - started) * 1000, 1),
+                )
+            raise
+        elapsed = time.perf_counter() - started
+        try:
+            size = len(response.content)
+        except (AttributeError, TypeError):
+            size = 0
+        self.timings.record_request(elapsed, size)
+        self.metrics.inc("requests_total", {"endpoint": endpoint, "status": response.status_code})
+        self.metrics.inc("response_bytes_total", {"endpoint": endpoint}, size)
+        self.metrics.observe("request_duration_seconds", elapsed, {"endpoint": endpoint})
+        if self.recorder is not None:
+            self.recorder.record(
+                "GET", url, kwargs.get("params"), kwargs.get("headers"), response, elapsed
+            )
+        if self.trace_journal is not None:
+            self.trace_journal.record(
+                "request",
+                phase=self.timings.current_phase(),
+                endpoint=endpoint,
+                status=response.status_code,
+                ms=round(elapsed * 1000, 1),
+                bytes=size,
+            )
+        return response
+
+    def _timed_job(self, phase: str, func: Callable[[], Any], **attributes: Any) -> Callable[[], Any]:
+        """Wrap executor work in a timing span and record how long it waited for a thread."""
+        submitted = time.perf_counter()
+
+        def run() -> Any:
+            self.metrics.observe("executor_wait_seconds", time.perf_counter() - submitted)
+            return self.timings.call(phase, func, **attributes)
+
+        return run
+
     def _authenticate_sync(self) -> bool:
         """Authenticate using stored MitID/Aula token state."""
         self._ensure_valid_token()
@@ -820,12 +1246,12 @@ class EasyIQClient:
             return True
 
         try:
-            self.apiurl = API + API_VERSION
+            self.apiurl = self.api_base_url + API_VERSION
             self.api_url = self.apiurl
             apiver = int(API_VERSION)
             api_success = False
             while not api_success:
-                self.apiurl = API + str(apiver)
+                self.apiurl = self.api_base_url + str(apiver)
                 self.api_url = self.apiurl
                 _LOGGER.debug("Trying Aula API at %s", self.apiurl)
                 ver = self._aula_get(
@@ -969,23 +1395,26 @@ class EasyIQClient:
         # Check if we have a cached token
         if widget_id in self.tokens:
             token, timestamp = self.tokens[widget_id]
-            current_time = datetime.datetime.now(pytz.utc) if pytz else datetime.datetime.now()
+            current_time = datetime.datetime.now(datetime.timezone.utc)
             if (current_time - timestamp).total_seconds() < 60:  # 1 minute cache
                 _LOGGER.debug(f"Reusing existing token for widget {widget_id}")
+                self.metrics.cache_lookup("widget_token", True)
                 return token
+        self.metrics.cache_lookup("widget_token", False)
         
         _LOGGER.debug(f"Requesting new token for widget {widget_id}")
         try:
-            response = self._aula_get(
-                "aulaToken.getAulaToken",
-                params={"widgetId": widget_id},
-            )
+            with self.timings.span("widget_token", widget=widget_id):
+                response = self._aula_get(
+                    "aulaToken.getAulaToken",
+                    params={"widgetId": widget_id},
+                )
             if response.status_code == 200:
                 response_json = response.json()
                 bearer_token = response_json["data"]
                 
                 token = "Bearer " + str(bearer_token)
-                timestamp = datetime.datetime.now(pytz.utc) if pytz else datetime.datetime.now()
+                timestamp = datetime.datetime.now(datetime.timezone.utc)
                 self.tokens[widget_id] = (token, timestamp)
                 return token
             else:
@@ -997,7 +1426,13 @@ class EasyIQClient:
             _LOGGER.error(f"Failed to get token for widget {widget_id}: {err}")
             return ""
 
-    async def _get_calendar_events(self, child_id: str, weeks_ahead: int = 0) -> list[dict[str, Any]]:
+    async def _get_calendar_events(
+        self,
+        child_id: str,
+        weeks_ahead: int = 0,
+        *,
+        on_demand: bool = False,
+    ) -> list[dict[str, Any]]:
         """Get calendar events using the working CalendarGetWeekplanEvents endpoint.
         
         This is the BREAKTHROUGH method that uses the exact Chrome DevTools approach.
@@ -1005,93 +1440,135 @@ class EasyIQClient:
         Args:
             child_id: The child's user ID
             weeks_ahead: Number of weeks ahead to fetch (0 = current week, 1 = next week, etc.)
+            on_demand: The week was browsed outside the polled window. Its
+                payload hash and week diagnostics are not kept, so browsing
+                far weeks grows neither the response cache nor
+                ``calendar_diagnostics``.
         """
         try:
             if self.fixture_mode:
                 events = await self._fixture_json(f"aula_easyiq/calendar/{child_id}", [])
-                return events if isinstance(events, list) else []
+                return _extract_calendar_event_list(events) if isinstance(events, list) else []
 
             # Run the synchronous calendar request in an executor to avoid blocking
             loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self._sync_get_calendar_events, child_id, weeks_ahead)
+            return await loop.run_in_executor(
+                None,
+                self._timed_job(
+                    "calendar_week",
+                    functools.partial(
+                        self._sync_get_calendar_events,
+                        child_id,
+                        weeks_ahead,
+                        on_demand=on_demand,
+                    ),
+                    child=str(child_id),
+                    week=weeks_ahead,
+                ),
+            )
         except MitIDAuthError:
             raise
         except Exception as err:
             _LOGGER.error("Failed to get calendar events: %s", err)
             return []
 
-    async def get_calendar_events_for_business_days(self, child_id: str, days: int = 5, weeks_ahead: int = 0) -> list[dict[str, Any]]:
+    async def get_calendar_events_for_business_days(
+        self,
+        child_id: str,
+        days: int = 5,
+        weeks_ahead: int = 0,
+        *,
+        refresh_interval: int | None = None,
+    ) -> list[dict[str, Any]]:
         """Get calendar events for the next N business days (Monday-Friday).
         
         Args:
             child_id: The child's user ID
             days: Number of business days to fetch (default: 5)
             weeks_ahead: Number of weeks ahead to start from (0=current week, 1=next week, etc.)
+            refresh_interval: Base calendar interval in seconds. When set, each
+                week is only refetched once its distance-based interval has
+                elapsed (see ``update_policy.calendar_week_interval``); other
+                weeks reuse their last fetched events.
         """
         try:
             if self.fixture_mode:
-                return await self._get_calendar_events(child_id, weeks_ahead)
+                return _merge_unique_events(
+                    [await self._get_calendar_events(child_id, weeks_ahead)]
+                )
 
-            all_events = []
             current_date = datetime.datetime.now()
+            today = current_date.date()
+            window = self._calendar_window(child_id, days, weeks_ahead, today)
+            window_dates = window.dates
+            target_dates = [day.isoformat() for day in window_dates]
+
+            # Only the weeks covering the target dates are needed; weeks kept
+            # in the window are refetched once their distance-based interval
+            # has elapsed.
+            week_events = []
+            refreshed_weeks = []
+            for monday in window.weeks():
+                polled = window.get(monday)
+                if polled is None or self._calendar_week_due(
+                    window,
+                    monday,
+                    refresh_interval,
+                    current_date,
+                ):
+                    events = await self._get_calendar_events(child_id, week_offset(monday, today))
+                    refreshed_weeks.append(monday.isoformat())
+                    if events:
+                        window.put(monday, current_date, events)
+                    else:
+                        # Empty weeks may be a failed fetch, so they are retried next cycle.
+                        window.discard(monday)
+                else:
+                    events = polled[1]
+                week_events.append(events)
+
+            # EasyIQ weeks can overlap around multi-day events and date
+            # boundaries, so keep only the first copy of each event identity.
+            fetched_event_count = sum(len(events) for events in week_events)
+            all_events = _merge_unique_events(week_events)
             
-            # Calculate how many weeks we need to fetch to cover the business days
-            # Start from the specified weeks_ahead and fetch additional weeks if needed
-            for week_offset in range(weeks_ahead, weeks_ahead + 3):  # Fetch 3 weeks starting from weeks_ahead
-                events = await self._get_calendar_events(child_id, week_offset)
-                all_events.extend(events)
-            
-            # Filter events to only include the next N business days
-            business_day_events = []
-            business_days_found = 0
-            target_dates = []
-            
-            # Start from the beginning of the target week
-            if weeks_ahead == 0:
-                check_date = current_date.date()
-            else:
-                # Calculate the start date for the target week
-                days_to_add = weeks_ahead * 7
-                # Find the Monday of the target week
-                target_date = current_date + datetime.timedelta(days=days_to_add)
-                # Get to Monday of that week
-                days_since_monday = target_date.weekday()
-                monday_of_week = target_date - datetime.timedelta(days=days_since_monday)
-                check_date = monday_of_week.date()
-            
-            while business_days_found < days:
-                # Skip weekends (Saturday=5, Sunday=6)
-                if check_date.weekday() < 5:  # Monday=0 to Friday=4
-                    target_dates.append(check_date.isoformat())
-                    # Find events for this business day
-                    day_events = [
-                        event for event in all_events 
-                        if _event_start_date(event) == check_date
-                    ]
-                    business_day_events.extend(day_events)
-                    business_days_found += 1
-                
-                # Move to next day
-                check_date += datetime.timedelta(days=1)
+            # Filter events to only include the target business days, in date order
+            events_by_date: dict[datetime.date, list[dict[str, Any]]] = {
+                day: [] for day in window_dates
+            }
+            for event in all_events:
+                day_events = events_by_date.get(_event_start_date(event))
+                if day_events is not None:
+                    day_events.append(event)
+            business_day_events = [
+                event for day_events in events_by_date.values() for event in day_events
+            ]
             
-            raw_type_counts = _event_type_counts(all_events)
-            business_day_type_counts = _event_type_counts(business_day_events)
+            self._calendar_target_dates[str(child_id)] = target_dates
+            type_counts: dict[str, dict[str, int]] = {}
+            if self.diagnostics_level != DIAGNOSTICS_OFF:
+                type_counts = {
+                    "raw_event_type_counts": _event_type_counts(all_events),
+                    "business_day_event_type_counts": _event_type_counts(business_day_events),
+                }
             self._record_calendar_summary(
                 child_id,
                 requested_business_days=days,
                 requested_weeks_ahead=weeks_ahead,
+                refreshed_weeks=refreshed_weeks,
                 target_dates=target_dates,
                 raw_event_count=len(all_events),
+                duplicate_event_count=fetched_event_count - len(all_events),
                 business_day_event_count=len(business_day_events),
-                raw_event_type_counts=raw_type_counts,
-                business_day_event_type_counts=business_day_type_counts,
+                **type_counts,
             )
             if not business_day_events:
                 self._warn_zero_calendar_once(
                     child_id,
                     raw_event_count=len(all_events),
                     business_day_event_count=len(business_day_events),
-                    event_type_counts=raw_type_counts,
+                    event_type_counts=type_counts.get("raw_event_type_counts")
+                    or _event_type_counts(all_events),
                 )
 
             week_desc = "current week" if weeks_ahead == 0 else f"{weeks_ahead} week{'s' if weeks_ahead > 1 else ''} ahead"
@@ -1109,17 +1586,352 @@ class EasyIQClient:
             _LOGGER.error("Failed to get business day events: %s", err)
             return []
 
-    def _sync_get_calendar_events(self, child_id: str, weeks_ahead: int = 0) -> list[dict[str, Any]]:
+    def _calendar_window(
+        self,
+        child_id: str,
+        days: int,
+        weeks_ahead: int,
+        today: datetime.date,
+    ) -> CalendarWindow:
+        """Return a child's sliding calendar window moved to today's target dates."""
+        if weeks_ahead == 0:
+            window_start = today
+        else:
+            # Start from the Monday of the target week
+            window_start = week_monday(today + datetime.timedelta(weeks=weeks_ahead))
+        window = self._calendar_windows.setdefault(str(child_id), CalendarWindow())
+        window.move_to(window_start, days)
+        return window
+
+    @staticmethod
+    def _calendar_week_due(
+        window: CalendarWindow,
+        monday: datetime.date,
+        refresh_interval: int | None,
+        now: datetime.datetime,
+    ) -> bool:
+        """Return whether a window week needs fetching under the distance-based policy."""
+        polled = window.get(monday)
+        if polled is None:
+            return True
+        nearest_monday = week_monday(window.dates[0]) if window.dates else monday
+        return should_update_calendar_week(
+            (monday - nearest_monday).days // 7,
+            refresh_interval,
+            polled[0],
+            now,
+        )
+
+    async def _prefetch_combined_calendar_weeks(
+        self,
+        child_ids: list[str],
+        days: int,
+        refresh_interval: int | None,
+    ) -> None:
+        """Fetch due window weeks for all children with one request per week.
+
+        Each child's share of a combined response is stored in that child's
+        calendar window, so the per-child business-day fetch that follows
+        finds those weeks fresh and skips them. Weeks the combined request
+        cannot serve are left for the per-child fallback.
+        """
+        if (
+            self.fixture_mode
+            or len(child_ids) < 2
+            or refresh_interval is None
+            or self._combined_calendar_supported is False
+            or time.monotonic() < self._combined_calendar_retry_at
+        ):
+            return
+
+        now = datetime.datetime.now()
+        today = now.date()
+        windows = {
+            child_id: self._calendar_window(child_id, days, 0, today)
+            for child_id in child_ids
+        }
+        combined_weeks: list[str] = []
+        loop = asyncio.get_event_loop()
+        for monday in windows[child_ids[0]].weeks():
+            if not any(
+                self._calendar_week_due(window, monday, refresh_interval, now)
+                for window in windows.values()
+            ):
+                continue
+            split = await loop.run_in_executor(
+                None,
+                self._timed_job(
+                    "calendar_combined",
+                    functools.partial(
+                        self._sync_get_combined_calendar_events,
+                        child_ids,
+                        week_offset(monday, today),
+                    ),
+                    week=week_offset(monday, today),
+                ),
+            )
+            if split is None:
+                if (
+                    self._combined_calendar_supported is False
+                    or time.monotonic() < self._combined_calendar_retry_at
+                ):
+                    break
+                continue
+            for child_id, events in split.items():
+                windows[child_id].put(monday, now, events)
+            combined_weeks.append(monday.isoformat())
+
+        self.update_diagnostics["combined_calendar_fetch"] = {
+            "supported": self._combined_calendar_supported,
+            "weeks": combined_weeks,
+            "retry_in": max(0, round(self._combined_calendar_retry_at - time.monotonic())),
+        }
+
+    def _sync_get_combined_calendar_events(
+        self,
+        child_ids: list[str],
+        weeks_ahead: int,
+    ) -> dict[str, list[dict[str, Any]]] | None:
+        """Fetch one week for several children with a combined x-childfilter.
+
+        Reuses each child's last working request variant, so every child must
+        have been fetched individually once. Returns None when the combined
+        result cannot be used for this week. A rejected request, a payload
+        that is not JSON, or events that cannot be attributed to a child mark
+        the mode unsupported for this account; timeouts, connection errors,
+        and other statuses only pause it for ``_COMBINED_CALENDAR_RETRY_SECONDS``.
+        """
+        variants = [self._calendar_request_variant_cache.get(str(child_id)) for child_id in child_ids]
+        if not all(variants):
+            return None
+        token = self.get_token(EASYIQ_WEEKPLAN_WIDGET_ID)
+        if not token:
+            return None
+
+        owners: dict[str, str] = {}
+        for child_id, variant in zip(child_ids, variants):
+            child_data = self._children_data.get(child_id) or {}
+            for identifier in (
+                child_id,
+                child_data.get("id"),
+                child_data.get("userId"),
+                variant["x_child"],
+                variant["x_childfilter"],
+            ):
+                if identifier not in (None, ""):
+                    owners.setdefault(str(identifier), str(child_id))
+
+        template = variants[0]
+        target_date = datetime.datetime.now() + datetime.timedelta(weeks=weeks_ahead)
+        params = {
+            "loginId": template["login_id"],
+            "date": target_date.isoformat() + "Z",
+            "activityFilter": "-1",
+            "courseFilter": "-1",
+            "textFilter": "",
+            "ownWeekPlan": "false",
+        }
+        headers = {
+            **self._calendar_base_headers(token),
+            "x-child": template["x_child"],
+            "x-childfilter": ",".join(variant["x_childfilter"] for variant in variants),
+            "x-login": template["x_login"],
+        }
+        try:
+            response = self._session_get(
+                self.calendar_url, params=params, headers=headers, verify=True
+            )
+        except MitIDAuthError:
+            raise
+        except Exception as err:
+            return self._pause_combined_calendar(err)
+        if response.status_code in _COMBINED_CALENDAR_UNSUPPORTED_STATUSES:
+            _LOGGER.info(
+                "Combined calendar request rejected with status %s, using per-child requests",
+                response.status_code,
+            )
+            self._combined_calendar_supported = False
+            return None
+        if response.status_code != 200:
+            return self._pause_combined_calendar(f"status {response.status_code}")
+        try:
+            events = _extract_calendar_event_list(response.json())
+        except ValueError as err:
+            _LOGGER.info("Combined calendar response is not usable, using per-child requests: %s", err)
+            self._combined_calendar_supported = False
+            return None
+
+        if not events:
+            # Nothing to attribute, so this week says nothing about support.
+            return None
+        split = _split_events_by_owner(events, owners)
+        if split is None:
+            _LOGGER.info(
+                "Combined calendar events have no recognizable child owner, "
+                "using per-child requests"
+            )
+            self._combined_calendar_supported = False
+            return None
+        if not all(split.values()):
+            # A child without events may mean EasyIQ ignored part of the
+            # filter, so let the per-child requests confirm this week.
+            return None
+
+        self._combined_calendar_supported = True
+        _LOGGER.debug(
+            "Combined calendar request for week offset %s served %d children",
+            weeks_ahead,
+            len(split),
+        )
+        return split
+
+    def _pause_combined_calendar(self, reason: Any) -> None:
+        """Use per-child requests for a while after a transient combined failure."""
+        _LOGGER.info(
+            "Combined calendar request failed (%s), using per-child requests for %d s",
+            reason,
+            _COMBINED_CALENDAR_RETRY_SECONDS,
+        )
+        self._combined_calendar_retry_at = time.monotonic() + _COMBINED_CALENDAR_RETRY_SECONDS
+
+    async def get_calendar_weeks(
+        self,
+        child_id: str,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        *,
+        skip_dates: Iterable[datetime.date] = (),
+    ) -> list[CalendarWeek]:
+        """Return on-demand calendar weeks overlapping a date range.
+
+        Weeks whose weekdays in the range are all in ``skip_dates`` (the days
+        the polling window already covers) are not fetched. Missing weeks are
+        fetched concurrently, cached in ``calendar_week_cache``, and shared
+        with concurrent callers asking for the same week.
+        """
+        if self.fixture_mode:
+            # Fixture views are not date-filtered, so they already hold every event.
+            return []
+
+        skip = set(skip_dates)
+        mondays = [
+            monday
+            for monday in weeks_in_range(start_date, end_date)
+            if not week_is_covered(monday, start_date, end_date, skip)
+        ]
+        if not mondays:
+            return []
+        return list(
+            await asyncio.gather(
+                *(self._get_calendar_week(str(child_id), monday) for monday in mondays)
+            )
+        )
+
+    def _range_week_max_age(self, monday: datetime.date) -> int | None:
+        """Return how long an on-demand week stays cached, by distance from today."""
+        return calendar_week_interval(
+            RANGE_CACHE_MAX_AGE,
+            week_offset(monday, datetime.datetime.now().date()),
+        )
+
+    async def _get_calendar_week(self, child_id: str, monday: datetime.date) -> CalendarWeek:
+        """Return one cached calendar week, fetching it at most once at a time."""
+        week = self.calendar_week_cache.get(child_id, monday)
+        self.metrics.cache_lookup("calendar_week", week is not None)
+        if week is not None:
+            return week
+
+        key = (child_id, monday)
+        pending = self._calendar_week_fetches.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_calendar_week(child_id, monday))
+            self._calendar_week_fetches[key] = pending
+            pending.add_done_callback(
+                lambda _future, key=key: self._calendar_week_fetches.pop(key, None)
+            )
+        # Shield the shared fetch so one cancelled frontend request does not
+        # cancel it for other entities waiting on the same week.
+        return await asyncio.shield(pending)
+
+    async def _fetch_calendar_week(self, child_id: str, monday: datetime.date) -> CalendarWeek:
+        """Fetch and cache the events that start inside one ISO week."""
+        offset = week_offset(monday, datetime.datetime.now().date())
+        events = await self._get_calendar_events(child_id, offset, on_demand=True)
+        sunday = monday + datetime.timedelta(days=6)
+        week_events = [
+            event
+            for event in events
+            if (event_date := _event_start_date(event)) is not None
+            and monday <= event_date <= sunday
+        ]
+        week = CalendarWeek(
+            monday=monday,
+            weekplan=tuple(_events_of_types(week_events, _WEEKPLAN_EVENT_TYPES)),
+            homework=tuple(
+                _homework_assignment(event)
+                for event in _events_of_types(week_events, _HOMEWORK_EVENT_TYPES)
+            ),
+            fetched_at=self.calendar_week_cache.now(),
+        )
+        self.calendar_week_cache.put(child_id, week)
+        _LOGGER.debug(
+            "Fetched on-demand calendar week %s for child %s (offset %d): %d events",
+            monday.isoformat(),
+            child_id,
+            offset,
+            len(week_events),
+        )
+        return week
+
+    def _calendar_base_headers(self, token: str) -> dict[str, str]:
+        """Return the CalendarGetWeekplanEvents headers shared by every request variant."""
+        # Headers exactly like Chrome DevTools
+        return {
+            "accept": "*/*",
+            "accept-encoding": "gzip, deflate, br, zstd",
+            "accept-language": "en-US,en;q=0.9,da;q=0.8",
+            "authorization": token,
+            "cache-control": "no-cache",
+            "pragma": "no-cache",
+            "priority": "u=1, i",
+            "referer": "https://skoleportal.easyiqcloud.dk/UgeplanWidget",  # KEY: Called FROM widget
+            "sec-ch-ua": '"Chromium";v="140", "Not=A?Brand";v="24", "Microsoft Edge";v="140"',
+            "sec-ch-ua-mobile": "?0",
+            "sec-ch-ua-platform": '"Windows"',
+            "sec-fetch-dest": "empty",
+            "sec-fetch-mode": "cors",
+            "sec-fetch-site": "same-origin",
+            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36 Edge/140.0.0.0",
+            "x-requested-with": "XMLHttpRequest",
+            "x-institutionfilter": ",".join(self._institution_profiles) if self._institution_profiles else "",  # Dynamic institution filter
+            "x-login": self.username,
+            "x-userprofile": "guardian",
+        }
+
+    def _sync_get_calendar_events(
+        self,
+        child_id: str,
+        weeks_ahead: int = 0,
+        *,
+        on_demand: bool = False,
+    ) -> list[dict[str, Any]]:
         """Synchronous version of calendar events retrieval.
         
         Args:
             child_id: The child's user ID
             weeks_ahead: Number of weeks ahead to fetch (0 = current week, 1 = next week, etc.)
+            on_demand: Keep neither the payload hash nor week diagnostics.
         """
+        # Browsed weeks would add week_offsets entries without bound.
+        record_week = (
+            (lambda *_args, **_values: None)
+            if on_demand
+            else self._record_calendar_week_diagnostic
+        )
         try:
             # Get authentication token for EasyIQ widget
             token = self.get_token(EASYIQ_WEEKPLAN_WIDGET_ID)
-            self._record_calendar_week_diagnostic(
+            record_week(
                 child_id,
                 weeks_ahead,
                 stage="widget_token",
@@ -1127,16 +1939,17 @@ class EasyIQClient:
             )
             if not token:
                 _LOGGER.error("Failed to get token for EasyIQ widget")
-                self._record_calendar_week_diagnostic(
+                record_week(
                     child_id,
                     weeks_ahead,
+                    failure=True,
                     stage="widget_token_failed",
                     token_available=False,
                 )
                 return []
             
             # Prepare the request exactly like Chrome DevTools
-            url = "https://skoleportal.easyiqcloud.dk/Calendar/CalendarGetWeekplanEvents"
+            url = self.calendar_url
             
             # Parameters - use actual child data instead of hardcoded values
             # Get the child's actual ID for the loginId parameter
@@ -1145,9 +1958,10 @@ class EasyIQClient:
                 _LOGGER.error(f"Child data not found for ID: {child_id}")
                 _LOGGER.debug(f"Available child data keys: {list(self._children_data.keys())}")
                 _LOGGER.debug(f"Children data: {self._children_data}")
-                self._record_calendar_week_diagnostic(
+                record_week(
                     child_id,
                     weeks_ahead,
+                    failure=True,
                     stage="child_data_missing",
                     available_child_ids=list(self._children_data.keys()),
                 )
@@ -1255,34 +2069,13 @@ class EasyIQClient:
             # Calculate the target date based on weeks_ahead
             target_date = datetime.datetime.now() + datetime.timedelta(weeks=weeks_ahead)
             
-            # Headers exactly like Chrome DevTools
-            base_headers = {
-                "accept": "*/*",
-                "accept-encoding": "gzip, deflate, br, zstd",
-                "accept-language": "en-US,en;q=0.9,da;q=0.8",
-                "authorization": token,
-                "cache-control": "no-cache",
-                "pragma": "no-cache",
-                "priority": "u=1, i",
-                "referer": "https://skoleportal.easyiqcloud.dk/UgeplanWidget",  # KEY: Called FROM widget
-                "sec-ch-ua": '"Chromium";v="140", "Not=A?Brand";v="24", "Microsoft Edge";v="140"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-origin",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36 Edge/140.0.0.0",
-                "x-requested-with": "XMLHttpRequest",
-                "x-institutionfilter": ",".join(self._institution_profiles) if self._institution_profiles else "",  # Dynamic institution filter
-                "x-login": self.username,
-                "x-userprofile": "guardian",
-            }
+            base_headers = self._calendar_base_headers(token)
 
             last_response = None
             last_params = None
             failed_attempts = []
             attempt_summaries = []
-            self._record_calendar_week_diagnostic(
+            record_week(
                 child_id,
                 weeks_ahead,
                 stage="requesting",
@@ -1319,8 +2112,14 @@ class EasyIQClient:
                 )
 
                 # Make the request using the authenticated session
-                response = self._ensure_sync_session().get(
-                    url, params=params, headers=headers, verify=True
+                with self.timings.span("calendar_variant", variant=variant["name"]) as attempt:
+                    response = self._session_get(
+                        url, params=params, headers=headers, verify=True
+                    )
+                    attempt["status_code"] = response.status_code
+                self.metrics.inc(
+                    "calendar_variant_probes_total",
+                    {"variant": variant["name"], "status": response.status_code},
                 )
                 last_response = response
                 last_params = params
@@ -1329,14 +2128,15 @@ class EasyIQClient:
                     failed_attempts.append(
                         f"{variant['name']}={response.status_code}"
                     )
-                    attempt_summaries.append(
-                        {
-                            "variant": variant["name"],
-                            "status_code": response.status_code,
-                            "content_type": response.headers.get("content-type", ""),
-                            "events": None,
-                        }
-                    )
+                    if self.diagnostics_level != DIAGNOSTICS_OFF:
+                        attempt_summaries.append(
+                            {
+                                "variant": variant["name"],
+                                "status_code": response.status_code,
+                                "content_type": response.headers.get("content-type", ""),
+                                "events": None,
+                            }
+                        )
                     _LOGGER.debug(
                         "Calendar events variant %s returned status %s",
                         variant["name"],
@@ -1346,36 +2146,64 @@ class EasyIQClient:
 
                 try:
                     # Debug: Log response info
-                    _LOGGER.debug(f"Response status: {response.status_code}")
-                    _LOGGER.debug(f"Content encoding: {response.headers.get('content-encoding', 'none')}")
-                    _LOGGER.debug(f"Content type: {response.headers.get('content-type', 'none')}")
+                    _LOGGER.debug(
+                        "Response status: %s, content encoding: %s, content type: %s",
+                        response.status_code,
+                        response.headers.get("content-encoding", "none"),
+                        response.headers.get("content-type", "none"),
+                    )
 
                     # Let requests handle decompression automatically (including Brotli)
                     # This is more reliable than manual decompression
                     json_error_text = None
                     payload_summary: dict[str, Any] = {}
+                    full_diagnostics = self.diagnostics_level == DIAGNOSTICS_FULL
                     manual_brotli_error = None
+                    cache_key = (str(child_id), weeks_ahead)
+                    cached_response = (
+                        self._calendar_response_cache.get(cache_key)
+                        if not on_demand
+                        else None
+                    )
+                    response_hash = _response_content_hash(response)
+                    payload_unchanged = False
                     try:
-                        payload = response.json()
-                        payload_summary = _payload_summary(payload)
-                        raw_events = _extract_calendar_event_list(
-                            payload,
-                            normalize=False,
-                        )
-                        events = [
-                            _normalize_calendar_event(event)
-                            for event in raw_events
-                        ]
-                        if raw_events:
-                            payload_summary["sample_event_keys"] = [
-                                str(key) for key in list(raw_events[0].keys())[:30]
-                            ]
-                            payload_summary["sample_event_preview"] = _event_preview(
-                                raw_events[0]
-                            )
-                            payload_summary["normalized_sample_event_preview"] = (
-                                _event_preview(events[0])
-                            )
+                        if (
+                            response_hash is None
+                            or cached_response is None
+                            or cached_response[0] != response_hash
+                        ):
+                            payload = response.json()
+                            if response_hash is None:
+                                response_hash = _json_content_hash(payload)
+                        if cached_response is not None and cached_response[0] == response_hash:
+                            # Same payload as the previous poll of this week:
+                            # reuse the normalized events instead of rebuilding them.
+                            events = cached_response[1]
+                            payload_unchanged = True
+                            payload_summary = {"unchanged": True}
+                        else:
+                            with self.timings.span("normalize") as normalize_span:
+                                raw_events = _extract_calendar_event_list(
+                                    payload,
+                                    normalize=False,
+                                )
+                                events = [
+                                    _normalize_calendar_event(event)
+                                    for event in raw_events
+                                ]
+                                normalize_span["events"] = len(events)
+                            if full_diagnostics:
+                                payload_summary = _payload_summary(payload)
+                                if raw_events and self._sample_diagnostics_preview(child_id):
+                                    payload_summary.update(
+                                        _sample_event_summary(raw_events[0], events[0])
+                                    )
+                        if full_diagnostics:
+                            payload_summary["content_hash"] = response_hash
+                        if not on_demand:
+                            self.metrics.cache_lookup("calendar_response", payload_unchanged)
+                            self._calendar_response_cache[cache_key] = (response_hash, events)
                         _LOGGER.debug(f"Successfully parsed JSON response with {len(events)} events")
                     except Exception as json_error:
                         json_error_text = str(json_error)
@@ -1390,7 +2218,6 @@ class EasyIQClient:
                                 json_text = decompressed_content.decode('utf-8')
                                 import json
                                 payload = json.loads(json_text)
-                                payload_summary = _payload_summary(payload)
                                 raw_events = _extract_calendar_event_list(
                                     payload,
                                     normalize=False,
@@ -1399,17 +2226,12 @@ class EasyIQClient:
                                     _normalize_calendar_event(event)
                                     for event in raw_events
                                 ]
-                                if raw_events:
-                                    payload_summary["sample_event_keys"] = [
-                                        str(key)
-                                        for key in list(raw_events[0].keys())[:30]
-                                    ]
-                                    payload_summary["sample_event_preview"] = (
-                                        _event_preview(raw_events[0])
-                                    )
-                                    payload_summary["normalized_sample_event_preview"] = (
-                                        _event_preview(events[0])
-                                    )
+                                if full_diagnostics:
+                                    payload_summary = _payload_summary(payload)
+                                    if raw_events and self._sample_diagnostics_preview(child_id):
+                                        payload_summary.update(
+                                            _sample_event_summary(raw_events[0], events[0])
+                                        )
                                 _LOGGER.debug("Manual Brotli decompression successful")
                             except Exception as decomp_error:
                                 manual_brotli_error = str(decomp_error)
@@ -1418,37 +2240,42 @@ class EasyIQClient:
                         else:
                             events = []
 
-                    attempt_summaries.append(
-                        {
+                    self._calendar_login_id_cache[str(child_id)] = variant["login_id"]
+                    self._calendar_request_variant_cache[str(child_id)] = variant
+                    if self.diagnostics_level != DIAGNOSTICS_OFF:
+                        attempt = {
                             "variant": variant["name"],
                             "status_code": response.status_code,
-                            "content_type": response.headers.get("content-type", ""),
-                            "content_encoding": response.headers.get("content-encoding", ""),
                             "events": len(events),
-                            "payload": payload_summary,
-                            "json_error": json_error_text,
-                            "manual_brotli_error": manual_brotli_error,
                         }
-                    )
-                    self._calendar_login_id_cache[str(child_id)] = variant["login_id"]
-                    self._calendar_request_variant_cache[str(child_id)] = variant
-                    self._record_calendar_week_diagnostic(
-                        child_id,
-                        weeks_ahead,
-                        stage="success",
-                        successful_variant=variant["name"],
-                        status_code=response.status_code,
-                        raw_event_count=len(events),
-                        event_type_counts=_event_type_counts(events),
-                        attempts=attempt_summaries[-8:],
-                    )
+                        if full_diagnostics:
+                            attempt.update(
+                                content_type=response.headers.get("content-type", ""),
+                                content_encoding=response.headers.get("content-encoding", ""),
+                                payload=payload_summary,
+                                json_error=json_error_text,
+                                manual_brotli_error=manual_brotli_error,
+                            )
+                        attempt_summaries.append(attempt)
+                        week_values: dict[str, Any] = {}
+                        if not payload_unchanged:
+                            # An unchanged payload keeps the previous counts.
+                            week_values["event_type_counts"] = _event_type_counts(events)
+                        record_week(
+                            child_id,
+                            weeks_ahead,
+                            stage="success",
+                            successful_variant=variant["name"],
+                            status_code=response.status_code,
+                            unchanged=payload_unchanged,
+                            raw_event_count=len(events),
+                            attempts=attempt_summaries[-DIAGNOSTICS_MAX_ATTEMPTS:],
+                            **week_values,
+                        )
                     _LOGGER.info("🎉 Successfully retrieved %d calendar events!", len(events))
 
-                    # Log some sample data for debugging
-                    if events and len(events) > 0:
-                        sample_event = events[0]
-                        _LOGGER.debug(f"Sample event keys: {list(sample_event.keys())}")
-                        _LOGGER.debug(f"Sample event: {sample_event}")
+                    if events and full_diagnostics and _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Sample event: %s", events[0])
 
                     return events
                 except Exception as e:
@@ -1462,11 +2289,12 @@ class EasyIQClient:
                             "parse_error": str(e),
                         }
                     )
-                    self._record_calendar_week_diagnostic(
+                    record_week(
                         child_id,
                         weeks_ahead,
+                        failure=True,
                         stage="parse_failed",
-                        attempts=attempt_summaries[-8:],
+                        attempts=attempt_summaries[-DIAGNOSTICS_MAX_ATTEMPTS:],
                     )
                     # Try to get more info about the response
                     try:
@@ -1491,13 +2319,14 @@ class EasyIQClient:
                     response_preview,
                 )
                 _LOGGER.debug("Calendar events failed request params: %s", last_params)
-                self._record_calendar_week_diagnostic(
+                record_week(
                     child_id,
                     weeks_ahead,
+                    failure=True,
                     stage="http_failed",
                     status_code=last_response.status_code,
                     failed_attempts=failed_attempts,
-                    attempts=attempt_summaries[-8:],
+                    attempts=attempt_summaries[-DIAGNOSTICS_MAX_ATTEMPTS:],
                 )
             return []
                 
@@ -1505,9 +2334,10 @@ class EasyIQClient:
             raise
         except Exception as err:
             _LOGGER.error("Failed to get calendar events: %s", err)
-            self._record_calendar_week_diagnostic(
+            record_week(
                 child_id,
                 weeks_ahead,
+                failure=True,
                 stage="exception",
                 error=str(err),
             )
@@ -1535,7 +2365,6 @@ class EasyIQClient:
                     "week": "No calendar events",
                     "html_content": "<p>No scheduled events found.</p>",
                     "events": [],
-                    "raw_data": [],
                     "raw_event_count": 0,
                     "event_type_counts": {},
                 }
@@ -1572,7 +2401,6 @@ class EasyIQClient:
                 "week": f"Week {week_num}",
                 "html_content": weekplan_html,
                 "events": weekplan_events,
-                "raw_data": events,
                 "raw_event_count": len(events),
                 "event_type_counts": _event_type_counts(events),
             }
@@ -1597,7 +2425,6 @@ class EasyIQClient:
                     "week": "No calendar events",
                     "html_content": "<p>No homework assignments found.</p>",
                     "assignments": [],
-                    "raw_data": [],
                     "raw_event_count": 0,
                     "event_type_counts": {},
                 }
@@ -1614,14 +2441,7 @@ class EasyIQClient:
             
             for event in homework_events:
                 try:
-                    assignment_data = {
-                        "title": event.get("courses", ""),
-                        "subject": event.get("courses", ""),
-                        "description": event.get("description", ""),
-                        "start_time": event.get("start", ""),
-                        "activities": event.get("activities", ""),
-                        "raw_data": event
-                    }
+                    assignment_data = _homework_assignment(event)
                     assignments.append(assignment_data)
                     
                     # Build HTML representation
@@ -1640,7 +2460,6 @@ class EasyIQClient:
                 "week": f"Week {week_num}",
                 "html_content": homework_html,
                 "assignments": assignments,
-                "raw_data": events,
                 "raw_event_count": len(events),
                 "event_type_counts": _event_type_counts(events),
             }
@@ -1667,7 +2486,9 @@ class EasyIQClient:
         try:
             # Run the synchronous message request in an executor to avoid blocking
             loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self._sync_get_messages)
+            return await loop.run_in_executor(
+                None, self._timed_job("messages", self._sync_get_messages)
+            )
         except MitIDAuthError:
             raise
         except Exception as err:
@@ -1675,98 +2496,75 @@ class EasyIQClient:
             return {}
     
     def _sync_get_messages(self) -> dict[str, Any]:
-        """Synchronous version of messages retrieval."""
+        """Synchronous version of messages retrieval.
+
+        Pages ``messaging.getThreads`` newest first only until a page holds a
+        thread the local index already knows unchanged, so an idle poll is a
+        single request. Once every ``_MESSAGE_FULL_SYNC_SECONDS`` all pages
+        are swept instead, which refreshes the read flags of older threads.
+        Thread content is parsed once per (thread id, latest message) and
+        served from a small LRU while the thread is unchanged. When the
+        newest unread thread's content cannot be fetched, the message is
+        cleared and marked unavailable rather than showing an older thread.
+        """
         try:
-            # Get message threads from Aula API
-            _LOGGER.debug("Fetching message threads...")
-            mesres = self._aula_get(
-                "messaging.getThreads",
-                params={
-                    "sortOn": "date",
-                    "orderDirection": "desc",
-                    "page": 0,
-                },
-            )
-            
-            if mesres.status_code != 200:
-                _LOGGER.error(f"Failed to get message threads: {mesres.status_code}")
-                return {}
-            
-            # Reset message data
-            self.unread_messages = 0
-            unread = 0
-            self.message = {}
-            
-            # Check for unread messages
-            threads_data = mesres.json()
-            if "data" not in threads_data or "threads" not in threads_data["data"]:
-                _LOGGER.debug("No message threads found")
-                return self.message
-            
-            # Find first unread message
-            threadid = None
-            for mes in threads_data["data"]["threads"]:
-                if not mes.get("read", True):  # Default to read if not specified
-                    unread = 1
-                    threadid = mes["id"]
-                    _LOGGER.debug(f"Found unread message thread: {threadid}")
-                    break
-            
-            # If we have an unread message, get its content
-            if unread == 1 and threadid:
-                _LOGGER.debug(f"Fetching message content for thread: {threadid}")
-                threadres = self._aula_get(
-                    "messaging.getMessagesForThread",
+            index = self.message_index
+            threads: list[dict[str, Any]] = []
+            full_sync = time.monotonic() >= self._message_full_sync_at
+            complete = full_sync
+            for page in range(_MESSAGE_MAX_PAGES):
+                _LOGGER.debug("Fetching message threads page %d...", page)
+                mesres = self._aula_get(
+                    "messaging.getThreads",
                     params={
-                        "threadId": threadid,
-                        "page": 0,
+                        "sortOn": "date",
+                        "orderDirection": "desc",
+                        "page": page,
                     },
                 )
                 
-                if threadres.status_code == 200:
-                    thread_data = threadres.json()
-                    
-                    # Handle sensitive messages (403 status)
-                    if thread_data.get("status", {}).get("code") == 403:
-                        self.message = {
-                            "text": "Log ind på Aula med MitID for at læse denne besked.",
-                            "sender": "Ukendt afsender",
-                            "subject": "Følsom besked"
-                        }
-                        self.unread_messages = 1
-                    else:
-                        # Parse regular messages
-                        if "data" in thread_data and "messages" in thread_data["data"]:
-                            for message in thread_data["data"]["messages"]:
-                                if message.get("messageType") == "Message":
-                                    # Extract message text
-                                    try:
-                                        if isinstance(message.get("text"), dict):
-                                            self.message["text"] = message["text"].get("html", message["text"].get("text", ""))
-                                        else:
-                                            self.message["text"] = message.get("text", "")
-                                    except Exception:
-                                        self.message["text"] = "intet indhold..."
-                                        _LOGGER.warning("Could not extract message text")
-                                    
-                                    # Extract sender
-                                    try:
-                                        sender_info = message.get("sender", {})
-                                        self.message["sender"] = sender_info.get("fullName", "Ukendt afsender")
-                                    except Exception:
-                                        self.message["sender"] = "Ukendt afsender"
-                                    
-                                    # Extract subject
-                                    try:
-                                        self.message["subject"] = thread_data["data"].get("subject", "")
-                                    except Exception:
-                                        self.message["subject"] = ""
-                                    
-                                    self.unread_messages = 1
-                                    _LOGGER.info(f"Found unread message: {self.message.get('subject', 'No subject')}")
-                                    break
+                if mesres.status_code != 200:
+                    _LOGGER.error(f"Failed to get message threads: {mesres.status_code}")
+                    if page == 0:
+                        return {}
+                    complete = False
+                    break
+                
+                threads_data = mesres.json()
+                page_threads = (threads_data.get("data") or {}).get("threads") or []
+                threads.extend(page_threads)
+                if not page_threads:
+                    break
+                if not full_sync and any(index.is_unchanged(thread) for thread in page_threads):
+                    break
+            
+            changed_threads = index.apply_threads(threads, complete=complete)
+            if complete:
+                self._message_full_sync_at = time.monotonic() + _MESSAGE_FULL_SYNC_SECONDS
+            unread_count = index.unread_count
+            newest_unread = index.newest_unread()
+            self.unread_messages = unread_count
+            if changed_threads:
+                _LOGGER.debug("Message threads changed since last poll: %s", changed_threads)
+            
+            if newest_unread is None:
+                self.message = {}
+                self.message_key = None
+            else:
+                message = self._cached_thread_message(newest_unread)
+                if message is not None:
+                    if newest_unread != self.message_key:
+                        _LOGGER.info(f"Found unread message: {message.get('subject', 'No subject')}")
+                    self.message = {**message, "unread_count": unread_count}
+                    self.message_key = newest_unread
                 else:
-                    _LOGGER.error(f"Failed to get message thread content: {threadres.status_code}")
+                    # Do not present an older thread as the newest; retry next poll.
+                    self.message = {"unread_count": unread_count, "content_available": False}
+                    self.message_key = None
+            if index.dirty:
+                index.dirty = False
+                if self._on_message_index_update is not None:
+                    self._on_message_index_update(index)
             
             _LOGGER.debug(f"Messages check complete: {self.unread_messages} unread messages")
             return self.message
@@ -1777,6 +2575,77 @@ class EasyIQClient:
             _LOGGER.error(f"Error getting messages: {err}")
             return {}
 
+    def _cached_thread_message(self, message_key: tuple[str, str]) -> dict[str, Any] | None:
+        """Return parsed thread content, fetching it only for unseen latest messages."""
+        message = self._message_cache.get(message_key)
+        self.metrics.cache_lookup("message", message is not None)
+        if message is not None:
+            self._message_cache.move_to_end(message_key)
+            _LOGGER.debug("Thread %s content served from cache", message_key[0])
+            return message
+        message = self._sync_get_thread_message(message_key[0])
+        if message is None:
+            return None
+        self._message_cache[message_key] = message
+        while len(self._message_cache) > _MESSAGE_CACHE_SIZE:
+            self._message_cache.popitem(last=False)
+        return message
+
+    def _sync_get_thread_message(self, threadid: str) -> dict[str, Any] | None:
+        """Fetch and parse the latest message of a thread, or None on failure."""
+        _LOGGER.debug(f"Fetching message content for thread: {threadid}")
+        threadres = self._aula_get(
+            "messaging.getMessagesForThread",
+            params={
+                "threadId": threadid,
+                "page": 0,
+            },
+        )
+        
+        if threadres.status_code != 200:
+            _LOGGER.error(f"Failed to get message thread content: {threadres.status_code}")
+            return None
+        
+        thread_data = threadres.json()
+        
+        # Handle sensitive messages (403 status)
+        if thread_data.get("status", {}).get("code") == 403:
+            return {
+                "text": "Log ind på Aula med MitID for at læse denne besked.",
+                "sender": "Ukendt afsender",
+                "subject": "Følsom besked"
+            }
+        
+        # Parse regular messages
+        message: dict[str, Any] = {}
+        if "data" in thread_data and "messages" in thread_data["data"]:
+            for thread_message in thread_data["data"]["messages"]:
+                if thread_message.get("messageType") == "Message":
+                    # Extract message text
+                    try:
+                        if isinstance(thread_message.get("text"), dict):
+                            message["text"] = thread_message["text"].get("html", thread_message["text"].get("text", ""))
+                        else:
+                            message["text"] = thread_message.get("text", "")
+                    except Exception:
+                        message["text"] = "intet indhold..."
+                        _LOGGER.warning("Could not extract message text")
+                    
+                    # Extract sender
+                    try:
+                        sender_info = thread_message.get("sender", {})
+                        message["sender"] = sender_info.get("fullName", "Ukendt afsender")
+                    except Exception:
+                        message["sender"] = "Ukendt afsender"
+                    
+                    # Extract subject
+                    try:
+                        message["subject"] = thread_data["data"].get("subject", "")
+                    except Exception:
+                        message["subject"] = ""
+                    break
+        return message
+
     async def get_presence(self, child_id: str) -> dict[str, Any]:
         """Get presence data using the proper Aula API."""
         if self.fixture_mode:
@@ -1814,7 +2683,11 @@ class EasyIQClient:
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
                 None,
-                lambda: self._aula_get("presence.getDailyOverview", params=params)
+                self._timed_job(
+                    "presence",
+                    lambda: self._aula_get("presence.getDailyOverview", params=params),
+                    child=str(child_id),
+                ),
             )
             
             if response.status_code != 200:
@@ -1896,6 +2769,7 @@ class EasyIQClient:
 
     async def update_data(self, weekplan_days: int = 5, homework_days: int = 5) -> None:
         """Update all data from the API using business days approach."""
+        self._start_cycle_records()
         try:
             self.update_diagnostics = {
                 "last_update_started": self._now_text(),
@@ -1922,6 +2796,15 @@ class EasyIQClient:
             # Update weekplan, homework, and presence data for each child using business days approach
             self.weekplan_data = {}
             self.homework_data = {}
+            # Keep the previous stores so this cycle's changes can be diffed against them
+            child_ids = {child.get("id") for child in self.children}
+            self.event_store = {
+                child_id: store
+                for child_id, store in self.event_store.items()
+                if child_id in child_ids
+            }
+            self.calendar_changed = {}
+            self.calendar_changes = {}
             self.presence_data = {}
             
             for child in self.children:
@@ -1945,83 +2828,43 @@ class EasyIQClient:
                         max_days = max(weekplan_days, homework_days)
                         business_day_events = await self.get_calendar_events_for_business_days(child_id, max_days)
                         
-                        # Separate weekplan and homework events
-                        all_weekplan_events = _events_of_types(
+                        weekplan_events, homework_events = self._store_calendar_views(
+                            child_id,
                             business_day_events,
-                            _WEEKPLAN_EVENT_TYPES,
+                            weekplan_days=weekplan_days,
+                            homework_days=homework_days,
                         )
-                        all_homework_events = _events_of_types(
-                            business_day_events,
-                            _HOMEWORK_EVENT_TYPES,
-                        )
-                        
-                        # Filter events based on configured days
-                        weekplan_events = self._filter_events_by_days(all_weekplan_events, weekplan_days)
-                        homework_events = self._filter_events_by_days(all_homework_events, homework_days)
-                        
-                        # Store weekplan data
-                        weekplan_desc = f"Next {weekplan_days} Business Day{'s' if weekplan_days != 1 else ''}"
-                        self.weekplan_data[child_id] = {
-                            "week": weekplan_desc,
-                            "events": weekplan_events,
-                            "html_content": self._build_weekplan_html(weekplan_events, weekplan_days),
-                            "raw_data": business_day_events,
-                            "raw_event_count": len(business_day_events),
-                            "event_type_counts": _event_type_counts(business_day_events),
-                        }
-                        
-                        # Store homework data
-                        homework_assignments = []
-                        for event in homework_events:
-                            assignment_data = {
-                                "title": event.get("courses", ""),
-                                "subject": event.get("courses", ""),
-                                "description": event.get("description", ""),
-                                "start_time": event.get("start", ""),
-                                "activities": event.get("activities", ""),
-                                "raw_data": event
-                            }
-                            homework_assignments.append(assignment_data)
-                        
-                        homework_desc = f"Next {homework_days} Business Day{'s' if homework_days != 1 else ''}"
-                        self.homework_data[child_id] = {
-                            "week": homework_desc,
-                            "assignments": homework_assignments,
-                            "html_content": self._build_homework_html(homework_assignments, homework_days),
-                            "raw_data": business_day_events,
-                            "raw_event_count": len(business_day_events),
-                            "event_type_counts": _event_type_counts(business_day_events),
-                        }
                         
                         # Get presence data for this child
                         self.presence_data[child_id] = await self.get_presence(child_id)
                         
-                        _LOGGER.info(
-                            "Updated data for %s: %d raw events, %d weekplan "
-                            "events, %d homework events, item types: %s",
-                            child_name,
-                            len(business_day_events),
-                            len(weekplan_events),
-                            len(homework_events),
-                            _event_type_counts(business_day_events),
-                        )
+                        if _LOGGER.isEnabledFor(logging.INFO):
+                            _LOGGER.info(
+                                "Updated data for %s: %d raw events, %d weekplan "
+                                "events, %d homework events, item types: %s",
+                                child_name,
+                                len(business_day_events),
+                                len(weekplan_events),
+                                len(homework_events),
+                                _event_type_counts(business_day_events),
+                            )
                         
                     except MitIDAuthError:
                         raise
                     except Exception as child_err:
                         _LOGGER.error(f"Failed to update data for child {child_name}: {child_err}", exc_info=True)
                         # Set empty data for this child to avoid errors but keep integration running
+                        # Keep the last good store, if any, so the next success is diffed against it
+                        self.calendar_changed[child_id] = True
                         self.weekplan_data[child_id] = {
                             "week": "Error - Check Logs",
-                            "events": [],
+                            "event_ids": [],
                             "html_content": f"<p>Error updating data for {child_name}. Check Home Assistant logs.</p>",
-                            "raw_data": []
                         }
                         self.homework_data[child_id] = {
                             "week": "Error - Check Logs",
                             "assignments": [],
                             "html_content": f"<p>Error updating homework for {child_name}. Check Home Assistant logs.</p>",
-                            "raw_data": []
                         }
                         self.presence_data[child_id] = {
                             "status": "Error - Check Logs",
@@ -2052,6 +2895,8 @@ class EasyIQClient:
                 }
             )
             raise
+        finally:
+            await self._finish_cycle_records()
 
     async def update_data_selective(
         self,
@@ -2060,9 +2905,18 @@ class EasyIQClient:
         update_presence: bool = True,
         update_messages: bool = True,
         weekplan_days: int = 5,
-        homework_days: int = 5
+        homework_days: int = 5,
+        calendar_interval: int | None = None,
+        combined_calendar_fetch: bool = False,
     ) -> None:
-        """Update specific data types from the API based on flags."""
+        """Update specific data types from the API based on flags.
+
+        ``calendar_interval`` is the base weekplan/homework interval used for
+        distance-based week refreshes; None refetches every week. With
+        ``combined_calendar_fetch`` the due weeks of all children are first
+        requested together, falling back to per-child requests.
+        """
+        self._start_cycle_records()
         try:
             self.update_diagnostics = {
                 "last_update_started": self._now_text(),
@@ -2073,6 +2927,7 @@ class EasyIQClient:
                 "update_messages": update_messages,
                 "weekplan_days": weekplan_days,
                 "homework_days": homework_days,
+                "calendar_interval": calendar_interval,
             }
             # First authenticate if not already authenticated
             await self.authenticate()
@@ -2090,6 +2945,22 @@ class EasyIQClient:
             if not self.children:
                 _LOGGER.warning("EasyIQ update found no children after authentication")
             
+            # Only children whose calendar views are rebuilt this cycle are marked changed
+            self.calendar_changed = {}
+            self.calendar_changes = {}
+
+            if (update_weekplan or update_homework) and combined_calendar_fetch:
+                try:
+                    await self._prefetch_combined_calendar_weeks(
+                        [child.get("id") for child in self.children if child.get("id")],
+                        max(weekplan_days, homework_days),
+                        calendar_interval,
+                    )
+                except MitIDAuthError:
+                    raise
+                except Exception as combined_err:
+                    _LOGGER.error(f"Combined calendar fetch failed: {combined_err}")
+
             # Initialize data structures if they don't exist
             if not hasattr(self, 'weekplan_data'):
                 self.weekplan_data = {}
@@ -2112,65 +2983,32 @@ class EasyIQClient:
                         try:
                             # Use the maximum of weekplan_days and homework_days to get all needed events
                             max_days = max(weekplan_days, homework_days)
-                            business_day_events = await self.get_calendar_events_for_business_days(child_id, max_days)
+                            business_day_events = await self.get_calendar_events_for_business_days(
+                                child_id,
+                                max_days,
+                                refresh_interval=calendar_interval,
+                            )
                             _LOGGER.info(
                                 "Calendar data for %s: %d raw business-day events",
                                 child_name,
                                 len(business_day_events),
                             )
                             
+                            weekplan_events, homework_events = self._store_calendar_views(
+                                child_id,
+                                business_day_events,
+                                weekplan_days=weekplan_days,
+                                homework_days=homework_days,
+                                update_weekplan=update_weekplan,
+                                update_homework=update_homework,
+                            )
                             if update_weekplan:
-                                # Separate and filter weekplan events
-                                all_weekplan_events = _events_of_types(
-                                    business_day_events,
-                                    _WEEKPLAN_EVENT_TYPES,
-                                )
-                                weekplan_events = self._filter_events_by_days(all_weekplan_events, weekplan_days)
-                                weekplan_desc = f"Next {weekplan_days} Business Day{'s' if weekplan_days != 1 else ''}"
-                                self.weekplan_data[child_id] = {
-                                    "week": weekplan_desc,
-                                    "events": weekplan_events,
-                                    "html_content": self._build_weekplan_html(weekplan_events, weekplan_days),
-                                    "raw_data": business_day_events,
-                                    "raw_event_count": len(business_day_events),
-                                    "event_type_counts": _event_type_counts(business_day_events),
-                                    "last_updated": datetime.datetime.now().isoformat()
-                                }
                                 _LOGGER.info(
                                     "Updated weekplan for %s: %d events after filtering",
                                     child_name,
                                     len(weekplan_events),
                                 )
-                            
                             if update_homework:
-                                # Separate and filter homework events
-                                all_homework_events = _events_of_types(
-                                    business_day_events,
-                                    _HOMEWORK_EVENT_TYPES,
-                                )
-                                homework_events = self._filter_events_by_days(all_homework_events, homework_days)
-                                homework_assignments = []
-                                for event in homework_events:
-                                    assignment_data = {
-                                        "title": event.get("courses", ""),
-                                        "subject": event.get("courses", ""),
-                                        "description": event.get("description", ""),
-                                        "start_time": event.get("start", ""),
-                                        "activities": event.get("activities", ""),
-                                        "raw_data": event
-                                    }
-                                    homework_assignments.append(assignment_data)
-                                
-                                homework_desc = f"Next {homework_days} Business Day{'s' if homework_days != 1 else ''}"
-                                self.homework_data[child_id] = {
-                                    "week": homework_desc,
-                                    "assignments": homework_assignments,
-                                    "html_content": self._build_homework_html(homework_assignments, homework_days),
-                                    "raw_data": business_day_events,
-                                    "raw_event_count": len(business_day_events),
-                                    "event_type_counts": _event_type_counts(business_day_events),
-                                    "last_updated": datetime.datetime.now().isoformat()
-                                }
                                 _LOGGER.info(
                                     "Updated homework for %s: %d assignments after filtering",
                                     child_name,
@@ -2217,6 +3055,163 @@ class EasyIQClient:
                 }
             )
             raise
+        finally:
+            await self._finish_cycle_records()
+
+    def _start_cycle_records(self) -> None:
+        """Start timing spans and, when tracing, journal numbering for a cycle."""
+        self.timings.start_cycle()
+        if self.trace_journal is not None:
+            self.trace_journal.start_cycle()
+            self._cycle_cache_baseline = self.metrics.snapshot()["counters"]["cache_lookups_total"]
+
+    async def _finish_cycle_records(self) -> None:
+        """Store the finished cycle's timings and write the trace journal."""
+        cycle = self.timings.finish_cycle()
+        self.metrics.observe("update_cycle_duration_seconds", cycle["total_ms"] / 1000)
+        self.update_diagnostics["timings"] = cycle
+        self.update_timings = self.timings.summary(cycle)
+        if self.trace_journal is None:
+            return
+
+        cache: dict[str, dict[str, int]] = {}
+        lookups = self.metrics.snapshot()["counters"]["cache_lookups_total"]
+        for key, value in lookups.items():
+            count = int(value - self._cycle_cache_baseline.get(key, 0))
+            if count:
+                labels = dict(key)
+                cache.setdefault(labels["cache"], {})[labels["result"]] = count
+        self.trace_journal.record(
+            "cycle",
+            mode=self.update_diagnostics.get("mode"),
+            error="error" in self.update_diagnostics,
+            total_ms=cycle["total_ms"],
+            network_ms=cycle["network_ms"],
+            requests=cycle["requests"],
+            bytes=cycle["bytes"],
+            phases=cycle["phases"],
+            cache=cache,
+        )
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self.trace_journal.flush)
+
+    def _store_calendar_views(
+        self,
+        child_id: str,
+        business_day_events: list[dict[str, Any]],
+        *,
+        weekplan_days: int,
+        homework_days: int,
+        update_weekplan: bool = True,
+        update_homework: bool = True,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Replace a child's event store and rebuild the requested views.
+
+        Views keep event ids into the shared store rather than their own
+        copies of the business-day event list. When the store revision and
+        view window are unchanged the previous view dicts are kept as-is and
+        the child is marked unchanged for this cycle. A child without a
+        previous store, as after a restart or reload, gets its first store as
+        a silent baseline and reports no changes.
+        """
+        store = ChildEventStore(
+            business_day_events,
+            identity=_event_identity,
+            dates=self._calendar_target_dates.get(str(child_id), ()),
+        )
+        previous_store = self.event_store.get(child_id)
+        if (
+            previous_store is not None
+            and previous_store.revision == store.revision
+            and previous_store.dates == store.dates
+        ):
+            # Keep the existing snapshot so unchanged views stay identical.
+            store = previous_store
+        elif previous_store is not None:
+            changes = self._calendar_store_changes(previous_store, store)
+            if any(changes.values()):
+                self.calendar_changes[child_id] = changes
+        self.event_store[child_id] = store
+        raw_event_count = len(store)
+        event_type_counts = _event_type_counts(store.events)
+        last_updated = datetime.datetime.now().isoformat()
+        today = datetime.datetime.now().date().isoformat()
+        changed = False
+
+        weekplan_events: list[dict[str, Any]] = []
+        homework_events: list[dict[str, Any]] = []
+        if update_weekplan:
+            view_key = (store.revision, weekplan_days, today)
+            previous_view = self.weekplan_data.get(child_id)
+            if previous_view and self._calendar_view_keys.get((child_id, "weekplan")) == view_key:
+                weekplan_events = store.resolve(previous_view["event_ids"])
+            else:
+                weekplan_events = self._filter_events_by_days(
+                    _events_of_types(store.events, _WEEKPLAN_EVENT_TYPES),
+                    weekplan_days,
+                )
+                self.weekplan_data[child_id] = {
+                    "week": _business_days_text(weekplan_days),
+                    "event_ids": [_event_identity(event) for event in weekplan_events],
+                    "days": weekplan_days,
+                    "raw_event_count": raw_event_count,
+                    "event_type_counts": event_type_counts,
+                    "revision": _json_content_hash(view_key),
+                    "last_updated": last_updated,
+                }
+                self._calendar_view_keys[(child_id, "weekplan")] = view_key
+                changed = True
+
+        if update_homework:
+            view_key = (store.revision, homework_days, today)
+            previous_view = self.homework_data.get(child_id)
+            if previous_view and self._calendar_view_keys.get((child_id, "homework")) == view_key:
+                homework_events = store.resolve(
+                    assignment["event_id"] for assignment in previous_view["assignments"]
+                )
+            else:
+                homework_events = self._filter_events_by_days(
+                    _events_of_types(store.events, _HOMEWORK_EVENT_TYPES),
+                    homework_days,
+                )
+                homework_assignments = [
+                    _homework_assignment(event) for event in homework_events
+                ]
+                self.homework_data[child_id] = {
+                    "week": _business_days_text(homework_days),
+                    "assignments": homework_assignments,
+                    "days": homework_days,
+                    "raw_event_count": raw_event_count,
+                    "event_type_counts": event_type_counts,
+                    "revision": _json_content_hash(view_key),
+                    "last_updated": last_updated,
+                }
+                self._calendar_view_keys[(child_id, "homework")] = view_key
+                changed = True
+
+        self.calendar_changed[child_id] = changed
+        return weekplan_events, homework_events
+
+    def _calendar_store_changes(
+        self,
+        previous_store: ChildEventStore,
+        store: ChildEventStore,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Diff two event store snapshots over the days either window covers.
+
+        Days that slid out of the window into the past are left out, so the
+        days before today do not report their events as removed. Events of
+        a day that entered the window are reported as added.
+        """
+        if not store.dates:
+            return diff_event_stores(previous_store, store)
+        window_start = min(store.dates)
+
+        def in_scope(event: dict[str, Any]) -> bool:
+            event_date = _event_start_date(event)
+            return event_date is None or event_date.isoformat() >= window_start
+
+        return diff_event_stores(previous_store, store, in_scope=in_scope)
 
     def _filter_events_by_days(self, events: list[dict[str, Any]], days: int) -> list[dict[str, Any]]:
         """Filter events to only include those within the specified number of business days."""
@@ -2226,20 +3221,8 @@ class EasyIQClient:
         if not events or days <= 0:
             return []
         
-        # Get current date
-        current_date = datetime.datetime.now().date()
-        
-        # Calculate the target business days
-        business_days_found = 0
-        check_date = current_date
-        target_dates = []
-        
-        while business_days_found < days:
-            # Skip weekends (Saturday=5, Sunday=6)
-            if check_date.weekday() < 5:  # Monday=0 to Friday=4
-                target_dates.append(check_date)
-                business_days_found += 1
-            check_date += datetime.timedelta(days=1)
+        # Calculate the target business days from today
+        target_dates = set(business_dates(datetime.datetime.now().date(), days))
         
         # Filter events to only include those on target dates
         filtered_events = []
@@ -2250,14 +3233,53 @@ class EasyIQClient:
         
         return filtered_events
 
+    def weekplan_html(self, child_id: str) -> str:
+        """Return the weekplan HTML for a child, rendering it on first use."""
+        view = self.weekplan_data.get(child_id) or {}
+        if "html_content" in view:
+            return view["html_content"]
+        if "revision" not in view:
+            return ""
+        return self._memoized_html(
+            ("weekplan", view["revision"]),
+            lambda: self._build_weekplan_html(
+                self.event_store[child_id].resolve(view["event_ids"]),
+                view["days"],
+            ),
+        )
+
+    def homework_html(self, child_id: str) -> str:
+        """Return the homework HTML for a child, rendering it on first use."""
+        view = self.homework_data.get(child_id) or {}
+        if "html_content" in view:
+            return view["html_content"]
+        if "revision" not in view:
+            return ""
+        return self._memoized_html(
+            ("homework", view["revision"]),
+            lambda: self._build_homework_html(view["assignments"], view["days"]),
+        )
+
+    def _memoized_html(self, key: tuple[str, str], render: Callable[[], str]) -> str:
+        """Return cached HTML for a view revision, rendering it when missing."""
+        html = self._html_cache.get(key)
+        self.metrics.cache_lookup("html", html is not None)
+        if html is None:
+            html = render()
+            self._html_cache[key] = html
+            while len(self._html_cache) > _HTML_CACHE_SIZE:
+                self._html_cache.popitem(last=False)
+        else:
+            self._html_cache.move_to_end(key)
+        return html
+
     def _build_weekplan_html(self, weekplan_events: list[dict[str, Any]], days: int = 5) -> str:
         """Build HTML content for weekplan events."""
-        day_text = f"{days} Business Day{'s' if days != 1 else ''}"
-        html = f"<h2>Next {day_text} - Schedule</h2>"
+        parts = [f"<h2>{_business_days_text(days)} - Schedule</h2>"]
         
         if not weekplan_events:
-            html += "<p>No scheduled events found.</p>"
-            return html
+            parts.append("<p>No scheduled events found.</p>")
+            return "".join(parts)
         
         # Group events by date
         events_by_date = {}
@@ -2271,44 +3293,40 @@ class EasyIQClient:
             try:
                 # Convert to readable date format
                 readable_date = date_obj.strftime("%A, %B %d, %Y")
-                html += f"<h3>{readable_date}</h3>"
+                parts.append(f"<h3>{readable_date}</h3>")
                 
                 # Sort events by time for this date
                 day_events = sorted(events_by_date[date_obj], key=lambda x: str(x.get("start", "")))
                 
                 for event in day_events:
-                    start_time = event.get("start", "")
-                    end_time = event.get("end", "")
                     courses = event.get("courses", "")
                     activities = event.get("activities", "")
                     description = event.get("description", "")
                     
                     # Extract time part
-                    start_time_part = _event_time_text(start_time)
-                    end_time_part = _event_time_text(end_time)
+                    start_time_part = _event_time_text(event.get("start", ""))
+                    end_time_part = _event_time_text(event.get("end", ""))
                     
-                    html += f"<p><b>{start_time_part} - {end_time_part}</b><br>"
-                    html += f"<b>{courses}</b>"
+                    parts.append(f"<p><b>{start_time_part} - {end_time_part}</b><br><b>{courses}</b>")
                     if activities:
-                        html += f" ({activities})"
-                    html += "<br>"
+                        parts.append(f" ({activities})")
+                    parts.append("<br>")
                     if description:
-                        html += f"{description}<br>"
-                    html += "</p>"
+                        parts.append(f"{description}<br>")
+                    parts.append("</p>")
                         
             except ValueError:
                 continue
         
-        return html
+        return "".join(parts)
     
     def _build_homework_html(self, homework_assignments: list[dict[str, Any]], days: int = 5) -> str:
         """Build HTML content for homework assignments."""
-        day_text = f"{days} Business Day{'s' if days != 1 else ''}"
-        html = f"<h2>Next {day_text} - Homework</h2>"
+        parts = [f"<h2>{_business_days_text(days)} - Homework</h2>"]
         
         if not homework_assignments:
-            html += "<p>No homework assignments found.</p>"
-            return html
+            parts.append("<p>No homework assignments found.</p>")
+            return "".join(parts)
         
         for assignment in homework_assignments:
             subject = assignment.get("subject", "Unknown Subject")
@@ -2316,16 +3334,16 @@ class EasyIQClient:
             start_time = assignment.get("start_time", "")
             description = assignment.get("description", "")
             
-            html += f"<h3>{subject}</h3>"
+            parts.append(f"<h3>{subject}</h3>")
             if activities:
-                html += f"<p><strong>Activities:</strong> {activities}</p>"
+                parts.append(f"<p><strong>Activities:</strong> {activities}</p>")
             if start_time:
-                html += f"<p><strong>Time:</strong> {start_time}</p>"
+                parts.append(f"<p><strong>Time:</strong> {start_time}</p>")
             if description:
-                html += f"<p><strong>Description:</strong> {description}</p>"
-            html += "<hr>"
+                parts.append(f"<p><strong>Description:</strong> {description}</p>")
+            parts.append("<hr>")
         
-        return html
+        return "".join(parts)
 
     async def authenticate(self) -> bool:
         """Authenticate with the EasyIQ API using async approach."""
@@ -2335,7 +3353,9 @@ class EasyIQClient:
 
             # Run synchronous token validation/profile discovery in an executor.
             loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, self._authenticate_sync)
+            result = await loop.run_in_executor(
+                None, self._timed_job("authenticate", self._authenticate_sync)
+            )
             return result
         except MitIDAuthError:
             raise
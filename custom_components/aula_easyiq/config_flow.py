@@ -14,9 +14,14 @@ from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
     CONF_ACCESS_TOKEN,
+    CONF_BLOCKING_DETECTOR,
+    CONF_BLOCKING_THRESHOLD,
+    CONF_COMBINED_CALENDAR_FETCH,
+    CONF_DIAGNOSTICS_LEVEL,
     CONF_HOMEWORK,
     CONF_HOMEWORK_DAYS,
     CONF_HOMEWORK_INTERVAL,
+    CONF_HTML_CONTENT,
     CONF_MITID_USERNAME,
     CONF_PASSWORD,
     CONF_PRESENCE,
@@ -25,16 +30,24 @@ from .const import (
     CONF_REFRESH_TOKEN,
     CONF_SCHOOLSCHEDULE,
     CONF_TOKEN_EXPIRES_AT,
+    CONF_TRACE_JOURNAL,
     CONF_USERNAME,
     CONF_WEEKPLAN,
     CONF_WEEKPLAN_DAYS,
     CONF_WEEKPLAN_INTERVAL,
+    DEFAULT_BLOCKING_DETECTOR,
+    DEFAULT_BLOCKING_THRESHOLD,
+    DEFAULT_COMBINED_CALENDAR_FETCH,
+    DEFAULT_DIAGNOSTICS_LEVEL,
     DEFAULT_HOMEWORK_DAYS,
     DEFAULT_HOMEWORK_INTERVAL,
+    DEFAULT_HTML_CONTENT,
     DEFAULT_MESSAGES_INTERVAL,
     DEFAULT_PRESENCE_INTERVAL,
+    DEFAULT_TRACE_JOURNAL,
     DEFAULT_WEEKPLAN_DAYS,
     DEFAULT_WEEKPLAN_INTERVAL,
+    DIAGNOSTICS_LEVELS,
     DOMAIN,
     CONF_MESSAGES_INTERVAL,
 )
@@ -352,6 +365,43 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             CONF_HOMEWORK_DAYS, DEFAULT_HOMEWORK_DAYS
                         ),
                     ): vol.All(vol.Coerce(int), vol.Range(min=1, max=14)),
+                    vol.Optional(
+                        CONF_HTML_CONTENT,
+                        default=self._get_option(
+                            CONF_HTML_CONTENT, DEFAULT_HTML_CONTENT
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_COMBINED_CALENDAR_FETCH,
+                        default=self._get_option(
+                            CONF_COMBINED_CALENDAR_FETCH,
+                            DEFAULT_COMBINED_CALENDAR_FETCH,
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_TRACE_JOURNAL,
+                        default=self._get_option(
+                            CONF_TRACE_JOURNAL, DEFAULT_TRACE_JOURNAL
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_BLOCKING_DETECTOR,
+                        default=self._get_option(
+                            CONF_BLOCKING_DETECTOR, DEFAULT_BLOCKING_DETECTOR
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_BLOCKING_THRESHOLD,
+                        default=self._get_option(
+                            CONF_BLOCKING_THRESHOLD, DEFAULT_BLOCKING_THRESHOLD
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=5000)),
+                    vol.Optional(
+                        CONF_DIAGNOSTICS_LEVEL,
+                        default=self._get_option(
+                            CONF_DIAGNOSTICS_LEVEL, DEFAULT_DIAGNOSTICS_LEVEL
+                        ),
+                    ): vol.In(DIAGNOSTICS_LEVELS),
                 }
             ),
         )
@@ -36,6 +36,10 @@ EASYIQ_WIDGETS = {
 
 # Configuration keys
 CONF_FIXTURE_BASE_URL = "fixture_base_url"
+# Developer overrides pointing the client at a stand-in backend
+CONF_API_BASE_URL = "api_base_url"
+CONF_CALENDAR_URL = "calendar_url"
+CONF_TOKEN_URL = "token_url"
 CONF_SCHOOLSCHEDULE = "schoolschedule"
 CONF_WEEKPLAN = "weekplan"
 CONF_HOMEWORK = "homework"
@@ -65,6 +69,24 @@ CONF_MESSAGES_INTERVAL = "messages_interval"
 CONF_WEEKPLAN_DAYS = "weekplan_days"
 CONF_HOMEWORK_DAYS = "homework_days"
 
+# Rendering configuration keys
+CONF_HTML_CONTENT = "html_content"
+
+# Calendar fetch configuration keys
+CONF_COMBINED_CALENDAR_FETCH = "combined_calendar_fetch"
+
+# Diagnostics configuration keys
+CONF_TRACE_JOURNAL = "trace_journal"
+CONF_BLOCKING_DETECTOR = "blocking_detector"
+CONF_BLOCKING_THRESHOLD = "blocking_threshold_ms"
+CONF_DIAGNOSTICS_LEVEL = "diagnostics_level"
+
+# Calendar diagnostics levels: failures only, per-week summaries, or payload previews
+DIAGNOSTICS_OFF = "off"
+DIAGNOSTICS_SUMMARY = "summary"
+DIAGNOSTICS_FULL = "full"
+DIAGNOSTICS_LEVELS = [DIAGNOSTICS_OFF, DIAGNOSTICS_SUMMARY, DIAGNOSTICS_FULL]
+
 # Default configuration
 DEFAULT_NAME = "EasyIQ"
 DEFAULT_WEEKPLAN_INTERVAL = 900  # 15 minutes
@@ -73,6 +95,15 @@ DEFAULT_PRESENCE_INTERVAL = 300  # 5 minutes
 DEFAULT_MESSAGES_INTERVAL = 300  # 5 minutes
 DEFAULT_WEEKPLAN_DAYS = 5  # 5 business days
 DEFAULT_HOMEWORK_DAYS = 5  # 5 business days
+DEFAULT_HTML_CONTENT = True  # Expose rendered schedule HTML on the child sensor
+DEFAULT_COMBINED_CALENDAR_FETCH = False  # Fetch siblings' calendars in one request
+DEFAULT_TRACE_JOURNAL = False  # Append request and cycle timings to a JSON-lines file
+DEFAULT_BLOCKING_DETECTOR = False  # Time integration code running on the event loop
+DEFAULT_BLOCKING_THRESHOLD = 50  # Milliseconds before a loop section is reported
+DEFAULT_DIAGNOSTICS_LEVEL = DIAGNOSTICS_SUMMARY  # Calendar diagnostics captured per fetch
+
+# Home Assistant bus events
+EVENT_CALENDAR_CHANGED = f"{DOMAIN}_calendar_changed"
 
 # Presence status codes
 PRESENCE_STATUS = {
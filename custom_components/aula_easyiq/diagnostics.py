@@ -0,0 +1,80 @@
+"""Diagnostics download for EasyIQ config entries.
+
+Entity state attributes carry compact summaries only; the full calendar,
+update, setup, and event-loop diagnostics are served here on demand instead
+of being written to the recorder. Personal data is redacted and per-child
+diagnostics are keyed child_1, child_2, ... so the download can be shared.
+"""
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_ACCESS_TOKEN,
+    CONF_AUTH_SESSION_ID,
+    CONF_MITID_USERNAME,
+    CONF_PASSWORD,
+    CONF_REFRESH_TOKEN,
+    CONF_USERNAME,
+    DOMAIN,
+)
+
+# Credentials, names, message content, raw event previews, and Aula ids.
+# The entry title holds the MitID username.
+TO_REDACT = {
+    CONF_ACCESS_TOKEN,
+    CONF_AUTH_SESSION_ID,
+    CONF_MITID_USERNAME,
+    CONF_PASSWORD,
+    CONF_REFRESH_TOKEN,
+    CONF_USERNAME,
+    "available_child_ids",
+    "child_id",
+    "children",
+    "event_id",
+    "event_ids",
+    "login_id",
+    "normalized_sample_event_id",
+    "sample_event_preview",
+    "sender",
+    "subject",
+    "text",
+    "title",
+}
+
+
+def _pseudonymize_children(per_child: Mapping[str, Any]) -> dict[str, Any]:
+    """Key per-child diagnostics by position instead of the Aula child id."""
+    return {f"child_{index}": value for index, value in enumerate(per_child.values(), start=1)}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    coordinator = runtime_data.get("coordinator")
+    data = (coordinator.data if coordinator is not None else None) or {}
+
+    return async_redact_data(
+        {
+            "entry": {
+                "title": entry.title,
+                "version": entry.version,
+                "data": dict(entry.data),
+                "options": dict(entry.options),
+            },
+            "last_update_success": coordinator.last_update_success if coordinator else None,
+            "setup_timings": runtime_data.get("setup_timings", {}),
+            "update_diagnostics": data.get("update_diagnostics", {}),
+            "update_timings": data.get("update_timings", {}),
+            "calendar_diagnostics": _pseudonymize_children(data.get("calendar_diagnostics") or {}),
+            "loop_blocking": data.get("loop_blocking", {}),
+            "message": data.get("message", {}),
+        },
+        TO_REDACT,
+    )
@@ -0,0 +1,222 @@
+"""Per-child calendar event store shared by EasyIQ weekplan and homework views."""
+from __future__ import annotations
+
+import hashlib
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Mapping
+
+
+class ChildEventStore:
+    """Immutable, id-indexed snapshot of one child's normalized calendar events.
+
+    Weekplan, homework, and diagnostics views keep event ids and resolve them
+    through the store instead of holding their own copies of the event list.
+    """
+
+    __slots__ = ("_events", "_index", "_revision", "dates")
+
+    def __init__(
+        self,
+        events: Iterable[dict[str, Any]] = (),
+        *,
+        identity: Callable[[dict[str, Any]], str] | None = None,
+        dates: Iterable[str] = (),
+    ) -> None:
+        """Index events by stable identity, keeping their original order.
+
+        ``dates`` are the ISO dates of the business-day window the events
+        were selected for, used to tell window movement apart from changes.
+        """
+        self.dates: frozenset[str] = frozenset(dates)
+        ordered: list[dict[str, Any]] = []
+        index: dict[str, int] = {}
+        for event in events:
+            event_id = (
+                identity(event)
+                if identity is not None
+                else str(event.get("_easyiq_event_id") or len(ordered))
+            )
+            if event_id in index:
+                continue
+            index[event_id] = len(ordered)
+            ordered.append(event)
+        self._events: tuple[dict[str, Any], ...] = tuple(ordered)
+        self._index: Mapping[str, int] = MappingProxyType(index)
+
+        digest = hashlib.blake2b(digest_size=10)
+        for event_id, event in zip(index, ordered):
+            digest.update(event_id.encode("utf-8"))
+            digest.update(b"=")
+            digest.update(str(event.get("_easyiq_content_hash", "")).encode("utf-8"))
+            digest.update(b";")
+        self._revision = digest.hexdigest()
+
+    def __len__(self) -> int:
+        """Return the number of stored events."""
+        return len(self._events)
+
+    def __contains__(self, event_id: object) -> bool:
+        """Return true when an event id is stored."""
+        return event_id in self._index
+
+    @property
+    def revision(self) -> str:
+        """Return a content hash that changes whenever any stored event changes."""
+        return self._revision
+
+    @property
+    def events(self) -> tuple[dict[str, Any], ...]:
+        """Return all stored events in fetch order."""
+        return self._events
+
+    @property
+    def event_ids(self) -> tuple[str, ...]:
+        """Return all stored event ids in fetch order."""
+        return tuple(self._index)
+
+    def get(self, event_id: str) -> dict[str, Any] | None:
+        """Return a stored event by id."""
+        position = self._index.get(event_id)
+        if position is None:
+            return None
+        return self._events[position]
+
+    def items(self) -> Iterable[tuple[str, dict[str, Any]]]:
+        """Iterate over stored (event id, event) pairs in fetch order."""
+        return zip(self._index, self._events)
+
+    def resolve(
+        self,
+        event_ids: Iterable[str],
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return stored events for ids, skipping ids that are no longer stored."""
+        resolved: list[dict[str, Any]] = []
+        for event_id in event_ids:
+            if limit is not None and len(resolved) >= limit:
+                break
+            position = self._index.get(event_id)
+            if position is not None:
+                resolved.append(self._events[position])
+        return resolved
+
+
+EMPTY_STORE = ChildEventStore()
+
+
+def child_event_store(data: Mapping[str, Any] | None, child_id: str) -> ChildEventStore:
+    """Return the event store for a child from coordinator data."""
+    if not data:
+        return EMPTY_STORE
+    store = (data.get("event_store") or {}).get(child_id)
+    return store if isinstance(store, ChildEventStore) else EMPTY_STORE
+
+
+def view_events(
+    data: Mapping[str, Any] | None,
+    view_key: str,
+    child_id: str,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """Resolve the events referenced by a weekplan or homework view."""
+    if not data:
+        return []
+    view = (data.get(view_key) or {}).get(child_id) or {}
+    return child_event_store(data, child_id).resolve(view.get("event_ids", ()), limit)
+
+
+def view_revision(
+    data: Mapping[str, Any] | None,
+    view_key: str,
+    child_id: str,
+) -> str | None:
+    """Return the revision of a weekplan or homework view, if it has one."""
+    if not data:
+        return None
+    view = (data.get(view_key) or {}).get(child_id) or {}
+    return view.get("revision")
+
+
+def event_summary(event_id: str, event: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the compact event fields published in calendar change events."""
+    return {
+        "id": event_id,
+        "summary": event.get("courses", ""),
+        "activities": event.get("activities", ""),
+        "start": event.get("start", ""),
+        "end": event.get("end", ""),
+        "item_type": event.get("itemType", event.get("ItemType")),
+    }
+
+
+def diff_event_stores(
+    previous: ChildEventStore,
+    current: ChildEventStore,
+    *,
+    in_scope: Callable[[dict[str, Any]], bool] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return added, removed, and changed events between two store snapshots.
+
+    Events are matched by stable id through each store's index, so the cost
+    is linear in the number of events and nothing is re-normalized. An event
+    id includes the event's times, so a removed and an added occurrence of
+    the same payload series are reported as one moved change. Events
+    rejected by ``in_scope`` (for example, days that entered or left the
+    business-day window) are not reported.
+    """
+    diff: dict[str, list[dict[str, Any]]] = {"added": [], "removed": [], "changed": []}
+    if previous.revision == current.revision:
+        return diff
+
+    added: list[tuple[str, dict[str, Any]]] = []
+    for event_id, event in current.items():
+        if in_scope is not None and not in_scope(event):
+            continue
+        old_event = previous.get(event_id)
+        if old_event is None:
+            added.append((event_id, event))
+            continue
+        if old_event.get("_easyiq_content_hash") == event.get("_easyiq_content_hash"):
+            continue
+        diff["changed"].append(_event_change(event_id, event, old_event))
+
+    removed_by_series: dict[str, list[dict[str, Any]]] = {}
+    removed: list[tuple[str, dict[str, Any]]] = []
+    for event_id, event in previous.items():
+        if event_id in current:
+            continue
+        if in_scope is not None and not in_scope(event):
+            continue
+        removed.append((event_id, event))
+        series_id = event.get("_easyiq_series_id")
+        if series_id:
+            removed_by_series.setdefault(series_id, []).append(event)
+
+    moved_from: set[int] = set()
+    for event_id, event in added:
+        candidates = removed_by_series.get(event.get("_easyiq_series_id") or "")
+        if candidates:
+            old_event = candidates.pop(0)
+            moved_from.add(id(old_event))
+            diff["changed"].append(_event_change(event_id, event, old_event))
+            continue
+        diff["added"].append(event_summary(event_id, event))
+
+    for event_id, event in removed:
+        if id(event) not in moved_from:
+            diff["removed"].append(event_summary(event_id, event))
+
+    return diff
+
+
+def _event_change(
+    event_id: str, event: Mapping[str, Any], old_event: Mapping[str, Any]
+) -> dict[str, Any]:
+    change = event_summary(event_id, event)
+    change["previous_start"] = old_event.get("start", "")
+    change["previous_end"] = old_event.get("end", "")
+    change["moved"] = (
+        change["previous_start"] != change["start"]
+        or change["previous_end"] != change["end"]
+    )
+    return change
@@ -0,0 +1,220 @@
+"""Opt-in detector for integration code that blocks the Home Assistant loop.
+
+Sections are synchronous stretches of integration code on the loop: a
+coordinator callback, an entity state write (which evaluates the entity's
+properties), or one step of a coroutine between two awaits. Each section is
+timed; one that runs longer than the threshold is logged with a stack
+summary and counted. While a section runs, a sampler thread takes the loop
+thread's stack once it passes the threshold, so the summary shows where the
+time went rather than only who started the section.
+"""
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+import datetime
+import functools
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Awaitable, Callable, Coroutine, Generator, Iterator, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BLOCKING_THRESHOLD_MS = 50
+STACK_DEPTH = 8
+RECENT_SLOW_SECTIONS = 20
+
+ResultT = TypeVar("ResultT")
+
+
+def _stack_summary(frames: traceback.StackSummary) -> list[str]:
+    return [
+        f"{os.path.basename(frame.filename)}:{frame.lineno} {frame.name}"
+        for frame in frames[-STACK_DEPTH:]
+    ]
+
+
+class _TimedCoroutine:
+    """Awaitable that times every synchronous step of the wrapped coroutine."""
+
+    def __init__(self, detector: LoopBlockingDetector, name: str, coro: Coroutine[Any, Any, Any]) -> None:
+        self._detector = detector
+        self._name = name
+        self._coro = coro
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        value: Any = None
+        error: BaseException | None = None
+        while True:
+            with self._detector.section(self._name):
+                try:
+                    if error is not None:
+                        yielded = self._coro.throw(error)
+                    else:
+                        yielded = self._coro.send(value)
+                except StopIteration as stop:
+                    return stop.value
+            try:
+                value = yield yielded
+                error = None
+            except GeneratorExit:
+                self._coro.close()
+                raise
+            except BaseException as err:  # pylint: disable=broad-except
+                value, error = None, err
+
+
+class LoopBlockingDetector:
+    """Time loop sections, log slow ones with a stack, and keep counts."""
+
+    def __init__(
+        self,
+        threshold_ms: float = DEFAULT_BLOCKING_THRESHOLD_MS,
+        *,
+        clock: Callable[[], float] = time.perf_counter,
+        sample: bool = True,
+    ) -> None:
+        """Initialize; the sampler thread starts with the first section."""
+        self.threshold = threshold_ms / 1000
+        self._clock = clock
+        self._sample = sample
+        self._lock = threading.Lock()
+        self._active: dict[int, list[dict[str, Any]]] = {}
+        self._sections: dict[str, dict[str, float]] = {}
+        self._recent: deque[dict[str, Any]] = deque(maxlen=RECENT_SLOW_SECTIONS)
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        """Time one synchronous section of loop code."""
+        self._ensure_sampler()
+        ident = threading.get_ident()
+        record: dict[str, Any] = {"thread": ident, "started": self._clock(), "stack": None}
+        with self._lock:
+            self._active.setdefault(ident, []).append(record)
+        try:
+            yield
+        finally:
+            elapsed = self._clock() - record["started"]
+            with self._lock:
+                self._active[ident].remove(record)
+                stats = self._sections.setdefault(
+                    name, {"calls": 0, "slow": 0, "total_ms": 0.0, "max_ms": 0.0}
+                )
+                stats["calls"] += 1
+                stats["total_ms"] += elapsed * 1000
+                stats["max_ms"] = max(stats["max_ms"], elapsed * 1000)
+                slow = elapsed >= self.threshold
+                if slow:
+                    stats["slow"] += 1
+            if slow:
+                self._report(name, elapsed, record["stack"])
+
+    def wrap(self, name: str, func: Callable[..., ResultT]) -> Callable[..., ResultT]:
+        """Return ``func`` timed as a section; keeps Home Assistant callback markers."""
+
+        @functools.wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> ResultT:
+            with self.section(name):
+                return func(*args, **kwargs)
+
+        return timed
+
+    def wrap_coroutine_function(
+        self, name: str, func: Callable[..., Coroutine[Any, Any, ResultT]]
+    ) -> Callable[..., Awaitable[ResultT]]:
+        """Return ``func`` with each step between awaits timed as a section."""
+
+        @functools.wraps(func)
+        async def timed(*args: Any, **kwargs: Any) -> ResultT:
+            return await _TimedCoroutine(self, name, func(*args, **kwargs))
+
+        return timed
+
+    def instrument_entity(self, entity: Any) -> None:
+        """Time an entity's coordinator callback, state writes, and event queries."""
+        kind = type(entity).__name__
+        if hasattr(entity, "_handle_coordinator_update"):
+            entity._handle_coordinator_update = self.wrap(
+                f"{kind}._handle_coordinator_update", entity._handle_coordinator_update
+            )
+        entity.async_write_ha_state = self.wrap(f"{kind}.async_write_ha_state", entity.async_write_ha_state)
+        if hasattr(entity, "async_get_events"):
+            entity.async_get_events = self.wrap_coroutine_function(
+                f"{kind}.async_get_events", entity.async_get_events
+            )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return per-section counts and the most recent slow sections."""
+        with self._lock:
+            return {
+                "threshold_ms": round(self.threshold * 1000, 1),
+                "slow_sections": sum(int(stats["slow"]) for stats in self._sections.values()),
+                "sections": {
+                    name: {
+                        "calls": int(stats["calls"]),
+                        "slow": int(stats["slow"]),
+                        "total_ms": round(stats["total_ms"], 1),
+                        "max_ms": round(stats["max_ms"], 1),
+                    }
+                    for name, stats in sorted(self._sections.items())
+                },
+                "recent_slow": list(self._recent),
+            }
+
+    def close(self) -> None:
+        """Stop the sampler thread."""
+        self._stop.set()
+
+    def _report(self, name: str, elapsed: float, stack: list[str] | None) -> None:
+        if stack is None:
+            # The sampler missed it; fall back to who ran the section.
+            stack = _stack_summary(traceback.extract_stack()[:-3])
+        with self._lock:
+            self._recent.append(
+                {
+                    "section": name,
+                    "ms": round(elapsed * 1000, 1),
+                    "at": datetime.datetime.now().isoformat(timespec="seconds"),
+                    "stack": stack,
+                }
+            )
+        _LOGGER.warning(
+            "EasyIQ blocked the event loop for %.0f ms in %s; stack: %s",
+            elapsed * 1000,
+            name,
+            " <- ".join(reversed(stack)),
+        )
+
+    def _ensure_sampler(self) -> None:
+        if not self._sample or self._sampler is not None or self._stop.is_set():
+            return
+        with self._lock:
+            if self._sampler is None:
+                self._sampler = threading.Thread(
+                    target=self._sample_loop, name="easyiq-loop-blocking", daemon=True
+                )
+                self._sampler.start()
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.threshold / 2):
+            now = self._clock()
+            with self._lock:
+                due = [
+                    record
+                    for records in self._active.values()
+                    for record in records
+                    if record["stack"] is None and now - record["started"] >= self.threshold
+                ]
+            if not due:
+                continue
+            frames = sys._current_frames()  # pylint: disable=protected-access
+            for record in due:
+                frame = frames.get(record["thread"])
+                if frame is not None:
+                    record["stack"] = _stack_summary(traceback.extract_stack(frame))
@@ -0,0 +1,137 @@
+"""Local Aula message thread index used for incremental message polling."""
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping
+
+MESSAGE_INDEX_VERSION = 1
+MAX_INDEXED_THREADS = 200
+
+
+def thread_latest_key(thread: Mapping[str, Any]) -> str:
+    """Return the key identifying a thread's latest message."""
+    latest = thread.get("latestMessage") or {}
+    if not isinstance(latest, Mapping):
+        latest = {}
+    for value in (
+        latest.get("id"),
+        thread.get("latestMessageId"),
+        latest.get("sendDateTime"),
+        thread.get("lastUpdatedDate"),
+        thread.get("lastMessageDate"),
+    ):
+        if value not in (None, ""):
+            return str(value)
+    return ""
+
+
+class MessageThreadIndex:
+    """Recency-ordered index of known message threads with a last-seen watermark.
+
+    Threads are stored as ``{"latest": <latest message key>, "read": bool}``
+    in newest-first order. The watermark is the latest message key of the
+    newest thread seen, so a poll can tell whether anything new arrived.
+    """
+
+    def __init__(
+        self,
+        threads: Mapping[str, Mapping[str, Any]] | None = None,
+        watermark: str = "",
+    ) -> None:
+        """Initialize the index from previously stored threads."""
+        self._threads: dict[str, dict[str, Any]] = {
+            str(thread_id): {
+                "latest": str(entry.get("latest", "")),
+                "read": bool(entry.get("read", True)),
+            }
+            for thread_id, entry in (threads or {}).items()
+        }
+        self.watermark = watermark
+        self.dirty = False
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any] | None) -> MessageThreadIndex:
+        """Restore an index from ``as_dict`` output, ignoring unknown versions."""
+        if not isinstance(data, Mapping) or data.get("version") != MESSAGE_INDEX_VERSION:
+            return cls()
+        threads = data.get("threads")
+        return cls(
+            threads if isinstance(threads, Mapping) else None,
+            str(data.get("watermark", "")),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot for persistent storage."""
+        return {
+            "version": MESSAGE_INDEX_VERSION,
+            "watermark": self.watermark,
+            "threads": {thread_id: dict(entry) for thread_id, entry in self._threads.items()},
+        }
+
+    def __len__(self) -> int:
+        """Return the number of indexed threads."""
+        return len(self._threads)
+
+    @property
+    def unread_count(self) -> int:
+        """Return how many indexed threads are unread."""
+        return sum(1 for entry in self._threads.values() if not entry["read"])
+
+    def is_unchanged(self, thread: Mapping[str, Any]) -> bool:
+        """Return true when a thread is known with the same latest message."""
+        entry = self._threads.get(str(thread.get("id", "")))
+        return entry is not None and entry["latest"] == thread_latest_key(thread)
+
+    def apply_threads(
+        self,
+        threads: Iterable[Mapping[str, Any]],
+        *,
+        complete: bool = False,
+    ) -> list[str]:
+        """Merge threads from the newest pages, given newest first.
+
+        Returns the ids of threads whose latest message changed or that were
+        not known before. Threads not on the given pages keep their place
+        after them, with their last known read flag; the index is capped at
+        ``MAX_INDEXED_THREADS``. With ``complete``, the pages are a full
+        sweep and threads not on them are dropped, so a thread read elsewhere
+        beyond the newest pages cannot stay unread in the index.
+        """
+        seen: dict[str, dict[str, Any]] = {}
+        changed: list[str] = []
+        for thread in threads:
+            thread_id = str(thread.get("id", ""))
+            if not thread_id or thread_id in seen:
+                continue
+            entry = {
+                "latest": thread_latest_key(thread),
+                "read": bool(thread.get("read", True)),
+            }
+            previous = self._threads.get(thread_id)
+            if previous is None or previous["latest"] != entry["latest"]:
+                changed.append(thread_id)
+            seen[thread_id] = entry
+
+        if not seen and not complete:
+            return changed
+
+        ordered = dict(seen)
+        for thread_id, entry in () if complete else self._threads.items():
+            if len(ordered) >= MAX_INDEXED_THREADS:
+                break
+            ordered.setdefault(thread_id, entry)
+        if list(ordered.items()) != list(self._threads.items()):
+            self._threads = ordered
+            self.dirty = True
+
+        watermark = next(iter(seen.values()))["latest"] if seen else ""
+        if watermark != self.watermark:
+            self.watermark = watermark
+            self.dirty = True
+        return changed
+
+    def newest_unread(self) -> tuple[str, str] | None:
+        """Return the id and latest message key of the newest unread thread."""
+        for thread_id, entry in self._threads.items():
+            if not entry["read"]:
+                return thread_id, entry["latest"]
+        return None
@@ -0,0 +1,144 @@
+"""Request, cache, and update-cycle counters rendered in Prometheus text format."""
+from __future__ import annotations
+
+from bisect import bisect_left
+import threading
+from typing import Any, Iterable
+
+METRIC_PREFIX = "aula_easyiq_"
+
+# Upper bounds in seconds; request latency and executor wait share them.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CYCLE_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+COUNTERS: dict[str, str] = {
+    "requests_total": "HTTP requests by endpoint and status.",
+    "response_bytes_total": "Response body bytes received by endpoint.",
+    "cache_lookups_total": "Cache lookups by cache and result.",
+    "token_refreshes_total": "Aula access token refreshes by result.",
+    "calendar_variant_probes_total": "Calendar request variant attempts by variant and status.",
+}
+HISTOGRAMS: dict[str, tuple[str, tuple[float, ...]]] = {
+    "request_duration_seconds": ("HTTP request latency by endpoint.", LATENCY_BUCKETS),
+    "update_cycle_duration_seconds": ("Coordinator update cycle duration.", CYCLE_BUCKETS),
+    "executor_wait_seconds": ("Time blocking work waited for an executor thread.", LATENCY_BUCKETS),
+}
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: dict[str, Any] | None) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in (labels or {}).items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Iterable[tuple[str, str]]) -> str:
+    text = ",".join(f'{key}="{_escape(value)}"' for key, value in labels)
+    return f"{{{text}}}" if text else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(int(value)) if float(value).is_integer() else repr(value)
+
+
+class IntegrationMetrics:
+    """Thread-safe counters and histograms for one EasyIQ client.
+
+    Counters and histograms must be declared in ``COUNTERS`` and
+    ``HISTOGRAMS``; the client updates them from executor threads.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[LabelKey, float]] = {name: {} for name in COUNTERS}
+        self._histograms: dict[str, dict[LabelKey, list[Any]]] = {name: {} for name in HISTOGRAMS}
+
+    def inc(self, name: str, labels: dict[str, Any] | None = None, value: float = 1) -> None:
+        """Add ``value`` to a counter series."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters[name]
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: dict[str, Any] | None = None) -> None:
+        """Record one histogram sample."""
+        buckets = HISTOGRAMS[name][1]
+        key = _label_key(labels)
+        index = bisect_left(buckets, value)
+        with self._lock:
+            series = self._histograms[name].get(key)
+            if series is None:
+                # Per-bucket counts, then sum and count.
+                series = self._histograms[name][key] = [[0] * (len(buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def cache_lookup(self, cache: str, hit: bool) -> None:
+        """Count a hit or miss for a named cache."""
+        self.inc("cache_lookups_total", {"cache": cache, "result": "hit" if hit else "miss"})
+
+    def counter_value(self, name: str, labels: dict[str, Any] | None = None) -> float:
+        """Return the current value of one counter series."""
+        with self._lock:
+            return self._counters[name].get(_label_key(labels), 0)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a consistent copy of all series."""
+        with self._lock:
+            return {
+                "counters": {name: dict(series) for name, series in self._counters.items()},
+                "histograms": {
+                    name: {key: [list(value[0]), value[1], value[2]] for key, value in series.items()}
+                    for name, series in self._histograms.items()
+                },
+            }
+
+
+def render_prometheus(sources: dict[str, IntegrationMetrics]) -> str:
+    """Render metrics from several config entries, labelled by ``entry_id``."""
+    snapshots = {entry_id: metrics.snapshot() for entry_id, metrics in sources.items()}
+    lines: list[str] = []
+
+    for name, help_text in COUNTERS.items():
+        lines.append(f"# HELP {METRIC_PREFIX}{name} {help_text}")
+        lines.append(f"# TYPE {METRIC_PREFIX}{name} counter")
+        for entry_id, snapshot in snapshots.items():
+            for key, value in sorted(snapshot["counters"][name].items()):
+                labels = _format_labels((("entry_id", entry_id), *key))
+                lines.append(f"{METRIC_PREFIX}{name}{labels} {_format_value(value)}")
+
+    lines.append(f"# HELP {METRIC_PREFIX}cache_hit_ratio Share of cache lookups that were hits.")
+    lines.append(f"# TYPE {METRIC_PREFIX}cache_hit_ratio gauge")
+    for entry_id, snapshot in snapshots.items():
+        lookups: dict[str, list[float]] = {}
+        for key, value in snapshot["counters"]["cache_lookups_total"].items():
+            labels = dict(key)
+            totals = lookups.setdefault(labels["cache"], [0, 0])
+            totals[0 if labels["result"] == "hit" else 1] += value
+        for cache, (hits, misses) in sorted(lookups.items()):
+            labels = _format_labels((("entry_id", entry_id), ("cache", cache)))
+            lines.append(f"{METRIC_PREFIX}cache_hit_ratio{labels} {_format_value(round(hits / (hits + misses), 4))}")
+
+    for name, (help_text, buckets) in HISTOGRAMS.items():
+        lines.append(f"# HELP {METRIC_PREFIX}{name} {help_text}")
+        lines.append(f"# TYPE {METRIC_PREFIX}{name} histogram")
+        for entry_id, snapshot in snapshots.items():
+            for key, (counts, total, count) in sorted(snapshot["histograms"][name].items()):
+                base = (("entry_id", entry_id), *key)
+                cumulative = 0
+                for bound, bucket_count in zip((*buckets, float("inf")), counts):
+                    cumulative += bucket_count
+                    labels = _format_labels((*base, ("le", _format_value(bound))))
+                    lines.append(f"{METRIC_PREFIX}{name}_bucket{labels} {cumulative}")
+                labels = _format_labels(base)
+                lines.append(f"{METRIC_PREFIX}{name}_sum{labels} {_format_value(round(total, 6))}")
+                lines.append(f"{METRIC_PREFIX}{name}_count{labels} {count}")
+
+    return "\n".join(lines) + "\n"
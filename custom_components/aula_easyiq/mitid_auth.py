@@ -7,11 +7,6 @@ import time
 from typing import Any, Callable, Protocol
 from uuid import uuid4
 
-try:
-    import requests
-except ImportError:  # pragma: no cover - Home Assistant installs requirements.
-    requests = None
-
 try:
     from .const import (
         AUTH_METHOD_MITID,
@@ -141,10 +136,16 @@ class AulaTokenRefresher:
 
     def refresh(self, token_state: AulaTokenState) -> AulaTokenState:
         """Refresh an Aula access token using the refresh token."""
-        if requests is None and self._session_factory is None:
-            raise MitIDAuthRejected("requests is not available")
-
-        session = self._session_factory() if self._session_factory else requests.Session()
+        if self._session_factory is not None:
+            session = self._session_factory()
+        else:
+            # Imported here: refreshes run in executor jobs, and config flows
+            # and tests that never refresh do not need requests at all.
+            try:
+                import requests
+            except ImportError as err:  # pragma: no cover - Home Assistant installs requirements.
+                raise MitIDAuthRejected("requests is not available") from err
+            session = requests.Session()
         response = session.post(
             self.refresh_url,
             data={
@@ -0,0 +1,207 @@
+"""Sanitized HAR-style recording of the client's Aula and EasyIQ traffic.
+
+A ``TrafficRecorder`` passed to ``EasyIQClient`` captures every GET the
+client makes, with its latency, into an HTTP Archive (HAR 1.2) document that
+``scripts/standin_server.py --replay`` serves back with the same timing.
+Tokens are replaced outright. Names, contact details, and message text are
+replaced with stable pseudonyms of the same length, so payload sizes and
+cross-references survive, and every later occurrence of a replaced value
+inside other strings (calendar HTML, for example) is replaced too.
+"""
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import threading
+from typing import Any, Iterable, Mapping
+
+HAR_VERSION = "1.2"
+REDACTED = "redacted"
+
+# Compared case-insensitively. Values under these keys are pseudonymized,
+# including every string nested inside them.
+PERSONAL_KEYS = frozenset(
+    {
+        "address",
+        "answerdirectlyname",
+        "body",
+        "comment",
+        "displayname",
+        "email",
+        "emailaddress",
+        "exitwith",
+        "firstname",
+        "fullname",
+        "homephonenumber",
+        "initials",
+        "lastname",
+        "loginname",
+        "metadata",
+        "mobile",
+        "mobilephonenumber",
+        "name",
+        "phone",
+        "phonenumber",
+        "shortname",
+        "street",
+        "subject",
+        "text",
+        "username",
+        "workphonenumber",
+    }
+)
+TOKEN_KEYS = frozenset(
+    {"access_token", "accesstoken", "authorization", "id_token", "refresh_token", "token"}
+)
+# Aula methods whose whole ``data`` field is a credential.
+TOKEN_METHODS = frozenset({"aulaToken.getAulaToken"})
+# Request headers kept in the bundle; the replay server matches on the x- headers.
+RECORDED_HEADERS = ("accept", "authorization", "x-child", "x-childfilter", "x-login")
+MIN_KNOWN_VALUE_LENGTH = 3
+
+
+def pseudonym(value: str) -> str:
+    """Return a stable stand-in for ``value`` of the same length."""
+    digest = hashlib.sha256(value.encode("utf-8")).hexdigest()
+    return (digest * (len(value) // len(digest) + 1))[: len(value)]
+
+
+class TrafficRecorder:
+    """Collect sanitized request/response pairs in HAR form; thread-safe."""
+
+    def __init__(self, known_values: Iterable[str] = ()) -> None:
+        """Start an empty recording; ``known_values`` are always replaced."""
+        self._lock = threading.Lock()
+        self._entries: list[dict[str, Any]] = []
+        self._known: dict[str, str] = {}
+        for value in known_values:
+            self.add_known_value(value)
+
+    def add_known_value(self, value: str) -> None:
+        """Replace ``value`` wherever it appears in later recorded strings."""
+        if isinstance(value, str) and len(value) >= MIN_KNOWN_VALUE_LENGTH:
+            self._known.setdefault(value, pseudonym(value))
+
+    def __len__(self) -> int:
+        """Return the number of recorded entries."""
+        return len(self._entries)
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        params: Mapping[str, Any] | None,
+        headers: Mapping[str, str] | None,
+        response: Any,
+        elapsed: float,
+    ) -> None:
+        """Add one request and its response, sanitized."""
+        started = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=elapsed)
+        params = dict(params or {})
+        try:
+            body: Any = response.json()
+            is_json = True
+        except Exception:  # pylint: disable=broad-except
+            body = getattr(response, "text", "")
+            is_json = False
+
+        with self._lock:
+            if is_json:
+                if params.get("method") in TOKEN_METHODS and isinstance(body, dict) and "data" in body:
+                    body = {**body, "data": REDACTED}
+                # Learn the payload's personal values first so they are also
+                # replaced where they appear earlier in the same payload.
+                self._collect(body)
+                body = self._sanitize(body)
+                text = json.dumps(body, ensure_ascii=False)
+            else:
+                text = self._replace_known(str(body))
+            self._entries.append(
+                {
+                    "startedDateTime": started.isoformat(),
+                    "time": round(elapsed * 1000, 3),
+                    "request": {
+                        "method": method,
+                        "url": self._replace_known(url.split("?", 1)[0]),
+                        "queryString": [
+                            {"name": str(key), "value": self._sanitize_field(str(key), str(value))}
+                            for key, value in params.items()
+                        ],
+                        "headers": [
+                            {"name": name, "value": self._sanitize_field(name, str(value))}
+                            for name, value in sorted(
+                                (str(key).lower(), value) for key, value in (headers or {}).items()
+                            )
+                            if name in RECORDED_HEADERS
+                        ],
+                    },
+                    "response": {
+                        "status": response.status_code,
+                        "content": {
+                            "size": len(text.encode("utf-8")),
+                            "mimeType": "application/json" if is_json else "text/plain",
+                            "text": text,
+                        },
+                    },
+                    "timings": {"send": 0, "wait": round(elapsed * 1000, 3), "receive": 0},
+                }
+            )
+
+    def as_har(self) -> dict[str, Any]:
+        """Return the recording as a HAR document."""
+        with self._lock:
+            entries = list(self._entries)
+        return {
+            "log": {
+                "version": HAR_VERSION,
+                "creator": {"name": "aula_easyiq", "version": "recording"},
+                "entries": entries,
+            }
+        }
+
+    def save(self, path: str) -> None:
+        """Write the HAR document to ``path``."""
+        with open(path, "w", encoding="utf-8") as bundle:
+            json.dump(self.as_har(), bundle, ensure_ascii=False)
+
+    def _sanitize_field(self, key: str, value: str) -> str:
+        lowered = key.lower()
+        if lowered in TOKEN_KEYS:
+            return f"Bearer {REDACTED}" if value.startswith("Bearer ") else REDACTED
+        if lowered in PERSONAL_KEYS:
+            self.add_known_value(value)
+            return pseudonym(value)
+        return self._replace_known(value)
+
+    def _collect(self, value: Any, personal: bool = False) -> None:
+        if isinstance(value, dict):
+            for key, item in value.items():
+                self._collect(item, personal or str(key).lower() in PERSONAL_KEYS)
+        elif isinstance(value, list):
+            for item in value:
+                self._collect(item, personal)
+        elif personal and isinstance(value, str):
+            self.add_known_value(value)
+
+    def _sanitize(self, value: Any, personal: bool = False) -> Any:
+        if isinstance(value, dict):
+            return {
+                key: REDACTED
+                if str(key).lower() in TOKEN_KEYS and isinstance(item, str)
+                else self._sanitize(item, personal or str(key).lower() in PERSONAL_KEYS)
+                for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [self._sanitize(item, personal) for item in value]
+        if isinstance(value, str):
+            if personal:
+                return pseudonym(value)
+            return self._replace_known(value)
+        return value
+
+    def _replace_known(self, value: str) -> str:
+        for original, replacement in self._known.items():
+            if original in value:
+                value = value.replace(original, replacement)
+        return value
@@ -7,7 +7,7 @@ from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
@@ -25,15 +25,28 @@ from .const import (
     CONF_MESSAGES_INTERVAL,
     CONF_WEEKPLAN_DAYS,
     CONF_HOMEWORK_DAYS,
+    CONF_HTML_CONTENT,
+    CONF_COMBINED_CALENDAR_FETCH,
     DEFAULT_WEEKPLAN_INTERVAL,
     DEFAULT_HOMEWORK_INTERVAL,
     DEFAULT_PRESENCE_INTERVAL,
     DEFAULT_MESSAGES_INTERVAL,
     DEFAULT_WEEKPLAN_DAYS,
     DEFAULT_HOMEWORK_DAYS,
+    DEFAULT_HTML_CONTENT,
+    DEFAULT_COMBINED_CALENDAR_FETCH,
     DOMAIN,
+    EVENT_CALENDAR_CHANGED,
 )
+from .event_store import child_event_store, view_events, view_revision
+from .loop_blocking import LoopBlockingDetector
 from .mitid_auth import MitIDAuthError
+from .state_summary import (
+    calendar_state_key,
+    calendar_summary,
+    loop_blocking_summary,
+    update_summary,
+)
 from .update_policy import should_update_data_type
 
 _LOGGER = logging.getLogger(__name__)
@@ -76,16 +89,32 @@ async def async_setup_entry(
     entities.append(EasyIQStatusSensor(coordinator, status_message))
     
     _LOGGER.info("Adding %d entities to Home Assistant", len(entities))
+    if coordinator.blocking_detector is not None:
+        for entity in entities:
+            coordinator.blocking_detector.instrument_entity(entity)
     async_add_entities(entities)
 
 
 class EasyIQDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the EasyIQ API with configurable intervals."""
 
-    def __init__(self, hass: HomeAssistant, client: EasyIQClient, config_entry) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: EasyIQClient,
+        config_entry,
+        *,
+        blocking_detector: LoopBlockingDetector | None = None,
+    ) -> None:
         """Initialize."""
         self.client = client
         self.config_entry = config_entry
+        self.blocking_detector = blocking_detector
+        if blocking_detector is not None:
+            # Time each synchronous step of the update between its awaits.
+            self._async_update_data = blocking_detector.wrap_coroutine_function(
+                "coordinator_update", self._async_update_data
+            )
         
         # Get update intervals from config
         options = config_entry.options
@@ -102,6 +131,14 @@ class EasyIQDataUpdateCoordinator(DataUpdateCoordinator):
             "homework": options.get(CONF_HOMEWORK_DAYS, DEFAULT_HOMEWORK_DAYS),
         }
         
+        # Schedule HTML is rendered lazily and only when enabled
+        self.html_enabled = options.get(CONF_HTML_CONTENT, DEFAULT_HTML_CONTENT)
+        
+        # Opt-in: try one combined EasyIQ calendar request for all children
+        self.combined_calendar_fetch = options.get(
+            CONF_COMBINED_CALENDAR_FETCH, DEFAULT_COMBINED_CALENDAR_FETCH
+        )
+        
         # Track last update times for each data type
         self.last_updates = {
             "weekplan": None,
@@ -158,6 +195,41 @@ class EasyIQDataUpdateCoordinator(DataUpdateCoordinator):
             # Return True on error to ensure updates continue
             return True
 
+    def _calendar_interval(self, update_weekplan: bool, update_homework: bool) -> int | None:
+        """Return the base interval for distance-based calendar week refreshes."""
+        intervals = [
+            self.update_intervals[data_type]
+            for data_type, due in (("weekplan", update_weekplan), ("homework", update_homework))
+            if due and data_type in self.update_intervals
+        ]
+        return min(intervals) if intervals else None
+
+    def _fire_calendar_change_events(self) -> None:
+        """Publish this cycle's per-child calendar diffs on the event bus."""
+        child_names = {
+            child.get("id"): child.get("name", "Unknown")
+            for child in getattr(self.client, "children", [])
+        }
+        for child_id, changes in getattr(self.client, "calendar_changes", {}).items():
+            self.hass.bus.async_fire(
+                EVENT_CALENDAR_CHANGED,
+                {
+                    "entry_id": self.config_entry.entry_id,
+                    "child_id": child_id,
+                    "child_name": child_names.get(child_id, "Unknown"),
+                    "added": changes.get("added", []),
+                    "removed": changes.get("removed", []),
+                    "changed": changes.get("changed", []),
+                },
+            )
+            _LOGGER.debug(
+                "Calendar changed for child %s: %d added, %d removed, %d changed",
+                child_id,
+                len(changes.get("added", [])),
+                len(changes.get("removed", [])),
+                len(changes.get("changed", [])),
+            )
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library with selective updates based on intervals."""
         try:
@@ -177,7 +249,9 @@ class EasyIQDataUpdateCoordinator(DataUpdateCoordinator):
                 update_presence=update_presence,
                 update_messages=update_messages,
                 weekplan_days=self.days_config["weekplan"],
-                homework_days=self.days_config["homework"]
+                homework_days=self.days_config["homework"],
+                calendar_interval=self._calendar_interval(update_weekplan, update_homework),
+                combined_calendar_fetch=self.combined_calendar_fetch,
             )
             
             # Update last update times for updated data types
@@ -195,14 +269,23 @@ class EasyIQDataUpdateCoordinator(DataUpdateCoordinator):
                 self.last_updates["messages"] = current_time
                 _LOGGER.debug(f"Updated messages timestamp to {current_time}")
             
+            self._fire_calendar_change_events()
+
             data = {
                 "children": self.client.children,
                 "unread_messages": self.client.unread_messages,
                 "message": self.client.message,
+                "message_key": getattr(self.client, 'message_key', None),
                 "weekplan_data": self.client.weekplan_data,
                 "homework_data": getattr(self.client, 'homework_data', {}),
+                "event_store": getattr(self.client, 'event_store', {}),
+                "calendar_changed": dict(getattr(self.client, 'calendar_changed', {})),
                 "presence_data": getattr(self.client, 'presence_data', {}),
                 "update_diagnostics": getattr(self.client, 'update_diagnostics', {}),
+                "update_timings": getattr(self.client, 'update_timings', {}),
+                "loop_blocking": (
+                    self.blocking_detector.as_dict() if self.blocking_detector else {}
+                ),
                 "calendar_diagnostics": getattr(self.client, 'calendar_diagnostics', {}),
                 "last_updates": self.last_updates.copy(),
                 "update_intervals": self.update_intervals.copy(),
@@ -219,19 +302,45 @@ class EasyIQDataUpdateCoordinator(DataUpdateCoordinator):
                 "children": getattr(self.client, 'children', []),
                 "unread_messages": getattr(self.client, 'unread_messages', 0),
                 "message": getattr(self.client, 'message', {"subject": "Error", "text": "Update failed", "sender": "System"}),
+                "message_key": getattr(self.client, 'message_key', None),
                 "weekplan_data": getattr(self.client, 'weekplan_data', {}),
                 "homework_data": getattr(self.client, 'homework_data', {}),
+                "event_store": getattr(self.client, 'event_store', {}),
+                "calendar_changed": dict(getattr(self.client, 'calendar_changed', {})),
                 "presence_data": getattr(self.client, 'presence_data', {}),
                 "update_diagnostics": getattr(self.client, 'update_diagnostics', {}),
+                "update_timings": getattr(self.client, 'update_timings', {}),
+                "loop_blocking": (
+                    self.blocking_detector.as_dict() if self.blocking_detector else {}
+                ),
                 "calendar_diagnostics": getattr(self.client, 'calendar_diagnostics', {}),
                 "last_updates": self.last_updates.copy(),
                 "update_intervals": self.update_intervals.copy(),
             }
 
 
+def _weekplan_state(
+    coordinator: EasyIQDataUpdateCoordinator, child_id: str
+) -> tuple[Any, ...]:
+    """Return what the weekplan sensors show: availability, view revision, and diagnostics.
+
+    The calendar fetch time and refreshed week count are left out, so a cycle
+    that fetched an unchanged week does not write state.
+    """
+    data = coordinator.data or {}
+    return (
+        coordinator.last_update_success,
+        view_revision(data, "weekplan_data", child_id),
+        calendar_state_key((data.get("calendar_diagnostics") or {}).get(child_id)),
+    )
+
+
 class EasyIQChildSensor(CoordinatorEntity, SensorEntity):
     """Representation of an EasyIQ child sensor."""
 
+    # Kept in state for dashboards, but too large to record on every change.
+    _unrecorded_attributes = frozenset({"html_content"})
+
     def __init__(self, coordinator: EasyIQDataUpdateCoordinator, child_id: str, child_name: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -239,6 +348,16 @@ class EasyIQChildSensor(CoordinatorEntity, SensorEntity):
         self._child_name = child_name
         self._attr_name = f"EasyIQ {child_name}"
         self._attr_unique_id = f"easyiq_{child_id}"
+        self._weekplan_state = _weekplan_state(coordinator, child_id)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability or this child's weekplan changed."""
+        weekplan_state = _weekplan_state(self.coordinator, self._child_id)
+        if weekplan_state[1] is not None and weekplan_state == self._weekplan_state:
+            return
+        self._weekplan_state = weekplan_state
+        super()._handle_coordinator_update()
 
     @property
     def state(self) -> str | None:
@@ -263,17 +382,21 @@ class EasyIQChildSensor(CoordinatorEntity, SensorEntity):
             calendar_diagnostics = self.coordinator.data.get("calendar_diagnostics", {}).get(self._child_id, {})
             attributes.update({
                 "week": weekplan_data.get('week', 'Unknown'),
-                "events_count": len(weekplan_data.get('events', [])),
-                "raw_event_count": weekplan_data.get('raw_event_count', len(weekplan_data.get('raw_data', []))),
+                "events_count": len(weekplan_data.get('event_ids', [])),
+                "raw_event_count": weekplan_data.get(
+                    'raw_event_count',
+                    len(child_event_store(self.coordinator.data, self._child_id)),
+                ),
                 "event_type_counts": weekplan_data.get('event_type_counts', {}),
-                "calendar_diagnostics": calendar_diagnostics,
-                "html_content": weekplan_data.get('html_content', ''),
+                "calendar_diagnostics": calendar_summary(calendar_diagnostics),
                 "last_updated": weekplan_data.get('last_updated', 'Unknown')
             })
+            if self.coordinator.html_enabled:
+                attributes["html_content"] = self.coordinator.client.weekplan_html(self._child_id)
             
             # Add first few events as attributes for easy access
-            events = weekplan_data.get('events', [])
-            for i, event in enumerate(events[:5]):  # Limit to first 5 events
+            events = view_events(self.coordinator.data, "weekplan_data", self._child_id, limit=5)
+            for i, event in enumerate(events):  # Limit to first 5 events
                 attributes[f"event_{i+1}_subject"] = event.get('courses', 'Unknown')
                 attributes[f"event_{i+1}_time"] = event.get('start', 'Unknown')
                 attributes[f"event_{i+1}_activities"] = event.get('activities', 'Unknown')
@@ -291,6 +414,16 @@ class EasyIQWeekplanSensor(CoordinatorEntity, SensorEntity):
         self._child_name = child_name
         self._attr_name = f"EasyIQ {child_name} Weekplan"
         self._attr_unique_id = f"easyiq_{child_id}_weekplan"
+        self._weekplan_state = _weekplan_state(coordinator, child_id)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability or this child's weekplan changed."""
+        weekplan_state = _weekplan_state(self.coordinator, self._child_id)
+        if weekplan_state[1] is not None and weekplan_state == self._weekplan_state:
+            return
+        self._weekplan_state = weekplan_state
+        super()._handle_coordinator_update()
 
     @property
     def state(self) -> str | None:
@@ -311,16 +444,16 @@ class EasyIQWeekplanSensor(CoordinatorEntity, SensorEntity):
         if isinstance(weekplan_data, dict):
             calendar_diagnostics = self.coordinator.data.get("calendar_diagnostics", {}).get(self._child_id, {})
             # Include only the most recent events (limit to 10)
-            events = weekplan_data.get("events", [])
-            if isinstance(events, list):
-                limited_weekplan["events"] = events[:10]
-                limited_weekplan["total_events"] = len(events)
+            limited_weekplan["events"] = view_events(
+                self.coordinator.data, "weekplan_data", self._child_id, limit=10
+            )
+            limited_weekplan["total_events"] = len(weekplan_data.get("event_ids", []))
             limited_weekplan["raw_event_count"] = weekplan_data.get(
                 "raw_event_count",
-                len(weekplan_data.get("raw_data", [])),
+                len(child_event_store(self.coordinator.data, self._child_id)),
             )
             limited_weekplan["event_type_counts"] = weekplan_data.get("event_type_counts", {})
-            limited_weekplan["calendar_diagnostics"] = calendar_diagnostics
+            limited_weekplan["calendar_diagnostics"] = calendar_summary(calendar_diagnostics)
             
             # Include summary information
             limited_weekplan["last_updated"] = weekplan_data.get("last_updated")
@@ -368,10 +501,18 @@ class EasyIQStatusSensor(CoordinatorEntity, SensorEntity):
                 "last_exception": str(self.coordinator.last_exception) if self.coordinator.last_exception else None,
             }
 
+        calendar_diagnostics = self.coordinator.data.get("calendar_diagnostics", {})
         return {
             "children_count": len(self.coordinator.data.get("children", [])),
-            "update_diagnostics": self.coordinator.data.get("update_diagnostics", {}),
-            "calendar_diagnostics": self.coordinator.data.get("calendar_diagnostics", {}),
+            "update_diagnostics": update_summary(
+                self.coordinator.data.get("update_diagnostics"),
+                self.coordinator.data.get("update_timings"),
+            ),
+            "loop_blocking": loop_blocking_summary(self.coordinator.data.get("loop_blocking")),
+            "calendar_diagnostics": {
+                child_id: calendar_summary(child_diagnostics)
+                for child_id, child_diagnostics in calendar_diagnostics.items()
+            },
             "last_update_success": self.coordinator.last_update_success,
             "last_exception": str(self.coordinator.last_exception) if self.coordinator.last_exception else None,
         }
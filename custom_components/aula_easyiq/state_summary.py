@@ -0,0 +1,87 @@
+"""Compact summaries of EasyIQ diagnostics for entity state attributes.
+
+The recorder stores every attribute on every state change, so entities keep
+only these summaries; the full diagnostics trees are in the config entry's
+diagnostics download.
+"""
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+# Per-child calendar diagnostics copied into state as they are.
+CALENDAR_SUMMARY_KEYS = (
+    "business_day_event_count",
+    "raw_event_count",
+    "duplicate_event_count",
+    "requested_business_days",
+    "last_updated",
+)
+# Calendar summary fields that change on every fetch, even when the calendar does not.
+CALENDAR_PER_FETCH_KEYS = ("last_updated", "refreshed_weeks")
+# Update diagnostics copied into state as they are.
+UPDATE_SUMMARY_KEYS = (
+    "mode",
+    "children_count",
+    "last_update_started",
+    "last_update_finished",
+    "error",
+)
+
+
+def calendar_summary(child_diagnostics: Mapping[str, Any] | None) -> dict[str, Any]:
+    """Return event counts and the stage of each fetched week for one child."""
+    if not isinstance(child_diagnostics, Mapping):
+        return {}
+    summary = {
+        key: child_diagnostics[key] for key in CALENDAR_SUMMARY_KEYS if key in child_diagnostics
+    }
+    summary["refreshed_weeks"] = len(child_diagnostics.get("refreshed_weeks") or ())
+    week_stages = {
+        offset: week.get("stage")
+        for offset, week in (child_diagnostics.get("week_offsets") or {}).items()
+        if isinstance(week, Mapping)
+    }
+    if week_stages:
+        summary["week_stages"] = week_stages
+    return summary
+
+
+def calendar_state_key(child_diagnostics: Mapping[str, Any] | None) -> dict[str, Any]:
+    """Return the calendar summary without its per-fetch timestamp and counter."""
+    return {
+        key: value
+        for key, value in calendar_summary(child_diagnostics).items()
+        if key not in CALENDAR_PER_FETCH_KEYS
+    }
+
+
+def update_summary(
+    update_diagnostics: Mapping[str, Any] | None,
+    update_timings: Mapping[str, Any] | None,
+) -> dict[str, Any]:
+    """Return the last update's mode, times, outcome, and cycle totals."""
+    summary = {
+        key: update_diagnostics[key]
+        for key in UPDATE_SUMMARY_KEYS
+        if update_diagnostics and key in update_diagnostics
+    }
+    for key in ("total_ms", "network_ms", "requests", "bytes"):
+        if update_timings and key in update_timings:
+            summary[key] = update_timings[key]
+    return summary
+
+
+def loop_blocking_summary(report: Mapping[str, Any] | None) -> dict[str, Any]:
+    """Return the blocking threshold, slow section count, and the slowest section."""
+    if not report:
+        return {}
+    summary = {
+        "threshold_ms": report.get("threshold_ms"),
+        "slow_sections": report.get("slow_sections", 0),
+    }
+    sections = report.get("sections") or {}
+    if sections:
+        name, stats = max(sections.items(), key=lambda item: item[1].get("max_ms", 0.0))
+        summary["slowest_section"] = name
+        summary["slowest_ms"] = stats.get("max_ms", 0.0)
+    return summary
@@ -0,0 +1,182 @@
+"""Per-phase timing spans and rolling percentiles for EasyIQ update cycles."""
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+import threading
+import time
+from typing import Any, Callable, Iterator, TypeVar
+
+# Cycles kept for rolling percentiles and spans kept per cycle.
+TIMING_HISTORY = 50
+MAX_CYCLE_SPANS = 100
+
+ResultT = TypeVar("ResultT")
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the ``pct`` percentile of ``values`` by linear interpolation."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+class CycleTimings:
+    """Timing spans for the current update cycle plus rolling per-phase history.
+
+    Spans nest per thread: a request recorded while spans are open counts
+    toward every open span on that thread, so a calendar week span includes
+    the requests of its variant attempts. Each span reports wall time, the
+    share of it spent waiting on HTTP requests (``network_ms``), request
+    count, and bytes received; the rest is local CPU and scheduling time.
+    """
+
+    def __init__(
+        self,
+        history: int = TIMING_HISTORY,
+        *,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Initialize with no active cycle."""
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._active = False
+        self._started = 0.0
+        self._spans: list[dict[str, Any]] = []
+        self._totals = {"requests": 0, "bytes": 0, "network": 0.0}
+        self._cycle_history: deque[float] = deque(maxlen=history)
+        self._phase_history: dict[str, deque[float]] = {}
+        self._history = history
+
+    def start_cycle(self) -> None:
+        """Begin collecting spans for a new update cycle."""
+        with self._lock:
+            self._active = True
+            self._started = self._clock()
+            self._spans = []
+            self._totals = {"requests": 0, "bytes": 0, "network": 0.0}
+
+    def finish_cycle(self) -> dict[str, Any]:
+        """End the cycle, add it to the rolling history, and return its summary."""
+        with self._lock:
+            total = self._clock() - self._started if self._active else 0.0
+            self._active = False
+            spans = self._spans
+            totals = dict(self._totals)
+
+        phases: dict[str, dict[str, Any]] = {}
+        for span in spans:
+            phase = phases.setdefault(
+                span["phase"],
+                {"count": 0, "ms": 0.0, "network_ms": 0.0, "requests": 0, "bytes": 0},
+            )
+            phase["count"] += 1
+            phase["ms"] = round(phase["ms"] + span["ms"], 1)
+            phase["network_ms"] = round(phase["network_ms"] + span["network_ms"], 1)
+            phase["requests"] += span["requests"]
+            phase["bytes"] += span["bytes"]
+
+        self._cycle_history.append(total)
+        for name, phase in phases.items():
+            self._phase_history.setdefault(name, deque(maxlen=self._history)).append(phase["ms"])
+
+        return {
+            "total_ms": _ms(total),
+            "network_ms": _ms(totals["network"]),
+            "requests": totals["requests"],
+            "bytes": totals["bytes"],
+            "phases": phases,
+            "spans": spans[-MAX_CYCLE_SPANS:],
+        }
+
+    def percentiles(self) -> dict[str, dict[str, float]]:
+        """Return rolling p50/p95 milliseconds for whole cycles and each phase."""
+        result = {
+            "cycle": {
+                "p50_ms": _ms(percentile(list(self._cycle_history), 50)),
+                "p95_ms": _ms(percentile(list(self._cycle_history), 95)),
+                "cycles": len(self._cycle_history),
+            }
+        }
+        for name, values in self._phase_history.items():
+            result[name] = {
+                "p50_ms": round(percentile(list(values), 50), 1),
+                "p95_ms": round(percentile(list(values), 95), 1),
+                "cycles": len(values),
+            }
+        return result
+
+    def _stack(self) -> list[dict[str, Any]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def current_phase(self) -> str | None:
+        """Return the innermost open span's phase on this thread."""
+        stack = self._stack()
+        return stack[-1]["phase"] if stack else None
+
+    @contextmanager
+    def span(self, phase: str, **attributes: Any) -> Iterator[dict[str, Any]]:
+        """Time a phase; the yielded record can take extra attributes."""
+        record: dict[str, Any] = {
+            "phase": phase,
+            **attributes,
+            "ms": 0.0,
+            "network_ms": 0.0,
+            "requests": 0,
+            "bytes": 0,
+        }
+        stack = self._stack()
+        stack.append(record)
+        started = self._clock()
+        try:
+            yield record
+        finally:
+            record["ms"] = _ms(self._clock() - started)
+            record["network_ms"] = round(record["network_ms"], 1)
+            stack.pop()
+            with self._lock:
+                if self._active:
+                    self._spans.append(record)
+
+    def call(self, phase: str, func: Callable[[], ResultT], **attributes: Any) -> ResultT:
+        """Run ``func`` inside a span, for work handed to an executor thread."""
+        with self.span(phase, **attributes):
+            return func()
+
+    def record_request(self, seconds: float, size: int = 0) -> None:
+        """Count one HTTP request toward the open spans and the cycle."""
+        for record in self._stack():
+            record["requests"] += 1
+            record["bytes"] += size
+            record["network_ms"] += seconds * 1000
+        with self._lock:
+            if self._active:
+                self._totals["requests"] += 1
+                self._totals["bytes"] += size
+                self._totals["network"] += seconds
+
+    def summary(self, cycle: dict[str, Any]) -> dict[str, Any]:
+        """Return the compact form of a cycle summary with rolling percentiles."""
+        return {
+            "total_ms": cycle.get("total_ms", 0.0),
+            "network_ms": cycle.get("network_ms", 0.0),
+            "requests": cycle.get("requests", 0),
+            "bytes": cycle.get("bytes", 0),
+            "phases": {
+                name: {"ms": phase["ms"], "network_ms": phase["network_ms"], "requests": phase["requests"]}
+                for name, phase in cycle.get("phases", {}).items()
+            },
+            "percentiles": self.percentiles(),
+        }
@@ -0,0 +1,98 @@
+"""Rotating JSON-lines journal of EasyIQ requests and update cycles.
+
+Lines are buffered in memory by the client's request threads and written in
+one batch per update cycle from an executor job, so the event loop never
+touches the file. Records carry timings, endpoints, statuses, sizes, and
+cache decisions only: no tokens, names, child ids, or payload content.
+"""
+from __future__ import annotations
+
+from collections import deque
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 1024 * 1024
+DEFAULT_BACKUPS = 3
+# Lines kept between flushes; older lines are dropped first.
+MAX_PENDING_LINES = 5000
+
+
+class TraceJournal:
+    """Append compact JSON lines to a size-capped file with numbered backups."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS,
+    ) -> None:
+        """Initialize the journal; nothing is written until ``flush``."""
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.cycle = 0
+        self.dropped = 0
+        self._pending: deque[str] = deque(maxlen=MAX_PENDING_LINES)
+        self._lock = threading.Lock()
+        self._write_failed = False
+
+    def start_cycle(self) -> int:
+        """Number the next update cycle; request lines carry it until the next one."""
+        self.cycle += 1
+        return self.cycle
+
+    def record(self, kind: str, **fields: Any) -> None:
+        """Buffer one line of ``kind`` with the current time and cycle number."""
+        line = json.dumps(
+            {"ts": round(time.time(), 3), "kind": kind, "cycle": self.cycle, **fields},
+            separators=(",", ":"),
+            default=str,
+        )
+        with self._lock:
+            if len(self._pending) == self._pending.maxlen:
+                self.dropped += 1
+            self._pending.append(line)
+
+    def flush(self) -> int:
+        """Write buffered lines, rotating first when the file would pass its cap."""
+        with self._lock:
+            lines = list(self._pending)
+            self._pending.clear()
+        if not lines:
+            return 0
+        data = "".join(f"{line}\n" for line in lines).encode()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                size = self.path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            if size and size + len(data) > self.max_bytes:
+                self._rotate()
+            with self.path.open("ab") as journal:
+                journal.write(data)
+        except OSError as err:
+            if not self._write_failed:
+                _LOGGER.warning("Could not write EasyIQ trace journal %s: %s", self.path, err)
+                self._write_failed = True
+            return 0
+        self._write_failed = False
+        return len(lines)
+
+    def _rotate(self) -> None:
+        if self.backups <= 0:
+            self.path.unlink(missing_ok=True)
+            return
+        for index in range(self.backups - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                source.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        self.path.replace(self.path.with_name(f"{self.path.name}.1"))
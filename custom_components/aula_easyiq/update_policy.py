@@ -25,3 +25,48 @@ def should_update_data_type(
 
     current_time = now or datetime.now()
     return (current_time - last_update).total_seconds() >= interval
+
+
+# Calendar weeks further from today change less often, so they are refreshed
+# at a multiple of the base calendar interval. Past weeks are never refreshed.
+CURRENT_WEEK_MULTIPLIER = 1
+NEXT_WEEK_MULTIPLIER = 4
+LATER_WEEK_MULTIPLIER = 16
+
+
+def calendar_week_interval(base_interval: int, weeks_from_now: int) -> int | None:
+    """Return the refresh interval for a calendar week, or None for past weeks."""
+    if weeks_from_now < 0:
+        return None
+    if weeks_from_now == 0:
+        return base_interval * CURRENT_WEEK_MULTIPLIER
+    if weeks_from_now == 1:
+        return base_interval * NEXT_WEEK_MULTIPLIER
+    return base_interval * LATER_WEEK_MULTIPLIER
+
+
+def should_update_calendar_week(
+    weeks_from_now: int,
+    base_interval: int | None,
+    last_update: datetime | None,
+    now: datetime | None = None,
+) -> bool:
+    """Return whether a fetched calendar week is due for refresh.
+
+    Follows ``should_update_data_type``: weeks never fetched and a missing or
+    non-positive base interval always update. Past weeks that were fetched
+    once are kept as they are.
+    """
+    if base_interval is None:
+        return True
+
+    interval = calendar_week_interval(base_interval, weeks_from_now)
+    if interval is None:
+        return last_update is None
+
+    return should_update_data_type(
+        "calendar_week",
+        {"calendar_week": interval},
+        {"calendar_week": last_update},
+        now,
+    )
@@ -1,4 +1,4 @@
-"""Home Assistant HTTP views for EasyIQ MitID auth status."""
+"""Home Assistant HTTP views for EasyIQ MitID auth status and metrics."""
 from __future__ import annotations
 
 from html import escape
@@ -14,20 +14,23 @@ from .const import (
     CONF_TOKEN_EXPIRES_AT,
     DOMAIN,
 )
+from .metrics import render_prometheus
 from .mitid_auth import AulaTokenState, MitIDAuthRejected, get_auth_manager
 
 
 VIEW_REGISTERED = "mitid_auth_views_registered"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
 
 
 async def async_register_auth_views(hass: HomeAssistant) -> None:
-    """Register MitID auth status views once."""
+    """Register MitID auth status views and the metrics view once."""
     hass.data.setdefault(DOMAIN, {})
     if hass.data[DOMAIN].get(VIEW_REGISTERED):
         return
 
     hass.http.register_view(MitIDAuthStatusView())
     hass.http.register_view(MitIDAuthCompleteView())
+    hass.http.register_view(EasyIQMetricsView())
     hass.data[DOMAIN][VIEW_REGISTERED] = True
 
 
@@ -102,6 +105,27 @@ class MitIDAuthCompleteView(HomeAssistantView):
         return web.json_response(session.as_status())
 
 
+class EasyIQMetricsView(HomeAssistantView):
+    """Expose request, cache, and update-cycle metrics in Prometheus text format."""
+
+    url = "/api/aula_easyiq/metrics"
+    name = "api:aula_easyiq:metrics"
+    requires_auth = True
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return metrics for every loaded config entry, labelled by entry id."""
+        runtime = request.app["hass"].data.get(DOMAIN, {})
+        sources = {
+            entry_id: data["client"].metrics
+            for entry_id, data in runtime.items()
+            if isinstance(data, dict) and hasattr(data.get("client"), "metrics")
+        }
+        return web.Response(
+            body=render_prometheus(sources).encode(),
+            headers={"Content-Type": PROMETHEUS_CONTENT_TYPE},
+        )
+
+
 def _render_auth_page(title: str, message: str, *, status: str = "pending") -> str:
     """Render a small browser-friendly page for the external auth step."""
     safe_title = escape(title)
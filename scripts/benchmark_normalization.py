@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Benchmark EasyIQ calendar normalization and rendering on synthetic payloads.
+
+Times each stage of turning a ``CalendarGetWeekplanEvents`` payload into what
+the entities show, at several payload sizes, and reports events per second
+and peak traced memory:
+
+    extract    _extract_calendar_event_list without normalization (wrappers)
+    normalize  _normalize_calendar_event for every row
+    filter     business-day filtering of normalized events
+    html       weekplan HTML building
+    calendar   calendar entity event parsing (needs Home Assistant installed)
+
+Results can be saved as a baseline and later runs compared against it:
+
+    python scripts/benchmark_normalization.py --update-baseline
+    python scripts/benchmark_normalization.py --sizes 100 1000 10000 100000
+
+A run fails when any stage is slower than the baseline by more than
+``--tolerance``. Baselines are machine-specific; refresh them on the machine
+that runs the comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import calendar  # noqa: F401 - load stdlib calendar before the integration dir is on sys.path
+import datetime
+import gc
+import importlib.util
+import json
+from pathlib import Path
+import platform
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+ROOT = SCRIPTS_DIR.parent
+INTEGRATION_DIR = ROOT / "custom_components" / "aula_easyiq"
+DEFAULT_BASELINE = SCRIPTS_DIR / "benchmark_normalization_baseline.json"
+DEFAULT_SIZES = (100, 1000, 10000)
+STAGES = ("extract", "normalize", "filter", "html", "calendar")
+BUSINESS_DAYS = 5
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from synthetic_calendar import calendar_rows, wrap_payload  # noqa: E402
+
+
+def load_client_module() -> Any:
+    """Load the integration client module without importing Home Assistant."""
+    sys.path.insert(0, str(INTEGRATION_DIR))
+    spec = importlib.util.spec_from_file_location("easyiq_client_benchmark", INTEGRATION_DIR / "client.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_calendar_parser() -> Callable[[dict[str, Any]], Any] | None:
+    """Return the weekplan calendar entity parser, or None without Home Assistant."""
+    sys.path.insert(0, str(ROOT))
+    try:
+        from custom_components.aula_easyiq.calendar import EasyIQWeekplanCalendarEntity
+    except ImportError:
+        return None
+    parse = EasyIQWeekplanCalendarEntity._parse_weekplan_event
+    return lambda event: parse(None, event)
+
+
+def _best_time(run: Callable[[], Any], repeat: int) -> float:
+    """Return the fastest per-call time, looping fast stages for stable numbers."""
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _peak_memory(run: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    *,
+    repeat: int = 3,
+    description_bytes: int = 200,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Run every stage at every size and return the results document."""
+    client_module = load_client_module()
+    client = client_module.EasyIQClient("benchmark", None)
+    parse_calendar_event = load_calendar_parser()
+    results: dict[str, dict[str, dict[str, float]]] = {stage: {} for stage in STAGES}
+
+    for size in sizes:
+        rows = calendar_rows(size, description_bytes=description_bytes, seed=seed)
+        payload = wrap_payload(rows, "nested")
+        normalized = [client_module._normalize_calendar_event(row) for row in rows]
+        weekplan = client_module._events_of_types(normalized, client_module._WEEKPLAN_EVENT_TYPES)
+
+        stages: dict[str, Callable[[], Any]] = {
+            "extract": lambda: client_module._extract_calendar_event_list(payload, normalize=False),
+            "normalize": lambda: [client_module._normalize_calendar_event(row) for row in rows],
+            "filter": lambda: client._filter_events_by_days(normalized, BUSINESS_DAYS),
+            "html": lambda: client._build_weekplan_html(weekplan, BUSINESS_DAYS),
+        }
+        if parse_calendar_event is not None:
+            stages["calendar"] = lambda: [parse_calendar_event(event) for event in weekplan]
+
+        for stage, run in stages.items():
+            seconds = _best_time(run, repeat)
+            stage_events = len(weekplan) if stage in ("html", "calendar") else size
+            results[stage][str(size)] = {
+                "seconds": round(seconds, 6),
+                "events_per_second": round(stage_events / seconds, 1) if seconds > 0 else float("inf"),
+                "peak_bytes": _peak_memory(run),
+            }
+
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "description_bytes": description_bytes,
+        "seed": seed,
+        "results": {stage: values for stage, values in results.items() if values},
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Return a line per stage and size that is slower than the baseline allows."""
+    regressions: list[str] = []
+    for stage, sizes in current["results"].items():
+        for size, result in sizes.items():
+            reference = baseline.get("results", {}).get(stage, {}).get(size)
+            if not reference:
+                continue
+            floor = reference["events_per_second"] * (1 - tolerance)
+            if result["events_per_second"] < floor:
+                regressions.append(
+                    f"{stage} @ {size}: {result['events_per_second']:.0f} events/s "
+                    f"< {floor:.0f} (baseline {reference['events_per_second']:.0f})"
+                )
+    return regressions
+
+
+def format_report(current: dict[str, Any], baseline: dict[str, Any] | None) -> str:
+    """Return a plain-text table of the results, with baseline ratios when known."""
+    lines = [f"{'stage':<10} {'events':>8} {'events/s':>12} {'peak KiB':>10} {'vs base':>8}"]
+    for stage, sizes in current["results"].items():
+        for size, result in sizes.items():
+            reference = (baseline or {}).get("results", {}).get(stage, {}).get(size)
+            ratio = (
+                f"{result['events_per_second'] / reference['events_per_second']:.2f}x"
+                if reference
+                else "-"
+            )
+            lines.append(
+                f"{stage:<10} {size:>8} {result['events_per_second']:>12.0f} "
+                f"{result['peak_bytes'] / 1024:>10.0f} {ratio:>8}"
+            )
+    if "calendar" not in current["results"]:
+        lines.append("calendar: skipped (Home Assistant is not installed)")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and compare it with, or store it as, the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage; the fastest counts")
+    parser.add_argument("--description-bytes", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", type=Path, help="also write this run's results here")
+    args = parser.parse_args(argv)
+
+    current = run_benchmarks(
+        tuple(args.sizes),
+        repeat=args.repeat,
+        description_bytes=args.description_bytes,
+        seed=args.seed,
+    )
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    print(format_report(current, baseline))
+
+    if args.json:
+        args.json.write_text(json.dumps(current, indent=2) + "\n")
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(current, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if baseline is None:
+        print("No baseline to compare against; run with --update-baseline first")
+        return 0
+
+    regressions = compare(current, baseline, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Benchmark EasyIQ integration import and config entry setup time.
+
+Import time is measured in fresh interpreters, one per repetition, so
+nothing is already cached in ``sys.modules``. Each target also reports which
+heavy third-party packages it pulled in; none of them should appear until
+they are first used:
+
+    client        client.py and mitid_auth.py loaded standalone (no Home Assistant)
+    integration   the integration package and its three platforms
+    config_flow   the config flow module
+
+``async_setup_entry`` is timed in a fresh test Home Assistant instance per
+repetition, with a fixture-mode entry pointed at the stand-in server's
+fixture documents (scripts/standin_server.py), for households of 1, 4, and
+10 children. The integration records each setup phase itself: view
+registration, client construction, the first refresh, and platform
+forwarding. The p95 of every phase and of the whole setup is compared with
+a stored baseline, and the run fails when any of them is slower than the
+baseline by more than ``--tolerance``:
+
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --repeat 10 --children 1 4 --json startup.json
+    python scripts/benchmark_startup.py --tolerance 2.0
+    python scripts/benchmark_startup.py --update-budget --runs 15
+
+Each run of ``--repeat`` setups happens in a fresh interpreter, so every run
+pays the same first import of the platforms. ``--update-budget`` stores, per
+phase, the median over ``--runs`` of each run's p95, with the command, the
+hardware and versions, and every run's p95 it was computed from.
+
+Both runs also time a fixed standard-library workload that uses none of the
+integration's code. The baseline is scaled by how much slower or faster this
+host runs it than the host that wrote the baseline, so a slower machine is
+not reported as a regression. A phase may then be ``--tolerance`` slower
+(1.0 = 100%), and always ``--min-margin`` ms, so sub-millisecond phases are
+not failed by noise. The scaling only corrects for CPU speed; refresh the
+baseline on the machine that runs the check for tight tolerances.
+
+The ``integration`` and ``config_flow`` targets and the setup measurement need
+the development requirements (pip install -r requirements-dev.txt); without
+them only the ``client`` target runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import datetime
+from importlib import metadata
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+ROOT = SCRIPTS_DIR.parent
+INTEGRATION_DIR = ROOT / "custom_components" / "aula_easyiq"
+DOMAIN = "aula_easyiq"
+DEFAULT_BUDGET = SCRIPTS_DIR / "benchmark_startup_budget.json"
+DEFAULT_CHILDREN = (1, 4, 10)
+# Phases recorded by async_setup_entry in runtime data under "setup_timings".
+SETUP_PHASES = ("register_views", "client", "first_refresh", "forward_platforms", "total")
+
+# Packages the integration should only import when it first needs them.
+HEAVY_MODULES = ("requests", "urllib3", "pytz", "bs4", "lxml", "Crypto", "qrcode")
+
+# Each snippet prints one JSON line: import seconds and newly loaded heavy modules.
+_IMPORT_SNIPPETS = {
+    "client": """
+import calendar  # stdlib calendar before the integration dir shadows it
+import sys
+sys.path.insert(0, {integration_dir!r})
+""",
+    "integration": """
+import sys
+sys.path.insert(0, {root!r})
+import homeassistant.core
+import homeassistant.helpers.update_coordinator
+import homeassistant.components.calendar
+""",
+    "config_flow": """
+import sys
+sys.path.insert(0, {root!r})
+import homeassistant.config_entries
+import voluptuous
+""",
+}
+_IMPORT_TARGETS = {
+    "client": ("client", "mitid_auth"),
+    "integration": (
+        "custom_components.aula_easyiq",
+        "custom_components.aula_easyiq.sensor",
+        "custom_components.aula_easyiq.binary_sensor",
+        "custom_components.aula_easyiq.calendar",
+    ),
+    "config_flow": ("custom_components.aula_easyiq.config_flow",),
+}
+_MEASURE = """
+import importlib, json, time
+heavy = {heavy!r}
+before = {{name for name in heavy if name in sys.modules}}
+started = time.perf_counter()
+for name in {modules!r}:
+    importlib.import_module(name)
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "seconds": elapsed,
+    "heavy": sorted(name for name in heavy if name in sys.modules and name not in before),
+}}))
+"""
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from load_harness import distribution, standin_backend  # noqa: E402
+
+
+def import_once(target: str) -> dict[str, Any]:
+    """Import ``target`` in a fresh interpreter and return its measurement."""
+    code = _IMPORT_SNIPPETS[target].format(
+        integration_dir=str(INTEGRATION_DIR), root=str(ROOT)
+    ) + _MEASURE.format(heavy=HEAVY_MODULES, modules=_IMPORT_TARGETS[target])
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=str(ROOT),
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else target)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure_imports(target: str, repeat: int) -> dict[str, Any]:
+    """Return import time percentiles and heavy modules for ``target``."""
+    samples = [import_once(target) for _ in range(repeat)]
+    return {
+        "seconds": distribution([sample["seconds"] for sample in samples]),
+        "heavy_modules": sorted({name for sample in samples for name in sample["heavy"]}),
+    }
+
+
+async def measure_setup(repeat: int, base_url: str) -> dict[str, Any]:
+    """Time ``async_setup_entry`` phases for one fixture-mode entry."""
+    # Import this repo's custom_components before the test instance puts its
+    # own testing_config/custom_components first on sys.path. The test helpers
+    # import homeassistant.core, which loader needs first.
+    sys.path.insert(0, str(ROOT))
+    import custom_components  # noqa: F401
+    from pytest_homeassistant_custom_component.common import (
+        MockConfigEntry,
+        async_test_home_assistant,
+    )
+    from homeassistant import loader
+
+    phases: dict[str, list[float]] = {phase: [] for phase in SETUP_PHASES}
+    loaded = 0
+    for _ in range(repeat):
+        async with async_test_home_assistant() as hass:
+            # Let the loader find custom_components/ on sys.path.
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                version=2,
+                title="Household",
+                data={"mitid_username": "fixture", "fixture_base_url": base_url},
+            )
+            entry.add_to_hass(hass)
+            if await hass.config_entries.async_setup(entry.entry_id):
+                await hass.async_block_till_done()
+                loaded += 1
+                timings = hass.data[DOMAIN][entry.entry_id]["setup_timings"]
+                for phase in SETUP_PHASES:
+                    phases[phase].append(timings.get(phase, 0.0))
+                await hass.config_entries.async_unload(entry.entry_id)
+                await hass.async_block_till_done()
+    return {"loaded": loaded, "repeat": repeat, "samples_ms": phases}
+
+
+def _setup_run(repeat: int, base_url: str) -> dict[str, Any]:
+    """Run ``measure_setup`` in a worker process's own event loop."""
+    return asyncio.run(measure_setup(repeat, base_url))
+
+
+def measure_setup_runs(runs: int, repeat: int, base_url: str) -> dict[str, Any]:
+    """Return setup percentiles over all runs and the p95 of each run.
+
+    Every run is a fresh interpreter, so each one pays the first import of the
+    platforms the same way Home Assistant does at startup.
+    """
+    results = []
+    for _ in range(runs):
+        with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results.append(pool.submit(_setup_run, repeat, base_url).result())
+    return {
+        "loaded": sum(result["loaded"] for result in results),
+        "repeat": sum(result["repeat"] for result in results),
+        "phases_ms": {
+            phase: distribution([value for result in results for value in result["samples_ms"][phase]])
+            for phase in SETUP_PHASES
+        },
+        "run_p95_ms": {
+            phase: [distribution(result["samples_ms"][phase])["p95"] for result in results if result["loaded"]]
+            for phase in SETUP_PHASES
+        },
+    }
+
+
+def budget_key(children: int, phase: str) -> str:
+    """Return the budget entry name for a phase at a household size."""
+    return f"{children}_children/{phase}"
+
+
+def over_budget(report: dict[str, Any], budget: dict[str, float]) -> list[str]:
+    """Return a message for every budgeted setup phase whose p95 is over budget."""
+    failures = []
+    for children, setup in report.get("setup", {}).items():
+        if setup["loaded"] < setup["repeat"]:
+            failures.append(f"{children} children: {setup['repeat'] - setup['loaded']} setups failed")
+        for phase, values in setup["phases_ms"].items():
+            limit = budget.get(budget_key(int(children), phase))
+            if limit is not None and values["count"] and values["p95"] > limit:
+                failures.append(
+                    f"{children} children {phase}: p95 {values['p95']:.1f}ms > budget {limit:.1f}ms"
+                )
+    return failures
+
+
+def calibrate(repeat: int = 5) -> float:
+    """Return the median ms of a fixed standard-library workload on this host.
+
+    It runs none of the integration's code, so a regression in the
+    integration does not move the calibration with it.
+    """
+    payload = [
+        {"id": index, "start": f"2026-10-{index % 28 + 1:02d}T08:00:00", "title": "x" * (index % 40)}
+        for index in range(20000)
+    ]
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decoded = json.loads(json.dumps(payload))
+        decoded.sort(key=lambda event: (event["start"], event["id"]))
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def baseline_from_report(report: dict[str, Any]) -> dict[str, float]:
+    """Return the median per-run p95 of every measured phase."""
+    return {
+        budget_key(int(children), phase): round(statistics.median(run_p95), 2)
+        for children, setup in report.get("setup", {}).items()
+        for phase, run_p95 in setup["run_p95_ms"].items()
+        if run_p95
+    }
+
+
+def budget_limits(
+    document: dict[str, Any], calibration_ms: float, tolerance: float, min_margin: float
+) -> dict[str, float]:
+    """Return the p95 limit of every phase on this host.
+
+    The baseline is scaled by this host's calibration against the one stored
+    with it, then allowed ``tolerance`` slowdown and at least ``min_margin`` ms.
+    """
+    stored_calibration = document.get("calibration_ms")
+    scale = calibration_ms / stored_calibration if stored_calibration else 1.0
+    limits = {}
+    for key, baseline in document.get("baseline_ms", {}).items():
+        expected = baseline * scale
+        limits[key] = round(max(expected * (1 + tolerance), expected + min_margin), 1)
+    return limits
+
+
+def budget_document(
+    report: dict[str, Any], args: argparse.Namespace, argv: list[str]
+) -> dict[str, Any]:
+    """Return the baseline with the command, hardware, and versions it was measured with."""
+    versions = {}
+    for package in ("homeassistant", "pytest-homeassistant-custom-component"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "command": " ".join(["python", "scripts/benchmark_startup.py", *argv]),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "packages": versions,
+        "runs": args.runs,
+        "repeat": args.repeat,
+        "calibration_ms": round(report["calibration_ms"], 2),
+        "run_p95_ms": {
+            budget_key(int(children), phase): run_p95
+            for children, setup in report.get("setup", {}).items()
+            for phase, run_p95 in setup["run_p95_ms"].items()
+        },
+        "baseline_ms": baseline_from_report(report),
+    }
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Return a readable summary of a startup report."""
+    lines = []
+    if "calibration_ms" in report:
+        stored = report.get("baseline_calibration_ms")
+        lines += [
+            f"host calibration {report['calibration_ms']:.1f} ms"
+            + (f" (baseline host {stored:.1f} ms)" if stored else ""),
+            "",
+        ]
+    lines.append(f"{'import target':<14} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}  heavy modules loaded")
+    for target, values in report["imports"].items():
+        if "error" in values:
+            lines.append(f"{target:<14} skipped: {values['error']}")
+            continue
+        seconds = values["seconds"]
+        lines.append(
+            f"{target:<14} {seconds['p50'] * 1000:>9.1f} {seconds['p95'] * 1000:>9.1f} "
+            f"{seconds['max'] * 1000:>9.1f}  {', '.join(values['heavy_modules']) or '-'}"
+        )
+    for children, setup in report.get("setup", {}).items():
+        lines += [
+            "",
+            f"async_setup_entry, {children} children ({setup['loaded']}/{setup['repeat']} loaded)",
+            f"{'phase':<18} {'p50 ms':>9} {'p95 ms':>9} {'budget':>9}",
+        ]
+        for phase, values in setup["phases_ms"].items():
+            limit = report.get("budget", {}).get(budget_key(int(children), phase))
+            lines.append(
+                f"{phase:<18} {values['p50']:>9.1f} {values['p95']:>9.1f} "
+                f"{'-' if limit is None else f'{limit:.1f}':>9}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the startup benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--runs", type=int, default=1, help="fresh interpreters of --repeat setups each")
+    parser.add_argument("--targets", nargs="+", choices=sorted(_IMPORT_TARGETS), default=list(_IMPORT_TARGETS))
+    parser.add_argument("--children", type=int, nargs="+", default=list(DEFAULT_CHILDREN), help="household sizes to set up")
+    parser.add_argument("--latency", type=float, default=0.0, help="stand-in backend latency per request")
+    parser.add_argument("--no-setup", action="store_true", help="only measure imports")
+    parser.add_argument("--budget", type=Path, default=DEFAULT_BUDGET)
+    parser.add_argument("--update-budget", action="store_true", help="store the median per-run p95 as the baseline")
+    parser.add_argument("--tolerance", type=float, default=1.0, help="allowed slowdown over the scaled baseline, 1.0 = 100%%")
+    parser.add_argument("--min-margin", type=float, default=5.0, help="least ms a phase may be over the scaled baseline")
+    parser.add_argument("--json", type=Path, help="also write the report here")
+    argv = sys.argv[1:] if argv is None else argv
+    args = parser.parse_args(argv)
+
+    report: dict[str, Any] = {"repeat": args.repeat, "calibration_ms": calibrate(), "imports": {}}
+    for target in args.targets:
+        try:
+            report["imports"][target] = measure_imports(target, args.repeat)
+        except RuntimeError as err:
+            report["imports"][target] = {"error": str(err)}
+
+    if not args.no_setup:
+        try:
+            import pytest_homeassistant_custom_component  # noqa: F401
+        except ImportError:
+            print("Setup timing needs the development requirements: pip install -r requirements-dev.txt", file=sys.stderr)
+            return 1
+        report["setup"] = {}
+        for children in args.children:
+            backend_args = argparse.Namespace(
+                children=children, latency=args.latency, jitter=0.0, error_rate=0.0, description_bytes=200
+            )
+            with standin_backend(backend_args) as base_url:
+                report["setup"][str(children)] = measure_setup_runs(args.runs, args.repeat, base_url)
+
+    if args.update_budget:
+        document = budget_document(report, args, argv)
+        args.budget.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+        print(f"Wrote budget to {args.budget}")
+    else:
+        document = json.loads(args.budget.read_text()) if args.budget.exists() else {}
+    report["baseline_calibration_ms"] = document.get("calibration_ms")
+    budget = budget_limits(document, report["calibration_ms"], args.tolerance, args.min_margin)
+    report["budget"] = budget
+
+    print(format_report(report))
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+
+    failures = [] if args.update_budget else over_budget(report, budget)
+    for failure in failures:
+        print(f"OVER BUDGET: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -80,7 +80,6 @@ requests>=2.28.0
 aiohttp>=3.8.0
 beautifulsoup4>=4.11.0
 lxml>=4.9.0
-pytz>=2023.3
 
 # Development tools
 pytest>=7.0.0
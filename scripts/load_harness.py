@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+End-to-end update-cycle load harness for the EasyIQ integration.
+
+Starts the local stand-in backend (scripts/standin_server.py), sets up N
+EasyIQ config entries with M children each in a test Home Assistant instance,
+forwards the sensor, binary sensor, and calendar platforms, and then runs
+update cycles for every coordinator at once. It reports:
+
+- cycle duration percentiles, per entry and for the whole cycle
+- event-loop lag while cycles run
+- default executor queue depth (the client's blocking requests run there)
+- resident memory per set-up entry
+- backend requests per cycle and per entry
+
+    python scripts/load_harness.py --entries 10 --children 3 --cycles 5 --latency 0.05
+
+Needs the development requirements (Home Assistant and
+pytest-homeassistant-custom-component): pip install -r requirements-dev.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import resource
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, Iterator
+import urllib.request
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+ROOT = SCRIPTS_DIR.parent
+STANDIN_SERVER = SCRIPTS_DIR / "standin_server.py"
+DOMAIN = "aula_easyiq"
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the ``pct`` percentile of ``values`` by linear interpolation."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def distribution(values: list[float]) -> dict[str, float]:
+    """Return count, p50, p95, p99, and max of a list of samples."""
+    return {
+        "count": len(values),
+        "p50": round(percentile(values, 50), 4),
+        "p95": round(percentile(values, 95), 4),
+        "p99": round(percentile(values, 99), 4),
+        "max": round(max(values, default=0.0), 4),
+    }
+
+
+def resident_memory() -> int:
+    """Return the process resident set size in bytes, or peak RSS where unavailable."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class LoopMonitor:
+    """Sample event-loop lag and default executor queue depth while running."""
+
+    interval: float = 0.01
+    lag: list[float] = field(default_factory=list)
+    queue_depth: list[int] = field(default_factory=list)
+    _task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start sampling on the running loop."""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lag.append(max(0.0, loop.time() - started - self.interval))
+            executor = getattr(loop, "_default_executor", None)
+            work_queue = getattr(executor, "_work_queue", None)
+            if work_queue is not None:
+                self.queue_depth.append(work_queue.qsize())
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def backend_stats(base_url: str) -> dict[str, Any]:
+    """Return the stand-in backend's request counters."""
+    with urllib.request.urlopen(f"{base_url}/stats", timeout=5) as response:
+        return json.load(response)
+
+
+@contextmanager
+def standin_backend(args: argparse.Namespace) -> Iterator[str]:
+    """Run the stand-in server in a subprocess and yield its base URL."""
+    port = _free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            str(STANDIN_SERVER),
+            "--port",
+            str(port),
+            "--children",
+            str(args.children),
+            "--latency",
+            str(args.latency),
+            "--jitter",
+            str(args.jitter),
+            "--error-rate",
+            str(args.error_rate),
+            "--description-bytes",
+            str(args.description_bytes),
+        ],
+        stdout=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 15
+        while True:
+            try:
+                backend_stats(base_url)
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise SystemExit("Stand-in server did not start")
+                time.sleep(0.1)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def entry_data(index: int, base_url: str) -> dict[str, Any]:
+    """Return config entry data for one simulated household."""
+    return {
+        "mitid_username": f"guardian{index}@example.test",
+        "access_token": "standin-access",
+        "refresh_token": "standin-refresh",
+        "token_expires_at": time.time() + 86400,
+        "api_base_url": f"{base_url}/api/v",
+        "calendar_url": f"{base_url}/Calendar/CalendarGetWeekplanEvents",
+        "token_url": f"{base_url}/oidc/token",
+    }
+
+
+def entry_options(interval: int) -> dict[str, Any]:
+    """Return options that make every data type due at ``interval`` seconds."""
+    return {
+        "weekplan_interval": interval,
+        "homework_interval": interval,
+        "presence_interval": interval,
+        "messages_interval": interval,
+    }
+
+
+async def run_harness(args: argparse.Namespace, base_url: str) -> dict[str, Any]:
+    """Set up the entries, run the cycles, and return the measurements."""
+    # Import this repo's custom_components before the test instance puts its
+    # own testing_config/custom_components first on sys.path.
+    sys.path.insert(0, str(ROOT))
+    import custom_components  # noqa: F401
+    from pytest_homeassistant_custom_component.common import (
+        MockConfigEntry,
+        async_test_home_assistant,
+    )
+    from homeassistant import loader
+    from homeassistant.setup import async_setup_component
+
+    monitor = LoopMonitor()
+    report: dict[str, Any] = {
+        "entries": args.entries,
+        "children": args.children,
+        "cycles": args.cycles,
+    }
+
+    async with async_test_home_assistant() as hass:
+        # Let the loader find custom_components/ on sys.path.
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+        entries = [
+            MockConfigEntry(
+                domain=DOMAIN,
+                version=2,
+                title=f"Household {index}",
+                data=entry_data(index, base_url),
+                options=entry_options(args.interval),
+            )
+            for index in range(args.entries)
+        ]
+        for entry in entries:
+            entry.add_to_hass(hass)
+
+        memory_before = resident_memory()
+        requests_before = (await asyncio.to_thread(backend_stats, base_url))["total"]
+        monitor.start()
+        setup_started = time.perf_counter()
+        await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+        report["setup_seconds"] = round(time.perf_counter() - setup_started, 4)
+        requests_after = (await asyncio.to_thread(backend_stats, base_url))["total"]
+        report["setup_requests"] = requests_after - requests_before
+
+        runtime = hass.data.get(DOMAIN, {})
+        coordinators = [
+            runtime[entry.entry_id]["coordinator"]
+            for entry in entries
+            if isinstance(runtime.get(entry.entry_id), dict) and "coordinator" in runtime[entry.entry_id]
+        ]
+        report["entries_loaded"] = len(coordinators)
+        report["memory_per_entry_bytes"] = (
+            (resident_memory() - memory_before) // len(coordinators) if coordinators else 0
+        )
+
+        async def timed_refresh(coordinator: Any) -> float:
+            started = time.perf_counter()
+            await coordinator.async_refresh()
+            return time.perf_counter() - started
+
+        entry_durations: list[float] = []
+        cycle_durations: list[float] = []
+        cycle_requests: list[float] = []
+        failed_refreshes = 0
+        for _ in range(args.cycles):
+            requests_before = (await asyncio.to_thread(backend_stats, base_url))["total"]
+            started = time.perf_counter()
+            entry_durations.extend(
+                await asyncio.gather(*(timed_refresh(coordinator) for coordinator in coordinators))
+            )
+            await hass.async_block_till_done()
+            cycle_durations.append(time.perf_counter() - started)
+            # The stats request itself is not part of the cycle.
+            requests_after = (await asyncio.to_thread(backend_stats, base_url))["total"]
+            cycle_requests.append(requests_after - requests_before - 1)
+            failed_refreshes += sum(not coordinator.last_update_success for coordinator in coordinators)
+            if args.pause:
+                await asyncio.sleep(args.pause)
+        await monitor.stop()
+
+        for entry in entries:
+            await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    report["cycle_seconds"] = distribution(cycle_durations)
+    report["entry_refresh_seconds"] = distribution(entry_durations)
+    report["loop_lag_seconds"] = distribution(monitor.lag)
+    report["executor_queue_depth"] = {
+        "p95": percentile([float(depth) for depth in monitor.queue_depth], 95),
+        "max": max(monitor.queue_depth, default=0),
+    }
+    report["requests_per_cycle"] = distribution(cycle_requests)
+    report["requests_per_entry_cycle"] = round(
+        sum(cycle_requests) / max(1, len(cycle_requests) * len(coordinators)), 2
+    )
+    report["failed_refreshes"] = failed_refreshes
+    report["backend"] = (await asyncio.to_thread(backend_stats, base_url))["requests"]
+    return report
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Return a readable summary of a harness report."""
+    lines = [
+        f"{report['entries_loaded']}/{report['entries']} entries x {report['children']} children, "
+        f"{report['cycles']} cycles",
+        f"setup: {report['setup_seconds']:.3f}s, {report['setup_requests']} requests",
+        f"memory per entry: {report['memory_per_entry_bytes'] / 1024:.0f} KiB",
+    ]
+    for key in ("cycle_seconds", "entry_refresh_seconds", "loop_lag_seconds", "requests_per_cycle"):
+        values = report[key]
+        lines.append(
+            f"{key}: p50={values['p50']} p95={values['p95']} p99={values['p99']} max={values['max']}"
+        )
+    lines.append(
+        f"executor queue depth: p95={report['executor_queue_depth']['p95']} "
+        f"max={report['executor_queue_depth']['max']}"
+    )
+    lines.append(f"requests per entry and cycle: {report['requests_per_entry_cycle']}")
+    lines.append(f"failed refreshes: {report['failed_refreshes']}")
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse harness options."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--entries", type=int, default=4, help="simulated config entries")
+    parser.add_argument("--children", type=int, default=2, help="children per entry")
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--interval", type=int, default=0, help="data type interval in seconds; 0 refreshes everything every cycle")
+    parser.add_argument("--pause", type=float, default=0.0, help="seconds between cycles")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--description-bytes", type=int, default=200)
+    parser.add_argument("--json", type=Path, help="also write the report here")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the harness."""
+    args = parse_args(argv)
+    try:
+        import pytest_homeassistant_custom_component  # noqa: F401
+    except ImportError:
+        print("Install the development requirements: pip install -r requirements-dev.txt", file=sys.stderr)
+        return 1
+
+    with standin_backend(args) as base_url:
+        report = asyncio.run(run_harness(args, base_url))
+    print(format_report(report))
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
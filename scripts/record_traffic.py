@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Record sanitized live EasyIQ traffic into a HAR bundle for offline replay.
+
+Runs full update cycles against the live Aula and EasyIQ services with the
+token state the live smoke test uses (EASYIQ_MITID_USERNAME,
+EASYIQ_ACCESS_TOKEN, EASYIQ_REFRESH_TOKEN, EASYIQ_TOKEN_EXPIRES_AT in the
+environment or .env) and writes every request/response pair, with its
+latency, to a HAR file. Tokens are removed; names, contact details, and
+message text are replaced by same-length pseudonyms.
+
+    python scripts/record_traffic.py --cycles 2 --output easyiq.har
+
+Replay it through the stand-in server, at recorded speed or faster:
+
+    python scripts/standin_server.py --replay easyiq.har --replay-speed 1
+
+Review a bundle before sharing it: free-text fields that are not known to
+hold personal data (calendar descriptions, for example) are kept.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+INTEGRATION_DIR = ROOT / "custom_components" / "aula_easyiq"
+
+
+async def record(args: argparse.Namespace) -> int:
+    """Run the cycles and save the bundle; return the number of entries."""
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from test_client import load_token_state
+
+    # test_client turns on debug logging, which would print live payloads.
+    logging.getLogger().setLevel(logging.WARNING)
+
+    sys.path.insert(0, str(INTEGRATION_DIR))
+    from client import EasyIQClient
+    from recording import TrafficRecorder
+
+    username, token_state = load_token_state()
+    recorder = TrafficRecorder()
+    client = EasyIQClient(username, token_state, recorder=recorder)
+    try:
+        for cycle in range(args.cycles):
+            if cycle and args.pause:
+                await asyncio.sleep(args.pause)
+            await client.update_data_selective(
+                weekplan_days=args.days,
+                homework_days=args.days,
+            )
+    finally:
+        await client.close()
+
+    recorder.save(str(args.output))
+    return len(recorder)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Record live traffic into a bundle."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--output", type=Path, default=Path("easyiq.har"))
+    parser.add_argument("--cycles", type=int, default=1)
+    parser.add_argument("--pause", type=float, default=0.0, help="seconds between cycles")
+    parser.add_argument("--days", type=int, default=5, help="business days of weekplan and homework")
+    args = parser.parse_args(argv)
+
+    entries = asyncio.run(record(args))
+    print(f"Recorded {entries} requests to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,679 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Aula and EasyIQ endpoints used by the EasyIQ client.
+
+Serves synthetic households for offline load and latency testing, with
+configurable latency, injected errors, Aula API version retirement (HTTP 410),
+calendar request variants that are rejected with 403, and payload sizes.
+
+Run it and point a client or config entry at it:
+
+    python scripts/standin_server.py --children 4 --latency 0.05 --error-rate 0.01
+
+    EasyIQClient(
+        "guardian@example.test",
+        {"access_token": "standin-access", "refresh_token": "standin-refresh", ...},
+        api_base_url="http://127.0.0.1:8765/api/v",
+        calendar_url="http://127.0.0.1:8765/Calendar/CalendarGetWeekplanEvents",
+        token_refresher=AulaTokenRefresher("http://127.0.0.1:8765/oidc/token"),
+    )
+
+Config entries take the same overrides as ``api_base_url``, ``calendar_url``,
+and ``token_url`` entry data. ``StandInSession`` serves the same backend
+in-process as a requests-like session, without sockets or aiohttp.
+
+The same household is also served as fixture documents under
+``/aula_easyiq/`` (profile, calendar, presence, messages, and the bulk
+snapshot), so a config entry with ``fixture_base_url`` set to the server's
+base URL runs in fixture mode against it.
+
+With ``--replay bundle.har`` the server instead answers with a recording
+made by ``scripts/record_traffic.py``, including each response's original
+latency (scaled by ``--replay-speed``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+import datetime
+import itertools
+import json
+from pathlib import Path
+import random
+import re
+import sys
+import threading
+import time
+from typing import Any, Mapping
+from urllib.parse import parse_qsl, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_calendar import week_events  # noqa: E402
+
+# First Aula API version the client tries (const.API_VERSION).
+CLIENT_API_VERSION = 22
+INSTITUTION_CODE = 101
+GUARDIAN_USER_ID = 900
+GUARDIAN_PROFILE_ID = 901
+THREADS_PER_PAGE = 20
+
+# Calendar request variants the client tries, as (loginId, child header) id kinds.
+CALENDAR_VARIANTS = {
+    "profile-login/user-child": ("profile", "user"),
+    "user-login/user-child": ("user", "user"),
+    "profile-login/profile-child": ("profile", "profile"),
+    "guardian-login/user-child": ("guardian", "user"),
+}
+
+_API_PATH = re.compile(r"^/api/v(\d+)/?$")
+CALENDAR_PATH = "/Calendar/CalendarGetWeekplanEvents"
+TOKEN_PATH = "/oidc/token"
+STATS_PATH = "/stats"
+FIXTURE_PREFIX = "/aula_easyiq/"
+
+
+@dataclass
+class StandInConfig:
+    """Household shape and backend behaviour of the stand-in server."""
+
+    children: int = 2
+    lessons_per_day: int = 6
+    homework_per_week: int = 3
+    description_bytes: int = 200
+    threads: int = 30
+    unread_threads: int = 2
+    message_bytes: int = 400
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    min_api_version: int = CLIENT_API_VERSION
+    accepted_variant: str = "profile-login/user-child"
+    token_lifetime: int = 3600
+    access_token: str = "standin-access"
+    refresh_token: str = "standin-refresh"
+    seed: int = 0
+    fixture_snapshot: bool = True
+
+
+@dataclass(frozen=True)
+class StandInChild:
+    """One synthetic child with its Aula user and institution profile ids."""
+
+    user_id: str
+    profile_id: str
+    name: str
+
+
+class StandInBackend:
+    """Request handling for the stand-in server, independent of the transport.
+
+    ``handle`` answers one request with a status code and a JSON payload and
+    counts it per endpoint and status in ``stats``. Latency is applied by the
+    transport through ``delay``.
+    """
+
+    def __init__(self, config: StandInConfig | None = None) -> None:
+        """Build the synthetic household for a configuration."""
+        self.config = config or StandInConfig()
+        if self.config.accepted_variant not in CALENDAR_VARIANTS:
+            raise ValueError(f"Unknown calendar variant {self.config.accepted_variant!r}")
+        self.children = [
+            StandInChild(str(1000 + index), str(2000 + index), f"Child {index + 1}")
+            for index in range(self.config.children)
+        ]
+        self.access_token = self.config.access_token
+        self.refresh_token = self.config.refresh_token
+        self.stats: Counter[tuple[str, int]] = Counter()
+        self.bytes_sent = 0
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._token_counter = itertools.count(1)
+
+    def delay(self) -> float:
+        """Return the simulated latency for the next response, in seconds."""
+        config = self.config
+        if config.latency <= 0 and config.jitter <= 0:
+            return 0.0
+        with self._lock:
+            jitter = self._random.uniform(-config.jitter, config.jitter) if config.jitter else 0.0
+        return max(0.0, config.latency + jitter)
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        params: Mapping[str, str],
+        headers: Mapping[str, str],
+        form: Mapping[str, str] | None = None,
+    ) -> tuple[int, Any]:
+        """Answer one request, returning the HTTP status and JSON payload."""
+        headers = {str(key).lower(): str(value) for key, value in headers.items()}
+        endpoint, status, payload = self._route(method, path, dict(params), headers, dict(form or {}))
+        with self._lock:
+            self.stats[(endpoint, status)] += 1
+            self.bytes_sent += len(json.dumps(payload))
+        return status, payload
+
+    def respond(
+        self,
+        method: str,
+        path: str,
+        params: Mapping[str, str],
+        headers: Mapping[str, str],
+        form: Mapping[str, str] | None = None,
+    ) -> tuple[int, Any, float]:
+        """Answer one request with its status, payload, and simulated latency."""
+        status, payload = self.handle(method, path, params, headers, form)
+        return status, payload, self.delay()
+
+    def stats_payload(self) -> dict[str, Any]:
+        """Return request counts per endpoint and status."""
+        with self._lock:
+            return {
+                "requests": {f"{endpoint} {status}": count for (endpoint, status), count in sorted(self.stats.items())},
+                "total": sum(self.stats.values()),
+                "bytes_sent": self.bytes_sent,
+            }
+
+    def _route(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, str],
+        headers: dict[str, str],
+        form: dict[str, str],
+    ) -> tuple[str, int, Any]:
+        if path == STATS_PATH:
+            return "stats", 200, self.stats_payload()
+
+        api_match = _API_PATH.match(path)
+        if api_match:
+            endpoint = params.get("method", "unknown")
+        elif path == CALENDAR_PATH:
+            endpoint = "CalendarGetWeekplanEvents"
+        elif path == TOKEN_PATH and method.upper() == "POST":
+            endpoint = "oidc.token"
+        elif path.startswith(FIXTURE_PREFIX):
+            endpoint = "fixture." + path[len(FIXTURE_PREFIX):].split("/", 1)[0]
+        else:
+            return "unknown", 404, {"error": "not found"}
+
+        if self.config.error_rate > 0:
+            with self._lock:
+                failed = self._random.random() < self.config.error_rate
+            if failed:
+                return endpoint, 503, {"error": "injected failure"}
+
+        if api_match:
+            if int(api_match.group(1)) < self.config.min_api_version:
+                return endpoint, 410, {"status": {"code": 410, "message": "API version is gone"}}
+            if params.get("access_token") != self.access_token:
+                return endpoint, 401, {"status": {"code": 401, "message": "invalid access token"}}
+            status, payload = self._aula_method(endpoint, params)
+        elif endpoint == "CalendarGetWeekplanEvents":
+            status, payload = self._calendar(params, headers)
+        elif endpoint.startswith("fixture."):
+            status, payload = self._fixture(path[len(FIXTURE_PREFIX):])
+        else:
+            status, payload = self._token(form)
+        return endpoint, status, payload
+
+    def _fixture(self, path: str) -> tuple[int, Any]:
+        """Serve the household in the fixture-mode document layout."""
+        if path == "snapshot":
+            if not self.config.fixture_snapshot:
+                return 404, {"error": "no snapshot"}
+            return 200, {
+                "profile": self._fixture_profile(),
+                "calendar": {child.user_id: self._fixture_calendar(child) for child in self.children},
+                "presence": {child.user_id: self._fixture_presence(child) for child in self.children},
+                "messages": self._fixture_messages(),
+            }
+        if path == "profile":
+            return 200, self._fixture_profile()
+        if path == "messages":
+            return 200, self._fixture_messages()
+        kind, _, child_id = path.partition("/")
+        child = self._child_by("user", child_id)
+        if child is None or kind not in ("calendar", "presence"):
+            return 404, {"error": "not found"}
+        if kind == "calendar":
+            return 200, self._fixture_calendar(child)
+        return 200, self._fixture_presence(child)
+
+    def _fixture_profile(self) -> dict[str, Any]:
+        return {
+            "children": [
+                {"id": child.user_id, "actual_id": child.profile_id, "name": child.name}
+                for child in self.children
+            ],
+            "institution_profiles": [INSTITUTION_CODE],
+        }
+
+    def _fixture_calendar(self, child: StandInChild) -> list[dict[str, Any]]:
+        today = datetime.date.today()
+        return week_events(
+            child.user_id,
+            today - datetime.timedelta(days=today.weekday()),
+            lessons_per_day=self.config.lessons_per_day,
+            homework_per_week=self.config.homework_per_week,
+            description_bytes=self.config.description_bytes,
+            seed=self.config.seed,
+        )
+
+    def _fixture_presence(self, child: StandInChild) -> dict[str, Any]:
+        return {
+            "status": "KOMMET/TIL STEDE",
+            "status_code": 3,
+            "check_in_time": "08:00:00",
+            "check_out_time": "",
+            "entry_time": "08:00:00",
+            "exit_time": "15:00:00",
+            "comment": "",
+            "exit_with": "",
+        }
+
+    def _fixture_messages(self) -> dict[str, Any]:
+        return {
+            "subject": "Besked 1",
+            "text": ("Kære forældre. " * (self.config.message_bytes // 15 + 1))[: self.config.message_bytes],
+            "sender": "Lærer",
+            "unread_count": self.config.unread_threads,
+        }
+
+    def _aula_method(self, method: str, params: dict[str, str]) -> tuple[int, Any]:
+        if method == "profiles.getProfilesByLogin":
+            return 200, {
+                "data": {
+                    "profiles": [
+                        {
+                            "institutionProfiles": [{"institutionCode": INSTITUTION_CODE}],
+                            "children": [
+                                {"userId": child.user_id, "id": child.profile_id, "name": child.name}
+                                for child in self.children
+                            ],
+                        }
+                    ]
+                }
+            }
+        if method == "profiles.getProfileContext":
+            return 200, {
+                "data": {
+                    "userId": GUARDIAN_USER_ID,
+                    "institutionProfile": {
+                        "id": GUARDIAN_PROFILE_ID,
+                        "relations": [{"id": child.profile_id} for child in self.children],
+                    },
+                }
+            }
+        if method == "aulaToken.getWidgets":
+            return 200, {
+                "data": [
+                    {"widgetId": "0128", "widgetName": "EasyIQ Ugeplan"},
+                    {"widgetId": "0142", "widgetName": "EasyIQ Lektier"},
+                ]
+            }
+        if method == "aulaToken.getAulaToken":
+            return 200, {"data": f"widget-{params.get('widgetId', '')}-{next(self._token_counter)}"}
+        if method == "presence.getDailyOverview":
+            return 200, self._presence(params)
+        if method == "messaging.getThreads":
+            return 200, self._threads(int(params.get("page", 0) or 0))
+        if method == "messaging.getMessagesForThread":
+            return self._thread_messages(params.get("threadId", ""))
+        return 400, {"status": {"code": 1, "message": f"unknown method {method}"}}
+
+    def _calendar(self, params: dict[str, str], headers: dict[str, str]) -> tuple[int, Any]:
+        token = headers.get("authorization", "")
+        if not token.startswith("Bearer widget-"):
+            return 401, {"error": "invalid widget token"}
+
+        login_kind, child_kind = CALENDAR_VARIANTS[self.config.accepted_variant]
+        children: list[StandInChild] = []
+        for child_key in filter(None, headers.get("x-childfilter", "").split(",")):
+            child = self._child_by(child_kind, child_key)
+            if child is None:
+                return 403, {"error": "child filter rejected"}
+            children.append(child)
+        if not children:
+            return 403, {"error": "child filter rejected"}
+
+        login_id = params.get("loginId", "")
+        if login_kind == "guardian":
+            login_ok = login_id == headers.get("x-login")
+        else:
+            login_ok = any(self._child_by(login_kind, login_id) == child for child in children)
+        if not login_ok:
+            return 403, {"error": "loginId rejected"}
+
+        try:
+            day = datetime.date.fromisoformat(params.get("date", "")[:10])
+        except ValueError:
+            return 400, {"error": "invalid date"}
+        monday = day - datetime.timedelta(days=day.weekday())
+        events: list[dict[str, Any]] = []
+        for child in children:
+            events.extend(
+                week_events(
+                    child.user_id,
+                    monday,
+                    lessons_per_day=self.config.lessons_per_day,
+                    homework_per_week=self.config.homework_per_week,
+                    description_bytes=self.config.description_bytes,
+                    seed=self.config.seed,
+                    owner=child.user_id if len(children) > 1 else None,
+                )
+            )
+        return 200, events
+
+    def _child_by(self, kind: str, value: str) -> StandInChild | None:
+        for child in self.children:
+            if (child.user_id if kind == "user" else child.profile_id) == value:
+                return child
+        return None
+
+    def _presence(self, params: dict[str, str]) -> dict[str, Any]:
+        requested = {value for key, value in params.items() if key.startswith("childIds")}
+        return {
+            "status": {"code": 0},
+            "data": [
+                {
+                    "institutionProfile": {"id": int(child.profile_id)},
+                    "status": 3,
+                    "checkInTime": "08:00:00",
+                    "checkOutTime": "",
+                    "entryTime": "08:00:00",
+                    "exitTime": "15:00:00",
+                    "comment": "",
+                    "exitWith": "",
+                }
+                for child in self.children
+                if child.profile_id in requested
+            ],
+        }
+
+    def _threads(self, page: int) -> dict[str, Any]:
+        first = page * THREADS_PER_PAGE
+        threads = [
+            {
+                "id": thread_id,
+                "read": thread_id > self.config.unread_threads,
+                "subject": f"Besked {thread_id}",
+                "latestMessage": {"id": thread_id * 10, "sendDateTime": "2026-01-01T08:00:00"},
+            }
+            for thread_id in range(first + 1, min(first + THREADS_PER_PAGE, self.config.threads) + 1)
+        ]
+        return {"data": {"threads": threads}}
+
+    def _thread_messages(self, thread_id: str) -> tuple[int, Any]:
+        if not thread_id.isdigit() or not 1 <= int(thread_id) <= self.config.threads:
+            return 404, {"status": {"code": 404, "message": "thread not found"}}
+        body = ("Kære forældre. " * (self.config.message_bytes // 15 + 1))[: self.config.message_bytes]
+        return 200, {
+            "data": {
+                "subject": f"Besked {thread_id}",
+                "messages": [
+                    {
+                        "messageType": "Message",
+                        "text": {"html": f"<p>{body}</p>"},
+                        "sender": {"fullName": "Lærer"},
+                    }
+                ],
+            }
+        }
+
+    def _token(self, form: dict[str, str]) -> tuple[int, Any]:
+        if form.get("grant_type") != "refresh_token" or form.get("refresh_token") != self.refresh_token:
+            return 400, {"error": "invalid_grant"}
+        counter = next(self._token_counter)
+        with self._lock:
+            self.access_token = f"{self.config.access_token}-{counter}"
+            self.refresh_token = f"{self.config.refresh_token}-{counter}"
+        return 200, {
+            "access_token": self.access_token,
+            "refresh_token": self.refresh_token,
+            "expires_in": self.config.token_lifetime,
+        }
+
+
+# Request fields that identify a recorded response. Volatile ones such as
+# tokens and the calendar ``date`` are ignored, and so is ``x-login``, which
+# carries the pseudonymized guardian username in a recording.
+REPLAY_PARAMS = ("method", "widgetId", "threadId", "childIds[]", "page", "loginId")
+REPLAY_HEADERS = ("x-child", "x-childfilter")
+
+
+def replay_key(
+    method: str,
+    path: str,
+    params: Mapping[str, str],
+    headers: Mapping[str, str],
+) -> tuple[Any, ...]:
+    """Return the key a request is matched to recorded responses by."""
+    headers = {str(key).lower(): str(value) for key, value in headers.items()}
+    return (
+        method.upper(),
+        path,
+        tuple(str(params.get(name, "")) for name in REPLAY_PARAMS),
+        tuple(headers.get(name, "") for name in REPLAY_HEADERS),
+    )
+
+
+class ReplayBackend(StandInBackend):
+    """Serve a recorded HAR bundle with its original response latency.
+
+    Requests are matched by ``replay_key``; repeated requests for the same
+    key get the recorded responses in order, wrapping around, so polling the
+    same calendar weeks again replays them again. Token refreshes and the
+    stats endpoint are answered by the synthetic backend.
+    """
+
+    def __init__(self, bundle: dict[str, Any], *, speed: float = 1.0, config: StandInConfig | None = None) -> None:
+        """Index the bundle's entries; ``speed`` 2.0 halves every latency."""
+        super().__init__(config)
+        self.speed = speed
+        self.responses: dict[tuple[Any, ...], list[tuple[int, Any, float]]] = defaultdict(list)
+        self._positions: Counter[tuple[Any, ...]] = Counter()
+        for entry in bundle["log"]["entries"]:
+            request = entry["request"]
+            content = entry["response"].get("content", {})
+            text = content.get("text", "")
+            try:
+                payload = json.loads(text) if "json" in content.get("mimeType", "") else text
+            except ValueError:
+                payload = text
+            key = replay_key(
+                request["method"],
+                urlsplit(request["url"]).path,
+                {item["name"]: item["value"] for item in request.get("queryString", [])},
+                {item["name"]: item["value"] for item in request.get("headers", [])},
+            )
+            self.responses[key].append((entry["response"]["status"], payload, float(entry.get("time", 0)) / 1000))
+
+    @classmethod
+    def from_file(cls, path: Path, *, speed: float = 1.0) -> "ReplayBackend":
+        """Load a bundle written by ``scripts/record_traffic.py``."""
+        return cls(json.loads(path.read_text(encoding="utf-8")), speed=speed)
+
+    def respond(
+        self,
+        method: str,
+        path: str,
+        params: Mapping[str, str],
+        headers: Mapping[str, str],
+        form: Mapping[str, str] | None = None,
+    ) -> tuple[int, Any, float]:
+        """Answer with the next recorded response for the request."""
+        if path in (TOKEN_PATH, STATS_PATH):
+            status, payload = self.handle(method, path, params, headers, form)
+            return status, payload, 0.0
+        key = replay_key(method, path, params, headers)
+        with self._lock:
+            recorded = self.responses.get(key)
+            if recorded:
+                status, payload, latency = recorded[self._positions[key] % len(recorded)]
+                self._positions[key] += 1
+            else:
+                status, payload, latency = 404, {"error": "not recorded"}, 0.0
+            endpoint = params.get("method") or path.rstrip("/").rsplit("/", 1)[-1]
+            self.stats[(endpoint, status)] += 1
+            self.bytes_sent += len(json.dumps(payload))
+        return status, payload, latency / self.speed if self.speed > 0 else 0.0
+
+
+class StandInResponse:
+    """Minimal requests-like response returned by ``StandInSession``."""
+
+    def __init__(self, status_code: int, payload: Any) -> None:
+        """Serialize the payload the way the server would send it."""
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode("utf-8")
+        self.text = self.content.decode("utf-8")
+        self.headers = {"content-type": "application/json"}
+
+    def json(self) -> Any:
+        """Decode the response body."""
+        return json.loads(self.content)
+
+
+class StandInSession:
+    """Requests-like session that serves a ``StandInBackend`` in-process.
+
+    Pass ``lambda: StandInSession(backend)`` as the client's and token
+    refresher's ``session_factory``; latency is simulated with ``time.sleep``.
+    """
+
+    def __init__(self, backend: StandInBackend) -> None:
+        """Wrap a backend."""
+        self.backend = backend
+
+    def get(self, url: str, params: Mapping[str, Any] | None = None, headers: Mapping[str, str] | None = None, **kwargs: Any) -> StandInResponse:
+        """Serve a GET request."""
+        return self._request("GET", url, params, headers, None)
+
+    def post(self, url: str, data: Mapping[str, Any] | None = None, headers: Mapping[str, str] | None = None, **kwargs: Any) -> StandInResponse:
+        """Serve a POST request."""
+        return self._request("POST", url, None, headers, data)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        params: Mapping[str, Any] | None,
+        headers: Mapping[str, str] | None,
+        form: Mapping[str, Any] | None,
+    ) -> StandInResponse:
+        parts = urlsplit(url)
+        query = dict(parse_qsl(parts.query))
+        query.update({str(key): str(value) for key, value in (params or {}).items()})
+        status, payload, delay = self.backend.respond(
+            method,
+            parts.path,
+            query,
+            headers or {},
+            {str(key): str(value) for key, value in (form or {}).items()},
+        )
+        if delay:
+            time.sleep(delay)
+        return StandInResponse(status, payload)
+
+
+def build_app(backend: StandInBackend) -> Any:
+    """Return an aiohttp application serving the backend."""
+    from aiohttp import web
+
+    async def handle(request: web.Request) -> web.Response:
+        form = dict(await request.post()) if request.method == "POST" else {}
+        status, payload, delay = backend.respond(
+            request.method,
+            request.path,
+            request.query,
+            request.headers,
+            {str(key): str(value) for key, value in form.items()},
+        )
+        if delay:
+            await asyncio.sleep(delay)
+        return web.json_response(payload, status=status)
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handle)
+    return app
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line options into server and household settings."""
+    defaults = StandInConfig()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--children", type=int, default=defaults.children)
+    parser.add_argument("--lessons-per-day", type=int, default=defaults.lessons_per_day)
+    parser.add_argument("--homework-per-week", type=int, default=defaults.homework_per_week)
+    parser.add_argument("--description-bytes", type=int, default=defaults.description_bytes)
+    parser.add_argument("--threads", type=int, default=defaults.threads)
+    parser.add_argument("--unread-threads", type=int, default=defaults.unread_threads)
+    parser.add_argument("--message-bytes", type=int, default=defaults.message_bytes)
+    parser.add_argument("--latency", type=float, default=defaults.latency, help="seconds per response")
+    parser.add_argument("--jitter", type=float, default=defaults.jitter, help="± seconds of latency jitter")
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="share of requests answered with 503")
+    parser.add_argument("--min-api-version", type=int, default=defaults.min_api_version, help="Aula API versions below this answer 410")
+    parser.add_argument("--accepted-variant", choices=sorted(CALENDAR_VARIANTS), default=defaults.accepted_variant)
+    parser.add_argument("--token-lifetime", type=int, default=defaults.token_lifetime)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--no-fixture-snapshot", action="store_true", help="answer the fixture snapshot with 404")
+    parser.add_argument("--replay", type=Path, help="serve a recorded HAR bundle instead of synthetic data")
+    parser.add_argument("--replay-speed", type=float, default=1.0, help="divide recorded latencies by this")
+    return parser.parse_args(argv)
+
+
+def config_from_args(args: argparse.Namespace) -> StandInConfig:
+    """Build a backend configuration from parsed options."""
+    return StandInConfig(
+        children=args.children,
+        lessons_per_day=args.lessons_per_day,
+        homework_per_week=args.homework_per_week,
+        description_bytes=args.description_bytes,
+        threads=args.threads,
+        unread_threads=args.unread_threads,
+        message_bytes=args.message_bytes,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        min_api_version=args.min_api_version,
+        accepted_variant=args.accepted_variant,
+        token_lifetime=args.token_lifetime,
+        seed=args.seed,
+        fixture_snapshot=not args.no_fixture_snapshot,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the stand-in server until interrupted."""
+    args = parse_args(argv)
+    try:
+        from aiohttp import web
+    except ImportError:
+        print("aiohttp is required: pip install -r requirements-dev.txt", file=sys.stderr)
+        return 1
+
+    backend = (
+        ReplayBackend.from_file(args.replay, speed=args.replay_speed)
+        if args.replay
+        else StandInBackend(config_from_args(args))
+    )
+    base = f"http://{args.host}:{args.port}"
+    print(f"api_base_url: {base}/api/v")
+    print(f"calendar_url: {base}{CALENDAR_PATH}")
+    print(f"token_url:    {base}{TOKEN_PATH}")
+    print(f"stats:        {base}{STATS_PATH}")
+    print(f"tokens:       access={backend.access_token} refresh={backend.refresh_token}")
+    web.run_app(build_app(backend), host=args.host, port=args.port, print=None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
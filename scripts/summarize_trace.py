@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Summarize an EasyIQ trace journal into latency distributions and counts.
+
+The integration writes the journal when the "trace journal" option is on,
+to ``<config>/aula_easyiq/trace_<entry_id>.jsonl`` plus rotated ``.1``,
+``.2``, ... backups. Pass the journal path; its backups are read too,
+oldest first:
+
+    python scripts/summarize_trace.py /config/aula_easyiq/trace_<entry_id>.jsonl
+    python scripts/summarize_trace.py trace.jsonl --json summary.json
+
+Reports update cycle durations, per-phase durations, per-endpoint request
+counts by status with latency percentiles and bytes, and cache hit ratios.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter, defaultdict
+import json
+from pathlib import Path
+import sys
+from typing import Any, Iterable, Iterator
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the ``pct`` percentile of ``values`` by linear interpolation."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def distribution(values: list[float]) -> dict[str, float]:
+    """Return count, p50, p95, p99, and max of a list of samples."""
+    return {
+        "count": len(values),
+        "p50": round(percentile(values, 50), 1),
+        "p95": round(percentile(values, 95), 1),
+        "p99": round(percentile(values, 99), 1),
+        "max": round(max(values, default=0.0), 1),
+    }
+
+
+def journal_files(path: Path) -> list[Path]:
+    """Return the journal and its rotated backups, oldest first."""
+    backups = []
+    index = 1
+    while (backup := path.with_name(f"{path.name}.{index}")).exists():
+        backups.append(backup)
+        index += 1
+    return [*reversed(backups), *([path] if path.exists() else [])]
+
+
+def read_records(paths: Iterable[Path]) -> Iterator[dict[str, Any]]:
+    """Yield journal records, skipping lines that are not complete JSON objects."""
+    for path in paths:
+        with path.open(encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+
+
+def summarize(records: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Return the summary document for a stream of journal records."""
+    cycle_ms: list[float] = []
+    failed_cycles = 0
+    phase_ms: dict[str, list[float]] = defaultdict(list)
+    cache: dict[str, Counter] = defaultdict(Counter)
+    latency: dict[str, list[float]] = defaultdict(list)
+    statuses: dict[str, Counter] = defaultdict(Counter)
+    response_bytes: Counter = Counter()
+    first_ts = last_ts = None
+
+    for record in records:
+        ts = record.get("ts")
+        if isinstance(ts, (int, float)):
+            first_ts = ts if first_ts is None else min(first_ts, ts)
+            last_ts = ts if last_ts is None else max(last_ts, ts)
+        if record.get("kind") == "cycle":
+            cycle_ms.append(float(record.get("total_ms", 0)))
+            failed_cycles += bool(record.get("error"))
+            for phase, values in (record.get("phases") or {}).items():
+                phase_ms[phase].append(float(values.get("ms", 0)))
+            for name, results in (record.get("cache") or {}).items():
+                cache[name].update(results)
+        elif record.get("kind") == "request":
+            endpoint = str(record.get("endpoint"))
+            latency[endpoint].append(float(record.get("ms", 0)))
+            statuses[endpoint][str(record.get("status"))] += 1
+            response_bytes[endpoint] += int(record.get("bytes", 0) or 0)
+
+    return {
+        "first_ts": first_ts,
+        "last_ts": last_ts,
+        "cycles": {**distribution(cycle_ms), "failed": failed_cycles},
+        "phases": {phase: distribution(values) for phase, values in sorted(phase_ms.items())},
+        "endpoints": {
+            endpoint: {
+                "latency_ms": distribution(latency[endpoint]),
+                "statuses": dict(statuses[endpoint]),
+                "bytes": response_bytes[endpoint],
+            }
+            for endpoint in sorted(latency)
+        },
+        "cache_hit_ratio": {
+            name: round(results["hit"] / (results["hit"] + results["miss"]), 4)
+            for name, results in sorted(cache.items())
+            if results["hit"] + results["miss"]
+        },
+    }
+
+
+def format_summary(summary: dict[str, Any]) -> str:
+    """Return a readable report of a journal summary."""
+    cycles = summary["cycles"]
+    lines = [
+        f"cycles: {cycles['count']} ({cycles['failed']} failed) "
+        f"p50={cycles['p50']}ms p95={cycles['p95']}ms p99={cycles['p99']}ms max={cycles['max']}ms",
+        "",
+        f"{'phase':<20} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}",
+    ]
+    for phase, values in summary["phases"].items():
+        lines.append(
+            f"{phase:<20} {values['count']:>6} {values['p50']:>9} {values['p95']:>9} {values['max']:>9}"
+        )
+    lines += ["", f"{'endpoint':<36} {'requests':>8} {'p50 ms':>9} {'p95 ms':>9} {'KiB':>9}  statuses"]
+    for endpoint, values in summary["endpoints"].items():
+        statuses = " ".join(f"{status}={count}" for status, count in sorted(values["statuses"].items()))
+        lines.append(
+            f"{endpoint:<36} {values['latency_ms']['count']:>8} {values['latency_ms']['p50']:>9} "
+            f"{values['latency_ms']['p95']:>9} {values['bytes'] / 1024:>9.1f}  {statuses}"
+        )
+    if summary["cache_hit_ratio"]:
+        lines.append("")
+        lines.extend(f"cache {name}: {ratio:.1%} hits" for name, ratio in summary["cache_hit_ratio"].items())
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Summarize the journal given on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("journal", type=Path, help="trace journal path; rotated backups are included")
+    parser.add_argument("--no-backups", action="store_true", help="read only the current journal file")
+    parser.add_argument("--json", type=Path, help="also write the summary here")
+    args = parser.parse_args(argv)
+
+    paths = [args.journal] if args.no_backups else journal_files(args.journal)
+    if not paths or not all(path.exists() for path in paths):
+        print(f"No journal at {args.journal}", file=sys.stderr)
+        return 1
+
+    summary = summarize(read_records(paths))
+    print(format_summary(summary))
+    if args.json:
+        args.json.write_text(json.dumps(summary, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
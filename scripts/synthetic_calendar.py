@@ -0,0 +1,195 @@
+"""Synthetic EasyIQ ``CalendarGetWeekplanEvents`` rows for load tests and benchmarks.
+
+The rows rotate through the field shapes the client normalizer has had to
+accept from real accounts: display fields, legacy capitalized fields, plain
+course fields, nested title objects, split date and time fields, and string
+item types. Output is deterministic for a given seed, child, and week.
+"""
+
+from __future__ import annotations
+
+import datetime
+import random
+from typing import Any, Callable
+
+SUBJECTS = (
+    "Dansk",
+    "Matematik",
+    "Engelsk",
+    "Natur/teknologi",
+    "Historie",
+    "Idræt",
+    "Musik",
+    "Billedkunst",
+    "Kristendomskundskab",
+    "Tysk",
+)
+ACTIVITIES = ("4.A", "4.B", "Hold 1", "Hold 2", "Valgfag", "Understøttende undervisning")
+LESSON_MINUTES = 45
+FIRST_LESSON = datetime.time(8, 0)
+
+WEEKPLAN_ITEM_TYPE = 9
+HOMEWORK_ITEM_TYPE = 4
+
+
+def description_html(rng: random.Random, size: int) -> str:
+    """Return an HTML description of roughly ``size`` characters."""
+    if size <= 0:
+        return ""
+    words = ("lektie", "side", "opgave", "læs", "kapitel", "aflevering", "gruppe", "noter")
+    parts = ["<p>"]
+    length = 3
+    while length < size:
+        word = rng.choice(words)
+        chunk = f"<b>{word}</b> " if rng.random() < 0.1 else f"{word} "
+        parts.append(chunk)
+        length += len(chunk)
+    parts.append("</p>")
+    return "".join(parts)
+
+
+def _display_row(start: datetime.datetime, end: datetime.datetime, **fields: Any) -> dict[str, Any]:
+    return {
+        "id": fields["event_id"],
+        "itemType": fields["item_type"],
+        "coursesDisplay": fields["title"],
+        "activitiesDisplay": fields["activity"],
+        "start": start.strftime("%Y/%m/%d %H:%M"),
+        "end": end.strftime("%Y/%m/%d %H:%M"),
+        "description": fields["description"],
+    }
+
+
+def _legacy_row(start: datetime.datetime, end: datetime.datetime, **fields: Any) -> dict[str, Any]:
+    return {
+        "Id": fields["event_id"],
+        "ItemType": fields["item_type"],
+        "CoursesDisplay": f"<span>{fields['title']}</span>",
+        "ActivitiesDisplay": fields["activity"],
+        "Title": "",
+        "start": start.strftime("%Y-%m-%d %H:%M:%S"),
+        "end": end.strftime("%Y-%m-%d %H:%M:%S"),
+        "Description": fields["description"],
+    }
+
+
+def _plain_row(start: datetime.datetime, end: datetime.datetime, **fields: Any) -> dict[str, Any]:
+    return {
+        "eventId": fields["event_id"],
+        "ItemType": str(fields["item_type"]),
+        "courses": fields["title"],
+        "activities": fields["activity"],
+        "startDateTime": start.isoformat(),
+        "endDateTime": end.isoformat(),
+        "description": fields["description"],
+    }
+
+
+def _nested_title_row(start: datetime.datetime, end: datetime.datetime, **fields: Any) -> dict[str, Any]:
+    return {
+        "calendarItemId": fields["event_id"],
+        "itemType": fields["item_type"],
+        "title": {"text": fields["title"], "icon": "/Content/icons/book.png"},
+        "className": fields["activity"],
+        "date": start.date().isoformat(),
+        "startTime": start.strftime("%H:%M"),
+        "endTime": end.strftime("%H:%M"),
+        "details": fields["description"],
+    }
+
+
+ROW_SHAPES: tuple[Callable[..., dict[str, Any]], ...] = (
+    _display_row,
+    _legacy_row,
+    _plain_row,
+    _nested_title_row,
+)
+
+
+def week_events(
+    child_key: str,
+    monday: datetime.date,
+    *,
+    lessons_per_day: int = 6,
+    homework_per_week: int = 3,
+    description_bytes: int = 200,
+    seed: int = 0,
+    owner: str | None = None,
+) -> list[dict[str, Any]]:
+    """Return one child's weekplan and homework rows for the week of ``monday``.
+
+    ``owner`` is written as ``ChildId`` on every row, which is what lets the
+    client split a combined multi-child response.
+    """
+    rng = random.Random(f"{seed}:{child_key}:{monday.isoformat()}")
+    events: list[dict[str, Any]] = []
+
+    def add(start: datetime.datetime, item_type: int, title: str) -> None:
+        index = len(events)
+        shape = ROW_SHAPES[index % len(ROW_SHAPES)]
+        row = shape(
+            start,
+            start + datetime.timedelta(minutes=LESSON_MINUTES),
+            event_id=f"{child_key}-{monday.isoformat()}-{index}",
+            item_type=item_type,
+            title=title,
+            activity=rng.choice(ACTIVITIES),
+            description=description_html(rng, description_bytes),
+        )
+        if owner is not None:
+            row["ChildId"] = owner
+        events.append(row)
+
+    for weekday in range(5):
+        day = monday + datetime.timedelta(days=weekday)
+        start = datetime.datetime.combine(day, FIRST_LESSON)
+        for lesson in range(lessons_per_day):
+            add(
+                start + datetime.timedelta(minutes=(LESSON_MINUTES + 10) * lesson),
+                WEEKPLAN_ITEM_TYPE,
+                rng.choice(SUBJECTS),
+            )
+
+    for _ in range(homework_per_week):
+        day = monday + datetime.timedelta(days=rng.randrange(5))
+        add(
+            datetime.datetime.combine(day, FIRST_LESSON),
+            HOMEWORK_ITEM_TYPE,
+            f"Lektie: {rng.choice(SUBJECTS)}",
+        )
+    return events
+
+
+def calendar_rows(
+    count: int,
+    *,
+    start: datetime.date | None = None,
+    description_bytes: int = 200,
+    seed: int = 0,
+) -> list[dict[str, Any]]:
+    """Return ``count`` rows for one child over consecutive weeks from ``start``."""
+    monday = start or datetime.date.today()
+    monday -= datetime.timedelta(days=monday.weekday())
+    rows: list[dict[str, Any]] = []
+    while len(rows) < count:
+        rows.extend(
+            week_events(
+                "bench",
+                monday,
+                description_bytes=description_bytes,
+                seed=seed,
+            )
+        )
+        monday += datetime.timedelta(days=7)
+    return rows[:count]
+
+
+def wrap_payload(rows: list[dict[str, Any]], shape: str = "list") -> Any:
+    """Return rows in one of the response wrappers EasyIQ has used."""
+    if shape == "list":
+        return rows
+    if shape == "events":
+        return {"events": rows}
+    if shape == "nested":
+        return {"data": {"result": {"calendarEvents": rows}}}
+    raise ValueError(f"Unknown payload shape {shape!r}")
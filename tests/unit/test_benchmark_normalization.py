@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = ROOT / "scripts"
+import calendar as _stdlib_calendar  # noqa: E402,F401 - keep stdlib calendar loaded
+
+
+def load_module(name: str, path: Path):
+    sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+benchmark = load_module("benchmark_normalization", SCRIPTS_DIR / "benchmark_normalization.py")
+synthetic = sys.modules["synthetic_calendar"]
+
+
+class NormalizationBenchmarkTests(unittest.TestCase):
+    def test_synthetic_rows_cover_every_shape_and_normalize(self) -> None:
+        client_module = benchmark.load_client_module()
+        rows = synthetic.calendar_rows(70, description_bytes=50)
+
+        self.assertEqual(70, len(rows))
+        self.assertEqual(rows, client_module._extract_calendar_event_list(
+            synthetic.wrap_payload(rows, "nested"), normalize=False
+        ))
+        normalized = [client_module._normalize_calendar_event(row) for row in rows]
+        self.assertTrue(all(event["start"] and event["end"] for event in normalized))
+        self.assertFalse(
+            any(client_module._is_generic_calendar_title(event.get("courses")) for event in normalized)
+        )
+        self.assertEqual(70, len({event["_easyiq_event_id"] for event in normalized}))
+
+    def test_run_reports_stages_and_compare_flags_regressions(self) -> None:
+        current = benchmark.run_benchmarks((40,), repeat=1, description_bytes=20)
+
+        self.assertTrue({"extract", "normalize", "filter", "html"} <= set(current["results"]))
+        normalize = current["results"]["normalize"]["40"]
+        self.assertGreater(normalize["events_per_second"], 0)
+        self.assertGreater(normalize["peak_bytes"], 0)
+        self.assertEqual([], benchmark.compare(current, current, 0.25))
+
+        faster_baseline = {
+            "results": {
+                "normalize": {"40": {"events_per_second": normalize["events_per_second"] * 2}}
+            }
+        }
+        regressions = benchmark.compare(current, faster_baseline, 0.25)
+        self.assertEqual(1, len(regressions))
+        self.assertTrue(regressions[0].startswith("normalize @ 40"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = ROOT / "scripts"
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+benchmark = load_module("benchmark_startup", SCRIPTS_DIR / "benchmark_startup.py")
+
+
+class StartupBenchmarkTests(unittest.TestCase):
+    def test_client_import_defers_heavy_dependencies(self) -> None:
+        report = benchmark.measure_imports("client", 1)
+
+        self.assertEqual([], report["heavy_modules"])
+        self.assertEqual(1, report["seconds"]["count"])
+        self.assertIn("heavy modules loaded", benchmark.format_report({"imports": {"client": report}}))
+
+    def test_setup_phases_are_checked_against_the_scaled_baseline(self) -> None:
+        def phases(first_refresh: float, run_p95: list[float]) -> dict:
+            return {
+                "loaded": 3,
+                "repeat": 3,
+                "phases_ms": {
+                    "client": benchmark.distribution([0.2, 0.3, 0.4]),
+                    "first_refresh": benchmark.distribution([first_refresh] * 3),
+                },
+                "run_p95_ms": {"client": [0.3, 0.4, 0.4], "first_refresh": run_p95},
+            }
+
+        report = {"imports": {}, "setup": {"1": phases(100.0, [90.0, 100.0, 400.0]), "10": phases(900.0, [900.0])}}
+        document = {"calibration_ms": 50.0, "baseline_ms": benchmark.baseline_from_report(report)}
+
+        self.assertEqual(100.0, document["baseline_ms"]["1_children/first_refresh"])
+        budget = benchmark.budget_limits(document, 50.0, 0.5, 5.0)
+        self.assertEqual(150.0, budget["1_children/first_refresh"])
+        self.assertEqual(5.4, budget["1_children/client"])
+        self.assertEqual([], benchmark.over_budget(report, budget))
+        # A host that runs the calibration twice as slowly gets twice the budget.
+        self.assertEqual(2700.0, benchmark.budget_limits(document, 100.0, 0.5, 5.0)["10_children/first_refresh"])
+        report["setup"]["10"] = phases(1500.0, [1500.0])
+        report["setup"]["10"]["loaded"] = 2
+        self.assertEqual(
+            [
+                "10 children: 1 setups failed",
+                "10 children first_refresh: p95 1500.0ms > budget 1350.0ms",
+            ],
+            benchmark.over_budget(report, budget),
+        )
+
+    def test_stored_baseline_records_how_it_was_measured(self) -> None:
+        stored = json.loads((SCRIPTS_DIR / "benchmark_startup_budget.json").read_text())
+        keys = {f"{children}_children/{phase}" for children in (1, 4, 10) for phase in benchmark.SETUP_PHASES}
+
+        self.assertEqual(keys, set(stored["baseline_ms"]))
+        self.assertEqual(keys, set(stored["run_p95_ms"]))
+        self.assertTrue(stored["command"].startswith("python scripts/benchmark_startup.py --update-budget"))
+        self.assertTrue(stored["packages"]["homeassistant"])
+        self.assertGreater(stored["calibration_ms"], 0)
+        for field in ("python", "machine", "platform", "cpu_count"):
+            self.assertIn(field, stored)
+        report: dict = {"setup": {}}
+        for key, run_p95 in stored["run_p95_ms"].items():
+            children, phase = key.split("_children/")
+            report["setup"].setdefault(children, {"run_p95_ms": {}})["run_p95_ms"][phase] = run_p95
+        self.assertEqual(stored["baseline_ms"], benchmark.baseline_from_report(report))
+
+    def test_constructing_a_client_does_not_import_requests(self) -> None:
+        code = (
+            "import calendar, json, sys\n"
+            f"sys.path.insert(0, {str(benchmark.INTEGRATION_DIR)!r})\n"
+            "from client import EasyIQClient\n"
+            "client = EasyIQClient('guardian@example.test', {'access_token': 'a', "
+            "'refresh_token': 'r', 'token_expires_at': 4102444800})\n"
+            f"print(json.dumps(sorted(set({benchmark.HEAVY_MODULES!r}) & set(sys.modules))))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=str(ROOT)
+        )
+
+        self.assertEqual([], json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
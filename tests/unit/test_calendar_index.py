@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import importlib.util
+import unittest
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+
+def load_calendar_index_module():
+    module_path = (
+        Path(__file__).resolve().parents[2]
+        / "custom_components"
+        / "aula_easyiq"
+        / "calendar_index.py"
+    )
+    spec = importlib.util.spec_from_file_location("easyiq_calendar_index", module_path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+calendar_index = load_calendar_index_module()
+
+
+@dataclass(frozen=True)
+class FakeEvent:
+    summary: str
+    start: datetime
+    end: datetime
+
+
+def at(hour: int, minute: int = 0, day: int = 22) -> datetime:
+    return datetime(2026, 6, day, hour, minute)
+
+
+class CalendarTimelineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.events = [
+            FakeEvent("Music", at(12), at(13)),
+            FakeEvent("Math", at(8), at(9)),
+            FakeEvent("Trip", at(7), at(15)),
+            FakeEvent("Danish", at(10), at(11)),
+            FakeEvent("Gym", at(8, 30, day=23), at(9, 30, day=23)),
+        ]
+        self.timeline = calendar_index.CalendarTimeline(self.events)
+
+    def test_events_are_sorted_by_start(self) -> None:
+        self.assertEqual(
+            ["Trip", "Math", "Danish", "Music", "Gym"],
+            [event.summary for event in self.timeline.events],
+        )
+
+    def test_next_after_returns_first_event_starting_strictly_later(self) -> None:
+        self.assertEqual("Math", self.timeline.next_after(at(7)).summary)
+        self.assertEqual("Danish", self.timeline.next_after(at(8)).summary)
+        self.assertIsNone(self.timeline.next_after(at(9, day=23)))
+        self.assertIsNone(calendar_index.CalendarTimeline().next_after(at(7)))
+
+    def test_between_includes_events_started_before_the_range(self) -> None:
+        self.assertEqual(
+            ["Trip", "Danish"],
+            [event.summary for event in self.timeline.between(at(10, 30), at(11, 30))],
+        )
+
+    def test_between_matches_linear_overlap_filter(self) -> None:
+        moment = at(6)
+        while moment < at(12, day=23):
+            end = moment + timedelta(hours=2)
+            expected = sorted(
+                (event for event in self.events if event.end >= moment and event.start <= end),
+                key=lambda event: event.start,
+            )
+            self.assertEqual(expected, self.timeline.between(moment, end), moment)
+            moment += timedelta(minutes=30)
+
+
+if __name__ == "__main__":
+    unittest.main()
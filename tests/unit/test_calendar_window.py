@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import unittest
+from datetime import date, datetime
+from pathlib import Path
+
+
+def load_calendar_window_module():
+    module_path = (
+        Path(__file__).resolve().parents[2]
+        / "custom_components"
+        / "aula_easyiq"
+        / "calendar_window.py"
+    )
+    spec = importlib.util.spec_from_file_location("easyiq_calendar_window", module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+calendar_window = load_calendar_window_module()
+
+
+def make_week(monday: date, fetched_at: float = 0.0):
+    return calendar_window.CalendarWeek(
+        monday=monday,
+        weekplan=(),
+        homework=(),
+        fetched_at=fetched_at,
+    )
+
+
+class CalendarWindowTests(unittest.TestCase):
+    def test_week_helpers_use_iso_weeks(self) -> None:
+        self.assertEqual(date(2026, 6, 22), calendar_window.week_monday(date(2026, 6, 28)))
+        self.assertEqual(-2, calendar_window.week_offset(date(2026, 6, 8), date(2026, 6, 24)))
+        self.assertEqual(
+            [date(2026, 6, 15), date(2026, 6, 22), date(2026, 6, 29)],
+            calendar_window.weeks_in_range(date(2026, 6, 21), date(2026, 6, 29)),
+        )
+        self.assertEqual(
+            [date(2026, 6, 26), date(2026, 6, 29), date(2026, 6, 30)],
+            calendar_window.business_dates(date(2026, 6, 26), 3),
+        )
+
+    def test_week_is_covered_only_checks_weekdays_inside_range(self) -> None:
+        covered = calendar_window.business_dates(date(2026, 6, 24), 3)
+
+        self.assertTrue(
+            calendar_window.week_is_covered(
+                date(2026, 6, 22), date(2026, 6, 24), date(2026, 6, 28), covered
+            )
+        )
+        self.assertFalse(
+            calendar_window.week_is_covered(
+                date(2026, 6, 22), date(2026, 6, 22), date(2026, 6, 28), covered
+            )
+        )
+
+    def test_window_slides_forward_and_forgets_weeks_that_left_it(self) -> None:
+        window = calendar_window.CalendarWindow()
+        fetched_at = datetime(2026, 6, 24, 8, 0, 0)
+
+        self.assertEqual(
+            [date(2026, 6, 25), date(2026, 6, 26), date(2026, 6, 29)],
+            window.move_to(date(2026, 6, 25), 3),
+        )
+        self.assertEqual([date(2026, 6, 22), date(2026, 6, 29)], window.weeks())
+        window.put(date(2026, 6, 22), fetched_at, [{"courses": "Math"}])
+        window.put(date(2026, 6, 29), fetched_at, [{"courses": "Danish"}])
+
+        self.assertEqual(
+            [date(2026, 6, 26), date(2026, 6, 29), date(2026, 6, 30)],
+            window.move_to(date(2026, 6, 26), 3),
+        )
+        self.assertIsNotNone(window.get(date(2026, 6, 22)))
+
+        self.assertEqual(
+            [date(2026, 6, 29), date(2026, 6, 30), date(2026, 7, 1)],
+            window.move_to(date(2026, 6, 27), 3),
+        )
+        self.assertIsNone(window.get(date(2026, 6, 22)))
+        self.assertEqual([{"courses": "Danish"}], window.get(date(2026, 6, 29))[1])
+
+    def test_window_recomputes_dates_when_length_changes(self) -> None:
+        window = calendar_window.CalendarWindow()
+        window.move_to(date(2026, 6, 25), 3)
+
+        self.assertEqual(
+            calendar_window.business_dates(date(2026, 6, 26), 5),
+            window.move_to(date(2026, 6, 26), 5),
+        )
+
+    def test_week_cache_is_bounded_and_expires_old_weeks(self) -> None:
+        clock = [100.0]
+        cache = calendar_window.CalendarWeekCache(2, 60, clock=lambda: clock[0])
+        first = make_week(date(2026, 6, 1), fetched_at=100.0)
+        cache.put("100", first)
+        cache.put("100", make_week(date(2026, 6, 8), fetched_at=100.0))
+        self.assertIs(first, cache.get("100", date(2026, 6, 1)))
+
+        cache.put("100", make_week(date(2026, 6, 15), fetched_at=100.0))
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get("100", date(2026, 6, 8)))
+        self.assertIs(first, cache.get("100", date(2026, 6, 1)))
+
+        clock[0] = 161.0
+        self.assertIsNone(cache.get("100", date(2026, 6, 1)))
+        self.assertEqual(1, len(cache))
+
+
+if __name__ == "__main__":
+    unittest.main()
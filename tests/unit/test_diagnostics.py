@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import sys
+import types
+import unittest
+from pathlib import Path
+from typing import Any
+
+
+ROOT = Path(__file__).resolve().parents[2]
+INTEGRATION_DIR = ROOT / "custom_components" / "aula_easyiq"
+REDACTED = "**REDACTED**"
+
+
+def async_redact_data(data: Any, to_redact: set[str]) -> Any:
+    """Redact keys at any depth, like Home Assistant's diagnostics helper."""
+    if isinstance(data, list):
+        return [async_redact_data(value, to_redact) for value in data]
+    if not isinstance(data, dict):
+        return data
+    return {
+        key: REDACTED if key in to_redact else async_redact_data(value, to_redact)
+        for key, value in data.items()
+    }
+
+
+def install_dependency_stubs() -> None:
+    """Install tiny stubs for the Home Assistant modules diagnostics.py imports."""
+    modules = {
+        name: types.ModuleType(name)
+        for name in (
+            "homeassistant",
+            "homeassistant.components",
+            "homeassistant.components.diagnostics",
+            "homeassistant.config_entries",
+            "homeassistant.core",
+        )
+    }
+    modules["homeassistant.components.diagnostics"].async_redact_data = async_redact_data
+    modules["homeassistant.config_entries"].ConfigEntry = object
+    modules["homeassistant.core"].HomeAssistant = object
+    sys.modules.update(modules)
+
+    custom_components = types.ModuleType("custom_components")
+    custom_components.__path__ = [str(ROOT / "custom_components")]
+    aula_easyiq = types.ModuleType("custom_components.aula_easyiq")
+    aula_easyiq.__path__ = [str(INTEGRATION_DIR)]
+    sys.modules["custom_components"] = custom_components
+    sys.modules["custom_components.aula_easyiq"] = aula_easyiq
+
+
+def load_diagnostics():
+    previous_modules = dict(sys.modules)
+    try:
+        install_dependency_stubs()
+        for name in ("const", "diagnostics"):
+            module_name = f"custom_components.aula_easyiq.{name}"
+            spec = importlib.util.spec_from_file_location(module_name, INTEGRATION_DIR / f"{name}.py")
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            assert spec.loader is not None
+            spec.loader.exec_module(module)
+        return module
+    finally:
+        for name in set(sys.modules) - set(previous_modules):
+            del sys.modules[name]
+        sys.modules.update(previous_modules)
+
+
+diagnostics = load_diagnostics()
+
+# Values that must not appear anywhere in a diagnostics download.
+PERSONAL_VALUES = (
+    "guardian@example.test",
+    "access-token-value",
+    "refresh-token-value",
+    "Alma Hansen",
+    "Bo Hansen",
+    "1000",
+    "1001",
+    "4242",
+    "Teacher Jensen",
+    "Field trip on Friday",
+    "Bring packed lunch",
+    "Private lesson note",
+)
+
+
+class DiagnosticsTests(unittest.TestCase):
+    def test_download_contains_no_personal_values(self) -> None:
+        week = {
+            "stage": "success",
+            "successful_variant": "actual_id",
+            "attempts": [
+                {
+                    "variant": "actual_id",
+                    "status_code": 200,
+                    "events": 1,
+                    "payload": {
+                        "type": "list",
+                        "sample_event_keys": ["id", "title", "description"],
+                        "sample_event_preview": {"id": "4242", "description": "Private lesson note"},
+                        "normalized_sample_event_id": "id:9:4242@2026-10-19T08:00:00/",
+                    },
+                }
+            ],
+        }
+        coordinator = types.SimpleNamespace(
+            last_update_success=True,
+            data={
+                "update_diagnostics": {
+                    "mode": "full",
+                    "children_count": 2,
+                    "children": ["Alma Hansen", "Bo Hansen"],
+                },
+                "calendar_diagnostics": {
+                    "1000": {"business_day_event_count": 1, "week_offsets": {"0": week}},
+                    "1001": {
+                        "week_offsets": {
+                            "0": {
+                                "stage": "child_data_missing",
+                                "available_child_ids": ["1000"],
+                                "login_id": "1001",
+                            }
+                        }
+                    },
+                },
+                "message": {
+                    "unread_count": 1,
+                    "subject": "Field trip on Friday",
+                    "text": "Bring packed lunch",
+                    "sender": "Teacher Jensen",
+                },
+            },
+        )
+        entry = types.SimpleNamespace(
+            entry_id="entry",
+            title="EasyIQ (guardian@example.test)",
+            version=2,
+            data={
+                "mitid_username": "guardian@example.test",
+                "access_token": "access-token-value",
+                "refresh_token": "refresh-token-value",
+            },
+            options={"diagnostics_level": "full"},
+        )
+        hass = types.SimpleNamespace(
+            data={"aula_easyiq": {"entry": {"coordinator": coordinator, "setup_timings": {"total": 12.5}}}}
+        )
+
+        result = asyncio.run(diagnostics.async_get_config_entry_diagnostics(hass, entry))
+        dumped = json.dumps(result)
+
+        for value in PERSONAL_VALUES:
+            self.assertNotIn(value, dumped)
+        self.assertEqual(["child_1", "child_2"], list(result["calendar_diagnostics"]))
+        self.assertEqual(1, result["calendar_diagnostics"]["child_1"]["business_day_event_count"])
+        self.assertEqual(
+            ["id", "title", "description"],
+            result["calendar_diagnostics"]["child_1"]["week_offsets"]["0"]["attempts"][0]["payload"][
+                "sample_event_keys"
+            ],
+        )
+        self.assertEqual(1, result["message"]["unread_count"])
+        self.assertEqual({"total": 12.5}, result["setup_timings"])
+
+
+if __name__ == "__main__":
+    unittest.main()
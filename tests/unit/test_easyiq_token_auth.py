@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import datetime
 import importlib.util
+import json
 import sys
 import time
 import unittest
@@ -190,6 +191,115 @@ class CalendarGuardianLoginSession(FakeSession):
         return super().get(url, **kwargs)
 
 
+class CalendarBytesSession(FakeSession):
+    def __init__(self, payloads: list[bytes]) -> None:
+        super().__init__()
+        self.payloads = payloads
+        self.json_calls = 0
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        if "CalendarGetWeekplanEvents" in url:
+            body = self.payloads.pop(0) if len(self.payloads) > 1 else self.payloads[0]
+            session = self
+
+            class BytesResponse(FakeResponse):
+                def json(self) -> Any:
+                    session.json_calls += 1
+                    return json.loads(body)
+
+            response = BytesResponse([])
+            response.content = body
+            return response
+        return super().get(url, **kwargs)
+
+
+class CombinedCalendarSession(FakeSession):
+    def __init__(self, events: list[dict[str, Any]]) -> None:
+        super().__init__()
+        self.events = events
+        self.status_code = 200
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        if "CalendarGetWeekplanEvents" in url:
+            self.calls.append(
+                {
+                    "url": url,
+                    "params": dict(kwargs.get("params") or {}),
+                    "headers": kwargs.get("headers") or {},
+                }
+            )
+            return FakeResponse(self.events, self.status_code)
+        return super().get(url, **kwargs)
+
+
+class MessagePagesSession(FakeSession):
+    def __init__(self, pages: list[list[dict[str, Any]]]) -> None:
+        super().__init__()
+        self.pages = pages
+        self.thread_status = 200
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        params = dict(kwargs.get("params") or {})
+        if params.get("method") == "messaging.getThreads":
+            self.calls.append({"url": url, "params": params})
+            page = int(params.get("page", 0))
+            threads = self.pages[page] if page < len(self.pages) else []
+            return FakeResponse({"data": {"threads": threads}})
+        if params.get("method") == "messaging.getMessagesForThread":
+            self.calls.append({"url": url, "params": params})
+            if self.thread_status != 200:
+                return FakeResponse({}, self.thread_status)
+            return FakeResponse(
+                {
+                    "data": {
+                        "subject": f"Thread {params.get('threadId')}",
+                        "messages": [
+                            {
+                                "messageType": "Message",
+                                "text": {"html": "Body"},
+                                "sender": {"fullName": "Teacher"},
+                            }
+                        ],
+                    }
+                }
+            )
+        return super().get(url, **kwargs)
+
+
+class FakeFixtureResponse:
+    def __init__(self, payload: Any, status: int = 200) -> None:
+        self._payload = payload
+        self.status = status
+
+    async def __aenter__(self) -> FakeFixtureResponse:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    async def json(self) -> Any:
+        return self._payload
+
+
+class FakeFixtureSession:
+    closed = False
+
+    def __init__(self, documents: dict[str, Any]) -> None:
+        self.documents = documents
+        self.paths: list[str] = []
+
+    def get(self, url: str, **kwargs: Any) -> FakeFixtureResponse:
+        path = url.split("/fixtures/", 1)[1]
+        self.paths.append(path)
+        if path not in self.documents:
+            return FakeFixtureResponse(None, 404)
+        return FakeFixtureResponse(self.documents[path])
+
+
 class RecordingRefresher:
     def __init__(self, token_state: Any | None = None, fail: Exception | None = None) -> None:
         self.token_state = token_state
@@ -244,6 +354,176 @@ class EasyIQTokenAuthTests(unittest.TestCase):
         self.assertEqual("access-123", methods["presence.getDailyOverview"])
         self.assertEqual([{"id": "100", "name": "Ada"}], client.children)
 
+    def test_message_polling_pages_until_known_threads(self) -> None:
+        session = MessagePagesSession(
+            [
+                [
+                    {"id": 3, "read": False, "latestMessage": {"id": 30}},
+                    {"id": 2, "read": True, "latestMessage": {"id": 20}},
+                ],
+                [{"id": 1, "read": False, "latestMessage": {"id": 10}}],
+            ]
+        )
+        updates: list[Any] = []
+        client = client_module.EasyIQClient(
+            "guardian@example.test",
+            mitid_auth.AulaTokenState(
+                access_token="access-123",
+                refresh_token="refresh-123",
+                expires_at=time.time() + 3600,
+            ),
+            session_factory=lambda: session,
+            on_message_index_update=updates.append,
+        )
+        client._authenticated = True
+
+        def methods() -> list[tuple[str, Any]]:
+            calls = [
+                (
+                    call["params"]["method"],
+                    call["params"].get("threadId", call["params"].get("page")),
+                )
+                for call in session.calls
+            ]
+            session.calls.clear()
+            return calls
+
+        message = asyncio.run(client.get_messages())
+        self.assertEqual(
+            [
+                ("messaging.getThreads", 0),
+                ("messaging.getThreads", 1),
+                ("messaging.getThreads", 2),
+                ("messaging.getMessagesForThread", "3"),
+            ],
+            methods(),
+        )
+        self.assertEqual("Thread 3", message["subject"])
+        self.assertEqual(2, message["unread_count"])
+        self.assertEqual(2, client.unread_messages)
+        self.assertEqual(1, len(updates))
+
+        asyncio.run(client.get_messages())
+        self.assertEqual([("messaging.getThreads", 0)], methods())
+        self.assertEqual(1, len(updates))
+
+        session.pages = [
+            [
+                {"id": 1, "read": False, "latestMessage": {"id": 11}},
+                {"id": 3, "read": False, "latestMessage": {"id": 30}},
+            ],
+            [{"id": 2, "read": True, "latestMessage": {"id": 20}}],
+        ]
+        message = asyncio.run(client.get_messages())
+        self.assertEqual(
+            [("messaging.getThreads", 0), ("messaging.getMessagesForThread", "1")],
+            methods(),
+        )
+        self.assertEqual("Thread 1", message["subject"])
+        self.assertEqual(2, message["unread_count"])
+        self.assertEqual(2, len(updates))
+
+        # Reading thread 1 elsewhere makes thread 3 the newest unread again;
+        # its latest message is unchanged, so the parsed content is reused.
+        session.pages = [
+            [
+                {"id": 1, "read": True, "latestMessage": {"id": 11}},
+                {"id": 3, "read": False, "latestMessage": {"id": 30}},
+            ],
+        ]
+        message = asyncio.run(client.get_messages())
+        self.assertEqual([("messaging.getThreads", 0)], methods())
+        self.assertEqual("Thread 3", message["subject"])
+        self.assertEqual(1, message["unread_count"])
+        self.assertEqual(("3", "30"), client.message_key)
+
+        # Thread 3 is read elsewhere after dropping off page 0, so the
+        # incremental poll keeps it unread; the periodic full sweep fixes it.
+        session.pages = [
+            [{"id": 1, "read": True, "latestMessage": {"id": 11}}],
+            [{"id": 3, "read": True, "latestMessage": {"id": 30}}],
+            [{"id": 2, "read": True, "latestMessage": {"id": 20}}],
+        ]
+        asyncio.run(client.get_messages())
+        self.assertEqual([("messaging.getThreads", 0)], methods())
+        self.assertEqual(1, client.unread_messages)
+        client._message_full_sync_at = 0.0
+        message = asyncio.run(client.get_messages())
+        self.assertEqual(
+            [("messaging.getThreads", 0), ("messaging.getThreads", 1), ("messaging.getThreads", 2)],
+            methods(),
+        )
+        self.assertEqual(0, client.unread_messages)
+        self.assertEqual({}, message)
+
+    def test_unavailable_thread_content_does_not_show_an_older_message(self) -> None:
+        session = MessagePagesSession([[{"id": 1, "read": False, "latestMessage": {"id": 10}}]])
+        client = client_module.EasyIQClient(
+            "guardian@example.test",
+            mitid_auth.AulaTokenState(
+                access_token="access-123",
+                refresh_token="refresh-123",
+                expires_at=time.time() + 3600,
+            ),
+            session_factory=lambda: session,
+        )
+        client._authenticated = True
+        self.assertEqual("Thread 1", asyncio.run(client.get_messages())["subject"])
+
+        session.pages = [[{"id": 2, "read": False, "latestMessage": {"id": 20}}]]
+        session.thread_status = 500
+        message = asyncio.run(client.get_messages())
+
+        self.assertEqual({"unread_count": 2, "content_available": False}, message)
+        self.assertIsNone(client.message_key)
+
+    def test_fixture_snapshot_serves_cycle_and_falls_back_per_path(self) -> None:
+        profile = {"children": [{"id": "1", "name": "Ada"}, {"id": "2", "name": "Bo"}]}
+        session = FakeFixtureSession(
+            {
+                "aula_easyiq/snapshot": {
+                    "profile": profile,
+                    "calendar": {"1": [{"courses": "Math"}]},
+                    "presence": {"1": {"status": "Present"}},
+                    "messages": {"subject": "Hi", "unread_count": 1},
+                },
+                "aula_easyiq/calendar/2": [{"courses": "Art"}],
+            }
+        )
+        client = client_module.EasyIQClient(
+            "fixture",
+            None,
+            fixture_base_url="http://fixtures.test/fixtures",
+        )
+        client.session = session
+
+        async def cycle() -> None:
+            await client.authenticate()
+            await client._get_calendar_events("1")
+            await client._get_calendar_events("2")
+            await client.get_presence("1")
+            await client.get_messages()
+
+        asyncio.run(cycle())
+        self.assertEqual(["aula_easyiq/snapshot", "aula_easyiq/calendar/2"], session.paths)
+        self.assertEqual(["1", "2"], [child["id"] for child in client.children])
+        self.assertEqual(1, client.unread_messages)
+
+        session.paths.clear()
+        asyncio.run(cycle())
+        self.assertEqual(["aula_easyiq/snapshot", "aula_easyiq/calendar/2"], session.paths)
+
+        del session.documents["aula_easyiq/snapshot"]
+        session.documents["aula_easyiq/profile"] = profile
+        client._fixture_snapshot_supported = None
+        session.paths.clear()
+        asyncio.run(client.authenticate())
+        asyncio.run(client.authenticate())
+        self.assertEqual(
+            ["aula_easyiq/snapshot", "aula_easyiq/profile", "aula_easyiq/profile"],
+            session.paths,
+        )
+
     def test_token_refresh_and_reauth(self) -> None:
         fake_session = FakeSession()
         refreshed = mitid_auth.AulaTokenState(
@@ -317,6 +597,38 @@ class EasyIQTokenAuthTests(unittest.TestCase):
         self.assertEqual(1, diagnostics["raw_event_count"])
         self.assertEqual({"9": 1}, diagnostics["event_type_counts"])
 
+    def test_calendar_diagnostics_level_controls_capture(self) -> None:
+        def fetch(level: str) -> Any:
+            client = client_module.EasyIQClient(
+                "guardian@example.test",
+                mitid_auth.AulaTokenState(
+                    access_token="access-123",
+                    refresh_token="refresh-123",
+                    expires_at=time.time() + 3600,
+                ),
+                session_factory=CalendarFallbackSession,
+                diagnostics_level=level,
+            )
+            self.assertTrue(client.login())
+            self.assertEqual("Math", client._sync_get_calendar_events("100")[0]["courses"])
+            return client
+
+        self.assertNotIn("100", fetch("off").calendar_diagnostics)
+
+        summary = fetch("summary").calendar_diagnostics["100"]["week_offsets"]["0"]
+        self.assertEqual(
+            {"variant": "user-login/user-child", "status_code": 200, "events": 1},
+            summary["attempts"][-1],
+        )
+
+        full_client = fetch("full")
+        payload = full_client.calendar_diagnostics["100"]["week_offsets"]["0"]["attempts"][-1]["payload"]
+        self.assertEqual("Math", payload["sample_event_preview"]["courses"])
+        self.assertLessEqual(len(payload["sample_event_keys"]), client_module.DIAGNOSTICS_PREVIEW_KEYS)
+        # The first fetch was sampled; the next nine per child are not.
+        samples = [full_client._sample_diagnostics_preview("100") for _ in range(10)]
+        self.assertEqual([False] * 9 + [True], samples)
+
     def test_calendar_events_fall_back_to_guardian_login_context(self) -> None:
         fake_session = CalendarGuardianLoginSession()
         token_state = mitid_auth.AulaTokenState(
@@ -632,6 +944,466 @@ class EasyIQTokenAuthTests(unittest.TestCase):
 
         self.assertEqual("Math", events[0]["courses"])
 
+    def test_event_identity_prefers_payload_id_and_falls_back_to_content_hash(self) -> None:
+        with_id = client_module._extract_calendar_event_list(
+            [
+                {"Id": 42, "ItemType": 9, "start": "2026-06-22T08:00:00", "courses": "Math"},
+                {"Id": 42, "ItemType": 9, "start": "2026-06-22T10:00:00", "courses": "Math"},
+            ]
+        )
+        without_id = client_module._extract_calendar_event_list(
+            [{"itemType": 9, "start": "2026-06-22T08:00:00", "courses": "Math"}]
+        )
+        again = client_module._extract_calendar_event_list(
+            [{"courses": "Math", "start": "2026-06-22T08:00:00", "itemType": 9}]
+        )
+
+        self.assertEqual("id:9:42@2026-06-22T08:00:00/", with_id[0]["_easyiq_event_id"])
+        self.assertEqual("id:9:42", with_id[1]["_easyiq_series_id"])
+        self.assertNotEqual(with_id[0]["_easyiq_event_id"], with_id[1]["_easyiq_event_id"])
+        # Occurrences of a recurring lesson share the payload id but all survive merging.
+        merged = client_module._merge_unique_events([with_id, with_id[1:]])
+        self.assertEqual(
+            ["2026-06-22T08:00:00", "2026-06-22T10:00:00"], [event["start"] for event in merged]
+        )
+        self.assertTrue(without_id[0]["_easyiq_event_id"].startswith("hash:"))
+        self.assertEqual(without_id[0]["_easyiq_event_id"], again[0]["_easyiq_event_id"])
+
+    def test_business_day_events_drop_duplicates_from_overlapping_weeks(self) -> None:
+        client = client_module.EasyIQClient(
+            "guardian@example.test",
+            mitid_auth.AulaTokenState(
+                access_token="access-123",
+                refresh_token="refresh-123",
+                expires_at=time.time() + 3600,
+            ),
+            session_factory=lambda: FakeSession(),
+        )
+        next_business_date = self._next_business_date()
+        shared = {
+            "itemType": 9,
+            "start": f"{next_business_date.isoformat()}T08:00:00",
+            "courses": "Math",
+        }
+        nearest_week = 0 if datetime.date.today().weekday() < 5 else 1
+        weeks = {
+            nearest_week: client_module._extract_calendar_event_list(
+                [shared, {**shared, "courses": "Danish"}]
+            ),
+            nearest_week + 1: client_module._extract_calendar_event_list([shared]),
+        }
+
+        async def fake_calendar_events(child_id: str, weeks_ahead: int = 0) -> list[dict[str, Any]]:
+            return weeks.get(weeks_ahead, [])
+
+        client._get_calendar_events = fake_calendar_events
+        # Six business days always span two weeks.
+        events = asyncio.run(client.get_calendar_events_for_business_days("100", 6))
+
+        self.assertEqual(["Math", "Danish"], [event["courses"] for event in events])
+        self.assertEqual(1, client.calendar_diagnostics["100"]["duplicate_event_count"])
+
+    def test_business_day_fetch_refreshes_weeks_by_distance(self) -> None:
+        client = client_module.EasyIQClient(
+            "guardian@example.test",
+            mitid_auth.AulaTokenState(
+                access_token="access-123",
+                refresh_token="refresh-123",
+                expires_at=time.time() + 3600,
+            ),
+            session_factory=lambda: FakeSession(),
+        )
+        next_business_date = self._next_business_date()
+        event = {
+            "itemType": 9,
+            "start": f"{next_business_date.isoformat()}T08:00:00",
+            "courses": "Math",
+        }
+        calls: list[int] = []
+
+        async def fake_calendar_events(child_id: str, weeks_ahead: int = 0) -> list[dict[str, Any]]:
+            calls.append(weeks_ahead)
+            return client_module._extract_calendar_event_list([event])
+
+        client._get_calendar_events = fake_calendar_events
+        asyncio.run(
+            client.get_calendar_events_for_business_days("100", 6, refresh_interval=900)
+        )
+        nearest_week = 0 if datetime.date.today().weekday() < 5 else 1
+        self.assertEqual([nearest_week, nearest_week + 1], calls)
+
+        window = client._calendar_windows["100"]
+        fetched_at = datetime.datetime.now() - datetime.timedelta(seconds=1800)
+        for monday in window.weeks():
+            window.put(monday, fetched_at, window.get(monday)[1])
+        events = asyncio.run(
+            client.get_calendar_events_for_business_days("100", 6, refresh_interval=900)
+        )
+
+        self.assertEqual([nearest_week, nearest_week + 1, nearest_week], calls)
+        self.assertEqual(["Math"], [event["courses"] for event in events])
+        self.assertEqual(1, len(client.calendar_diagnostics["100"]["refreshed_weeks"]))
+
+    def _combined_calendar_client(self, events: list[dict[str, Any]]) -> Any:
+        session = CombinedCalendarSession(events)
+        client = client_module.EasyIQClient(
+            "guardian@example.test",
+            mitid_auth.AulaTokenState(
+                access_token="access-123",
+                refresh_token="refresh-123",
+                expires_at=time.time() + 3600,
+            ),
+            session_factory=lambda: session,
+        )
+        client.get_token = lambda widget_id: "widget-token"
+        for user_id, profile_id in (("100", "200"), ("101", "201")):
+            client._children_data[user_id] = {"userId": user_id, "id": profile_id}
+            client._calendar_request_variant_cache[user_id] = {
+                "name": "profile-login/user-child",
+                "login_id": profile_id,
+                "x_child": user_id,
+                "x_childfilter": user_id,
+                "x_login": "guardian@example.test",
+            }
+        return client, session
+
+    def test_combined_calendar_fetch_splits_one_response_per_child(self) -> None:
+        day = self._next_business_date().isoformat()
+        client, session = self._combined_calendar_client(
+            [
+                {"itemType": 9, "start": f"{day}T08:00:00", "courses": "Math", "childId": 200},
+                {"itemType": 9, "start": f"{day}T09:00:00", "courses": "Art", "childId": "101"},
+            ]
+        )
+
+        asyncio.run(client._prefetch_combined_calendar_weeks(["100", "101"], 1, 900))
+
+        self.assertEqual(1, len(session.calls))
+        self.assertEqual("100,101", session.calls[0]["headers"]["x-childfilter"])
+        self.assertTrue(client._combined_calendar_supported)
+        events = asyncio.run(
+            client.get_calendar_events_for_business_days("100", 1, refresh_interval=900)
+        )
+        sibling_events = asyncio.run(
+            client.get_calendar_events_for_business_days("101", 1, refresh_interval=900)
+        )
+        self.assertEqual(1, len(session.calls))
+        self.assertEqual(["Math"], [event["courses"] for event in events])
+        self.assertEqual(["Art"], [event["courses"] for event in sibling_events])
+
+    def test_combined_calendar_fetch_remembers_unsupported_accounts(self) -> None:
+        day = self._next_business_date().isoformat()
+        client, session = self._combined_calendar_client(
+            [{"itemType": 9, "start": f"{day}T08:00:00", "courses": "Math"}]
+        )
+
+        asyncio.run(client._prefetch_combined_calendar_weeks(["100", "101"], 1, 900))
+        self.assertIs(False, client._combined_calendar_supported)
+        self.assertEqual({}, client._calendar_windows["100"]._weeks)
+
+        asyncio.run(client._prefetch_combined_calendar_weeks(["100", "101"], 1, 900))
+        self.assertEqual(1, len(session.calls))
+
+    def test_combined_calendar_fetch_pauses_after_transient_failures(self) -> None:
+        day = self._next_business_date().isoformat()
+        client, session = self._combined_calendar_client(
+            [
+                {"itemType": 9, "start": f"{day}T08:00:00", "courses": "Math", "childId": 200},
+                {"itemType": 9, "start": f"{day}T09:00:00", "courses": "Art", "childId": "101"},
+            ]
+        )
+        session.status_code = 503
+
+        asyncio.run(client._prefetch_combined_calendar_weeks(["100", "101"], 1, 900))
+        asyncio.run(client._prefetch_combined_calendar_weeks(["100", "101"], 1, 900))
+        self.assertIsNone(client._combined_calendar_supported)
+        self.assertEqual(1, len(session.calls))
+        self.assertGreater(client.update_diagnostics["combined_calendar_fetch"]["retry_in"], 0)
+
+        session.status_code = 200
+        client._combined_calendar_retry_at = 0.0
+        asyncio.run(client._prefetch_combined_calendar_weeks(["100", "101"], 1, 900))
+        self.assertTrue(client._combined_calendar_supported)
+
+        session.status_code = 404
+        client._calendar_windows.clear()
+        asyncio.run(client._prefetch_combined_calendar_weeks(["100", "101"], 1, 900))
+        self.assertIs(False, client._combined_calendar_supported)
+
+    def test_calendar_weeks_fetch_missing_weeks_once_and_cache_them(self) -> None:
+        client = client_module.EasyIQClient(
+            "guardian@example.test",
+            mitid_auth.AulaTokenState(
+                access_token="access-123",
+                refresh_token="refresh-123",
+                expires_at=time.time() + 3600,
+            ),
+            session_factory=lambda: FakeSession(),
+        )
+        today = datetime.date.today()
+        this_monday = today - datetime.timedelta(days=today.weekday())
+        past_monday = this_monday - datetime.timedelta(weeks=2)
+        later_monday = this_monday - datetime.timedelta(weeks=1)
+        tuesday = past_monday + datetime.timedelta(days=1)
+        weeks = {
+            -2: client_module._extract_calendar_event_list(
+                [
+                    {"itemType": 9, "start": f"{tuesday.isoformat()}T08:00:00", "courses": "Math"},
+                    {"itemType": 4, "start": f"{tuesday.isoformat()}T12:00:00", "courses": "Read"},
+                    {"itemType": 9, "start": f"{later_monday.isoformat()}T08:00:00", "courses": "Spill"},
+                ]
+            ),
+        }
+        calls: list[tuple[int, bool]] = []
+
+        async def fake_calendar_events(
+            child_id: str,
+            weeks_ahead: int = 0,
+            *,
+            on_demand: bool = False,
+        ) -> list[dict[str, Any]]:
+            calls.append((weeks_ahead, on_demand))
+            await asyncio.sleep(0)
+            return weeks.get(weeks_ahead, [])
+
+        client._get_calendar_events = fake_calendar_events
+        covered_later_week = [later_monday + datetime.timedelta(days=day) for day in range(5)]
+
+        async def browse() -> tuple[list[Any], list[Any]]:
+            return await asyncio.gather(
+                client.get_calendar_weeks(
+                    "100",
+                    past_monday,
+                    later_monday + datetime.timedelta(days=6),
+                    skip_dates=covered_later_week,
+                ),
+                client.get_calendar_weeks("100", tuesday, tuesday),
+            )
+
+        first, second = asyncio.run(browse())
+
+        self.assertEqual([(-2, True)], calls)
+        self.assertIs(first[0], second[0])
+        self.assertEqual(past_monday, first[0].monday)
+        self.assertEqual(["Math"], [event["courses"] for event in first[0].weekplan])
+        self.assertEqual(["Read"], [assignment["title"] for assignment in first[0].homework])
+        self.assertEqual({}, client._calendar_response_cache)
+
+        cached = asyncio.run(client.get_calendar_weeks("100", tuesday, tuesday))
+        self.assertIs(first[0], cached[0])
+        self.assertEqual(1, len(calls))
+
+    def test_browsed_weeks_leave_no_week_diagnostics(self) -> None:
+        client = client_module.EasyIQClient(
+            "guardian@example.test",
+            mitid_auth.AulaTokenState(
+                access_token="access-123",
+                refresh_token="refresh-123",
+                expires_at=time.time() + 3600,
+            ),
+            session_factory=lambda: FakeSession(),
+        )
+        client.get_token = lambda widget_id: ""
+
+        for offset in range(20, 40):
+            self.assertEqual([], client._sync_get_calendar_events("100", offset, on_demand=True))
+        self.assertEqual({}, client.calendar_diagnostics)
+
+        client._sync_get_calendar_events("100", 1)
+        self.assertEqual(
+            "widget_token_failed",
+            client.calendar_diagnostics["100"]["week_offsets"]["1"]["stage"],
+        )
+
+    def test_calendar_views_reference_shared_event_store_by_id(self) -> None:
+        client = client_module.EasyIQClient(
+            "guardian@example.test",
+            mitid_auth.AulaTokenState(
+                access_token="access-123",
+                refresh_token="refresh-123",
+                expires_at=time.time() + 3600,
+            ),
+            session_factory=lambda: FakeSession(),
+        )
+        next_business_date = self._next_business_date()
+        events = client_module._extract_calendar_event_list(
+            [
+                {
+                    "itemType": 9,
+                    "start": f"{next_business_date.isoformat()}T08:00:00",
+                    "courses": "Math",
+                },
+                {
+                    "itemType": 4,
+                    "start": f"{next_business_date.isoformat()}T12:00:00",
+                    "courses": "Read pages",
+                },
+            ]
+        )
+
+        client._store_calendar_views("100", events, weekplan_days=1, homework_days=1)
+
+        store = client.event_store["100"]
+        weekplan = client.weekplan_data["100"]
+        homework = client.homework_data["100"]
+        self.assertNotIn("raw_data", weekplan)
+        self.assertNotIn("raw_data", homework)
+        self.assertEqual(2, weekplan["raw_event_count"])
+        self.assertEqual(["Math"], [event["courses"] for event in store.resolve(weekplan["event_ids"])])
+        assignment = homework["assignments"][0]
+        self.assertNotIn("raw_data", assignment)
+        self.assertIs(events[1], store.get(assignment["event_id"]))
+
+    def test_unchanged_calendar_payload_reuses_normalized_events(self) -> None:
+        body = json.dumps(
+            [{"itemType": 9, "start": "2026/06/22 08:00", "courses": "Math"}]
+        ).encode()
+        changed_body = json.dumps(
+            [{"itemType": 9, "start": "2026/06/22 08:00", "courses": "Danish"}]
+        ).encode()
+        fake_session = CalendarBytesSession([body, body, changed_body])
+        client = client_module.EasyIQClient(
+            "guardian@example.test",
+            mitid_auth.AulaTokenState(
+                access_token="access-123",
+                refresh_token="refresh-123",
+                expires_at=time.time() + 3600,
+            ),
+            session_factory=lambda: fake_session,
+        )
+        self.assertTrue(client.login())
+
+        first = client._sync_get_calendar_events("100")
+        second = client._sync_get_calendar_events("100")
+
+        self.assertIs(first, second)
+        self.assertEqual(1, fake_session.json_calls)
+        week_diag = client.calendar_diagnostics["100"]["week_offsets"]["0"]
+        self.assertTrue(week_diag["unchanged"])
+
+        third = client._sync_get_calendar_events("100")
+
+        self.assertEqual("Danish", third[0]["courses"])
+        self.assertNotEqual(first[0]["_easyiq_content_hash"], third[0]["_easyiq_content_hash"])
+        self.assertFalse(client.calendar_diagnostics["100"]["week_offsets"]["0"]["unchanged"])
+
+    def test_unchanged_event_store_keeps_views_and_marks_child_unchanged(self) -> None:
+        client = client_module.EasyIQClient(
+            "guardian@example.test",
+            mitid_auth.AulaTokenState(
+                access_token="access-123",
+                refresh_token="refresh-123",
+                expires_at=time.time() + 3600,
+            ),
+            session_factory=lambda: FakeSession(),
+        )
+        next_business_date = self._next_business_date()
+        raw_event = {
+            "itemType": 9,
+            "start": f"{next_business_date.isoformat()}T08:00:00",
+            "courses": "Math",
+        }
+
+        client._store_calendar_views(
+            "100",
+            client_module._extract_calendar_event_list([raw_event]),
+            weekplan_days=1,
+            homework_days=1,
+        )
+        first_view = client.weekplan_data["100"]
+        self.assertTrue(client.calendar_changed["100"])
+
+        client._store_calendar_views(
+            "100",
+            client_module._extract_calendar_event_list([raw_event]),
+            weekplan_days=1,
+            homework_days=1,
+        )
+        self.assertIs(first_view, client.weekplan_data["100"])
+        self.assertFalse(client.calendar_changed["100"])
+
+        client._store_calendar_views(
+            "100",
+            client_module._extract_calendar_event_list([{**raw_event, "courses": "Art"}]),
+            weekplan_days=1,
+            homework_days=1,
+        )
+        self.assertTrue(client.calendar_changed["100"])
+        self.assertNotEqual(first_view["revision"], client.weekplan_data["100"]["revision"])
+
+    def test_calendar_changes_cover_both_windows_but_not_past_days(self) -> None:
+        client = client_module.EasyIQClient(
+            "guardian@example.test",
+            mitid_auth.AulaTokenState(
+                access_token="access-123",
+                refresh_token="refresh-123",
+                expires_at=time.time() + 3600,
+            ),
+            session_factory=lambda: FakeSession(),
+        )
+        day = self._next_business_date()
+        next_day = day + datetime.timedelta(days=1)
+        lesson = {"Id": 1, "itemType": 9, "start": f"{day.isoformat()}T08:00:00", "courses": "Math"}
+        art = {"Id": 2, "itemType": 9, "start": f"{next_day.isoformat()}T08:00:00", "courses": "Art"}
+
+        def store(dates: list[datetime.date], events: list[dict[str, Any]]) -> dict[str, list[Any]]:
+            client._calendar_target_dates["100"] = [date.isoformat() for date in dates]
+            client.calendar_changes = {}
+            client._store_calendar_views(
+                "100",
+                client_module._extract_calendar_event_list(events),
+                weekplan_days=1,
+                homework_days=1,
+            )
+            changes = client.calendar_changes.get("100", {})
+            return {kind: [event["summary"] for event in changes.get(kind, [])] for kind in ("added", "removed", "changed")}
+
+        # Without a previous store the first cycle is a silent baseline.
+        self.assertEqual({"added": [], "removed": [], "changed": []}, store([day], [lesson]))
+        # A day entering the window reports its events as added; moves are one change.
+        moved = {**lesson, "start": f"{day.isoformat()}T10:00:00"}
+        self.assertEqual(
+            {"added": ["Art"], "removed": [], "changed": ["Math"]},
+            store([day, next_day], [moved, art]),
+        )
+        self.assertTrue(client.calendar_changes["100"]["changed"][0]["moved"])
+        # A day that slid into the past is not reported; a cancelled event is.
+        self.assertEqual({"added": [], "removed": ["Art"], "changed": []}, store([next_day], []))
+
+    def test_view_html_is_rendered_on_first_read_and_memoized(self) -> None:
+        client = client_module.EasyIQClient(
+            "guardian@example.test",
+            mitid_auth.AulaTokenState(
+                access_token="access-123",
+                refresh_token="refresh-123",
+                expires_at=time.time() + 3600,
+            ),
+            session_factory=lambda: FakeSession(),
+        )
+        day = self._next_business_date()
+        events = client_module._extract_calendar_event_list(
+            [{"itemType": 9, "start": f"{day.isoformat()}T08:00:00", "courses": "Math"}]
+        )
+        renders: list[int] = []
+        build_weekplan_html = client._build_weekplan_html
+
+        def counting_build(weekplan_events: list[dict[str, Any]], days: int = 5) -> str:
+            renders.append(len(weekplan_events))
+            return build_weekplan_html(weekplan_events, days)
+
+        client._build_weekplan_html = counting_build
+        client._store_calendar_views("100", events, weekplan_days=1, homework_days=1)
+
+        self.assertNotIn("html_content", client.weekplan_data["100"])
+        self.assertEqual([], renders)
+
+        html = client.weekplan_html("100")
+        self.assertIn("Math", html)
+        self.assertIs(html, client.weekplan_html("100"))
+        self.assertEqual([1], renders)
+        self.assertIn("No homework assignments found.", client.homework_html("100"))
+        self.assertEqual("", client.weekplan_html("unknown"))
+
 
 if __name__ == "__main__":
     unittest.main()
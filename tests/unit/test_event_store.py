@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import importlib.util
+import unittest
+from pathlib import Path
+
+
+def load_event_store_module():
+    module_path = (
+        Path(__file__).resolve().parents[2]
+        / "custom_components"
+        / "aula_easyiq"
+        / "event_store.py"
+    )
+    spec = importlib.util.spec_from_file_location("easyiq_event_store", module_path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+event_store = load_event_store_module()
+
+
+def make_event(event_id: str, courses: str, item_type: int = 9) -> dict[str, object]:
+    return {
+        "_easyiq_event_id": event_id,
+        "itemType": item_type,
+        "start": "2026-06-22T08:00:00",
+        "courses": courses,
+    }
+
+
+class ChildEventStoreTests(unittest.TestCase):
+    def test_store_indexes_events_by_id_and_keeps_first_copy(self) -> None:
+        math = make_event("a", "Math")
+        store = event_store.ChildEventStore([math, make_event("b", "Danish"), make_event("a", "Other")])
+
+        self.assertEqual(2, len(store))
+        self.assertEqual(("a", "b"), store.event_ids)
+        self.assertIs(math, store.get("a"))
+        self.assertIsNone(store.get("missing"))
+
+    def test_resolve_skips_unknown_ids_and_honours_limit(self) -> None:
+        store = event_store.ChildEventStore(
+            [make_event("a", "Math"), make_event("b", "Danish"), make_event("c", "Art")]
+        )
+
+        self.assertEqual(
+            ["Danish", "Art"],
+            [event["courses"] for event in store.resolve(["b", "gone", "c"])],
+        )
+        self.assertEqual(["Math"], [event["courses"] for event in store.resolve(["a", "b"], limit=1)])
+
+    def test_view_events_resolve_through_coordinator_data(self) -> None:
+        store = event_store.ChildEventStore([make_event("a", "Math"), make_event("b", "Danish")])
+        data = {
+            "event_store": {"100": store},
+            "weekplan_data": {"100": {"event_ids": ["b"]}},
+        }
+
+        self.assertEqual(
+            ["Danish"],
+            [event["courses"] for event in event_store.view_events(data, "weekplan_data", "100")],
+        )
+        self.assertEqual([], event_store.view_events(data, "weekplan_data", "200"))
+        self.assertIs(event_store.EMPTY_STORE, event_store.child_event_store(None, "100"))
+
+    def test_revision_tracks_event_content(self) -> None:
+        first = event_store.ChildEventStore([{**make_event("a", "Math"), "_easyiq_content_hash": "h1"}])
+        same = event_store.ChildEventStore([{**make_event("a", "Math"), "_easyiq_content_hash": "h1"}])
+        edited = event_store.ChildEventStore([{**make_event("a", "Math"), "_easyiq_content_hash": "h2"}])
+
+        self.assertEqual(first.revision, same.revision)
+        self.assertNotEqual(first.revision, edited.revision)
+        self.assertEqual(
+            "r1",
+            event_store.view_revision({"weekplan_data": {"100": {"revision": "r1"}}}, "weekplan_data", "100"),
+        )
+
+
+class DiffEventStoresTests(unittest.TestCase):
+    def test_diff_reports_added_removed_and_moved_events(self) -> None:
+        previous = event_store.ChildEventStore(
+            [
+                {**make_event("keep", "Math"), "_easyiq_content_hash": "k"},
+                {**make_event("move", "Danish"), "_easyiq_content_hash": "m1"},
+                {**make_event("cancel", "Art"), "_easyiq_content_hash": "c"},
+            ]
+        )
+        current = event_store.ChildEventStore(
+            [
+                {**make_event("keep", "Math"), "_easyiq_content_hash": "k"},
+                {
+                    **make_event("move", "Danish"),
+                    "start": "2026-06-22T10:00:00",
+                    "_easyiq_content_hash": "m2",
+                },
+                {**make_event("new", "Music"), "_easyiq_content_hash": "n"},
+            ]
+        )
+
+        diff = event_store.diff_event_stores(previous, current)
+
+        self.assertEqual(["new"], [event["id"] for event in diff["added"]])
+        self.assertEqual(["cancel"], [event["id"] for event in diff["removed"]])
+        self.assertEqual(["move"], [event["id"] for event in diff["changed"]])
+        moved = diff["changed"][0]
+        self.assertTrue(moved["moved"])
+        self.assertEqual("2026-06-22T08:00:00", moved["previous_start"])
+        self.assertEqual("2026-06-22T10:00:00", moved["start"])
+
+    def test_diff_ignores_out_of_scope_events_and_identical_revisions(self) -> None:
+        previous = event_store.ChildEventStore([{**make_event("old-day", "Math"), "_easyiq_content_hash": "a"}])
+        current = event_store.ChildEventStore([{**make_event("new-day", "Art"), "_easyiq_content_hash": "b"}])
+
+        diff = event_store.diff_event_stores(previous, current, in_scope=lambda event: False)
+
+        self.assertEqual({"added": [], "removed": [], "changed": []}, diff)
+        self.assertEqual(
+            {"added": [], "removed": [], "changed": []},
+            event_store.diff_event_stores(previous, previous),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
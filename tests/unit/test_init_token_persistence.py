@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import importlib.util
 import sys
 import types
 import unittest
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -53,6 +55,26 @@ def install_dependency_stubs() -> None:
     class HomeAssistantError(Exception):
         pass
 
+    helpers = types.ModuleType("homeassistant.helpers")
+    storage = types.ModuleType("homeassistant.helpers.storage")
+
+    class Store:
+        def __init__(self, hass: Any, version: int, key: str) -> None:
+            self.hass = hass
+            self.version = version
+            self.key = key
+            self.saved: list[Any] = []
+
+        async def async_load(self) -> Any:
+            return None
+
+        def async_delay_save(self, data_func: Any, delay: float = 0) -> None:
+            self.saved.append(data_func())
+
+    storage.Store = Store
+    sys.modules["homeassistant.helpers"] = helpers
+    sys.modules["homeassistant.helpers.storage"] = storage
+
     exceptions.ConfigEntryAuthFailed = ConfigEntryAuthFailed
     exceptions.ConfigEntryNotReady = ConfigEntryNotReady
     exceptions.HomeAssistantError = HomeAssistantError
@@ -66,10 +88,21 @@ def install_dependency_stubs() -> None:
     sys.modules["custom_components.aula_easyiq"] = aula_easyiq
 
     integration_const = types.ModuleType("custom_components.aula_easyiq.const")
+    integration_const.CONF_API_BASE_URL = "api_base_url"
+    integration_const.CONF_BLOCKING_DETECTOR = "blocking_detector"
+    integration_const.CONF_BLOCKING_THRESHOLD = "blocking_threshold_ms"
+    integration_const.CONF_CALENDAR_URL = "calendar_url"
+    integration_const.CONF_DIAGNOSTICS_LEVEL = "diagnostics_level"
     integration_const.CONF_FIXTURE_BASE_URL = "fixture_base_url"
     integration_const.CONF_MITID_USERNAME = "mitid_username"
     integration_const.CONF_PASSWORD = "password"
     integration_const.CONF_REAUTH_REQUIRED = "reauth_required"
+    integration_const.CONF_TOKEN_URL = "token_url"
+    integration_const.CONF_TRACE_JOURNAL = "trace_journal"
+    integration_const.DEFAULT_BLOCKING_DETECTOR = False
+    integration_const.DEFAULT_BLOCKING_THRESHOLD = 50
+    integration_const.DEFAULT_DIAGNOSTICS_LEVEL = "summary"
+    integration_const.DEFAULT_TRACE_JOURNAL = False
     integration_const.DOMAIN = "aula_easyiq"
     integration_const.STARTUP = "startup %s"
     sys.modules["custom_components.aula_easyiq.const"] = integration_const
@@ -123,13 +156,18 @@ def load_integration_init():
         "homeassistant.core",
         "homeassistant.loader",
         "homeassistant.exceptions",
+        "homeassistant.helpers",
+        "homeassistant.helpers.storage",
         "custom_components",
         "custom_components.aula_easyiq",
         "custom_components.aula_easyiq.const",
         "custom_components.aula_easyiq.client",
+        "custom_components.aula_easyiq.loop_blocking",
+        "custom_components.aula_easyiq.message_index",
         "custom_components.aula_easyiq.migration",
         "custom_components.aula_easyiq.mitid_auth",
         "custom_components.aula_easyiq.sensor",
+        "custom_components.aula_easyiq.trace_journal",
     ]
     previous_modules = {name: sys.modules.get(name) for name in stub_names}
 
@@ -219,6 +257,82 @@ class InitTokenPersistenceTests(unittest.TestCase):
         self.assertEqual(2.0, data["token_expires_at"])
         self.assertTrue(data["weekplan"])
 
+    def test_message_index_persist_snapshots_index_on_loop(self) -> None:
+        hass = FakeHass()
+        store = integration_init.Store(hass, 1, "aula_easyiq.entry.messages")
+        message_index = integration_init.MessageThreadIndex()
+        message_index.apply_threads([{"id": 55, "read": False, "latestMessage": {"id": 9}}])
+
+        integration_init._schedule_message_index_persist(hass, store, message_index)
+        message_index.apply_threads([{"id": 56, "read": False, "latestMessage": {"id": 10}}])
+
+        self.assertEqual(1, len(hass.loop.callbacks))
+        self.assertEqual("9", store.saved[0]["watermark"])
+        self.assertEqual(["55"], list(store.saved[0]["threads"]))
+
+
+class FailingCoordinator:
+    def __init__(self, hass: Any, client: Any, entry: Any, *, blocking_detector: Any = None) -> None:
+        self.blocking_detector = blocking_detector
+
+    async def async_config_entry_first_refresh(self) -> None:
+        raise RuntimeError("backend unavailable")
+
+
+class BlockingDetectorLifecycleTests(unittest.TestCase):
+    def test_failed_first_refresh_stops_the_blocking_detector(self) -> None:
+        created: list[Any] = []
+
+        def coordinator(*args: Any, **kwargs: Any) -> FailingCoordinator:
+            created.append(FailingCoordinator(*args, **kwargs))
+            return created[-1]
+
+        hass = types.SimpleNamespace(
+            data={}, config=types.SimpleNamespace(path=lambda *parts: "/".join(parts))
+        )
+        entry = types.SimpleNamespace(
+            entry_id="entry",
+            title="EasyIQ",
+            data={"fixture_base_url": "http://standin.test"},
+            options={"blocking_detector": True},
+        )
+
+        with patch.object(integration_init, "EasyIQClient", lambda **kwargs: object()), patch.object(
+            integration_init, "EasyIQDataUpdateCoordinator", coordinator
+        ):
+            with self.assertRaises(integration_init.ConfigEntryNotReady):
+                asyncio.run(integration_init.async_setup_entry(hass, entry))
+
+        self.assertTrue(created[0].blocking_detector._stop.is_set())
+
+    def test_unload_stops_the_blocking_detector_even_when_a_platform_fails(self) -> None:
+        detector = integration_init.LoopBlockingDetector(50, sample=False)
+        unsubscribed: list[bool] = []
+
+        async def async_unload_platforms(entry: Any, platforms: Any) -> bool:
+            return False
+
+        hass = types.SimpleNamespace(
+            data={
+                "aula_easyiq": {
+                    "entry": {
+                        "coordinator": types.SimpleNamespace(blocking_detector=detector),
+                        "unsub_options_update_listener": lambda: unsubscribed.append(True),
+                    }
+                }
+            },
+            config_entries=types.SimpleNamespace(async_unload_platforms=async_unload_platforms),
+        )
+
+        unloaded = asyncio.run(
+            integration_init.async_unload_entry(hass, types.SimpleNamespace(entry_id="entry"))
+        )
+
+        self.assertFalse(unloaded)
+        self.assertEqual([True], unsubscribed)
+        self.assertTrue(detector._stop.is_set())
+        self.assertIn("entry", hass.data["aula_easyiq"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import sys
+import time
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = ROOT / "scripts"
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+harness = load_module("load_harness", SCRIPTS_DIR / "load_harness.py")
+
+
+class LoadHarnessTests(unittest.TestCase):
+    def test_distribution_interpolates_percentiles(self) -> None:
+        samples = [float(value) for value in range(1, 101)]
+
+        self.assertEqual(50.5, harness.percentile(samples, 50))
+        self.assertAlmostEqual(95.05, harness.percentile(samples, 95))
+        self.assertEqual(0.0, harness.percentile([], 95))
+        self.assertEqual(
+            {"count": 1, "p50": 2.0, "p95": 2.0, "p99": 2.0, "max": 2.0},
+            harness.distribution([2.0]),
+        )
+
+    def test_loop_monitor_records_lag_from_blocking_work(self) -> None:
+        async def run() -> list[float]:
+            monitor = harness.LoopMonitor(interval=0.005)
+            monitor.start()
+            await asyncio.sleep(0.02)
+            time.sleep(0.05)
+            await asyncio.sleep(0.02)
+            await monitor.stop()
+            return monitor.lag
+
+        lag = asyncio.run(run())
+
+        self.assertGreaterEqual(max(lag), 0.04)
+
+    def test_entry_data_points_client_at_standin_backend(self) -> None:
+        data = harness.entry_data(3, "http://127.0.0.1:9000")
+
+        self.assertEqual("guardian3@example.test", data["mitid_username"])
+        self.assertEqual("http://127.0.0.1:9000/api/v", data["api_base_url"])
+        self.assertTrue(data["calendar_url"].endswith("/Calendar/CalendarGetWeekplanEvents"))
+        self.assertGreater(data["token_expires_at"], time.time())
+        self.assertEqual({0}, set(harness.entry_options(0).values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import sys
+import time
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+MODULE_PATH = ROOT / "custom_components" / "aula_easyiq" / "loop_blocking.py"
+SPEC = importlib.util.spec_from_file_location("easyiq_loop_blocking", MODULE_PATH)
+loop_blocking = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = loop_blocking
+assert SPEC.loader is not None
+SPEC.loader.exec_module(loop_blocking)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeEntity:
+    def __init__(self, clock: FakeClock) -> None:
+        self.clock = clock
+        self.writes = 0
+
+    def _handle_coordinator_update(self) -> None:
+        self.clock.now += 0.005
+        self.async_write_ha_state()
+
+    def async_write_ha_state(self) -> None:
+        self.clock.now += 0.12
+        self.writes += 1
+
+
+class LoopBlockingDetectorTests(unittest.TestCase):
+    def test_slow_sections_are_counted_and_logged_with_a_stack(self) -> None:
+        clock = FakeClock()
+        detector = loop_blocking.LoopBlockingDetector(50, clock=clock, sample=False)
+        entity = FakeEntity(clock)
+        detector.instrument_entity(entity)
+
+        with self.assertLogs(loop_blocking.__name__, level="WARNING") as logs:
+            entity._handle_coordinator_update()
+        with detector.section("fast"):
+            clock.now += 0.01
+
+        report = detector.as_dict()
+        self.assertEqual(1, entity.writes)
+        self.assertEqual(2, report["slow_sections"])
+        self.assertEqual(
+            {"calls": 1, "slow": 1, "total_ms": 120.0, "max_ms": 120.0},
+            report["sections"]["FakeEntity.async_write_ha_state"],
+        )
+        self.assertEqual(0, report["sections"]["fast"]["slow"])
+        self.assertIn("125 ms in FakeEntity._handle_coordinator_update", logs.output[-1])
+        self.assertIn("test_loop_blocking.py", logs.output[-1])
+        self.assertTrue(report["recent_slow"][0]["stack"])
+
+    def test_coroutine_steps_are_timed_separately(self) -> None:
+        clock = FakeClock()
+        detector = loop_blocking.LoopBlockingDetector(50, clock=clock, sample=False)
+
+        async def update(steps: int) -> int:
+            for _ in range(steps):
+                clock.now += 0.03
+                await asyncio.sleep(0)
+            clock.now += 0.07
+            return steps
+
+        timed = detector.wrap_coroutine_function("coordinator_update", update)
+        with self.assertLogs(loop_blocking.__name__, level="WARNING"):
+            result = asyncio.run(timed(3))
+
+        stats = detector.as_dict()["sections"]["coordinator_update"]
+        self.assertEqual(3, result)
+        self.assertEqual(4, stats["calls"])
+        self.assertEqual(1, stats["slow"])
+        self.assertEqual(70.0, stats["max_ms"])
+
+    def test_sampler_captures_the_blocking_frame(self) -> None:
+        detector = loop_blocking.LoopBlockingDetector(10)
+        try:
+            with self.assertLogs(loop_blocking.__name__, level="WARNING"):
+                with detector.section("sleepy"):
+                    _block_for(0.08)
+        finally:
+            detector.close()
+
+        stack = detector.as_dict()["recent_slow"][0]["stack"]
+        self.assertIn("_block_for", stack[-1])
+
+
+def _block_for(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+if __name__ == "__main__":
+    unittest.main()
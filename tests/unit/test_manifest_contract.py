@@ -25,7 +25,6 @@ class ManifestContractTests(unittest.TestCase):
             "beautifulsoup4",
             "lxml",
             "pycryptodome",
-            "pytz",
             "qrcode",
             "requests",
         ):
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import importlib.util
+import unittest
+from pathlib import Path
+
+
+def load_message_index_module():
+    module_path = (
+        Path(__file__).resolve().parents[2]
+        / "custom_components"
+        / "aula_easyiq"
+        / "message_index.py"
+    )
+    spec = importlib.util.spec_from_file_location("easyiq_message_index", module_path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+message_index = load_message_index_module()
+
+
+def thread(thread_id: int, latest_id: int, read: bool = False) -> dict[str, object]:
+    return {"id": thread_id, "read": read, "latestMessage": {"id": latest_id}}
+
+
+class MessageThreadIndexTests(unittest.TestCase):
+    def test_latest_key_prefers_latest_message_id(self) -> None:
+        self.assertEqual("9", message_index.thread_latest_key(thread(1, 9)))
+        self.assertEqual(
+            "2026-06-22T08:00:00",
+            message_index.thread_latest_key({"id": 1, "lastUpdatedDate": "2026-06-22T08:00:00"}),
+        )
+        self.assertEqual("", message_index.thread_latest_key({"id": 1}))
+
+    def test_apply_threads_reports_changes_and_keeps_recency_order(self) -> None:
+        index = message_index.MessageThreadIndex()
+
+        self.assertEqual(["3", "2", "1"], index.apply_threads([thread(3, 30), thread(2, 20, True), thread(1, 10)]))
+        self.assertEqual(2, index.unread_count)
+        self.assertEqual(("3", "30"), index.newest_unread())
+        self.assertEqual("30", index.watermark)
+        self.assertTrue(index.dirty)
+
+        index.dirty = False
+        self.assertTrue(index.is_unchanged(thread(3, 30)))
+        self.assertEqual(["1"], index.apply_threads([thread(1, 11), thread(3, 30)]))
+        self.assertEqual(("1", "11"), index.newest_unread())
+        self.assertEqual(["1", "3", "2"], list(index.as_dict()["threads"]))
+        self.assertTrue(index.dirty)
+
+    def test_unchanged_poll_leaves_index_clean(self) -> None:
+        index = message_index.MessageThreadIndex()
+        index.apply_threads([thread(3, 30), thread(2, 20, True)])
+        index.dirty = False
+
+        self.assertEqual([], index.apply_threads([thread(3, 30), thread(2, 20, True)]))
+        self.assertFalse(index.dirty)
+
+    def test_complete_sweep_drops_threads_it_did_not_see(self) -> None:
+        index = message_index.MessageThreadIndex()
+        index.apply_threads([thread(3, 30), thread(2, 20), thread(1, 10)])
+
+        # Thread 1 was read elsewhere; an incremental poll of the newest page keeps it unread.
+        index.apply_threads([thread(3, 30)])
+        self.assertEqual(3, index.unread_count)
+
+        index.apply_threads([thread(3, 30), thread(2, 20, True)], complete=True)
+        self.assertEqual(1, index.unread_count)
+        self.assertEqual(["3", "2"], list(index.as_dict()["threads"]))
+
+    def test_round_trips_through_storage_dict(self) -> None:
+        index = message_index.MessageThreadIndex()
+        index.apply_threads([thread(3, 30), thread(2, 20, True)])
+
+        restored = message_index.MessageThreadIndex.from_dict(index.as_dict())
+
+        self.assertEqual(index.as_dict(), restored.as_dict())
+        self.assertEqual(0, len(message_index.MessageThreadIndex.from_dict({"version": 99})))
+        self.assertEqual(0, len(message_index.MessageThreadIndex.from_dict(None)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+MODULE_PATH = ROOT / "custom_components" / "aula_easyiq" / "metrics.py"
+SPEC = importlib.util.spec_from_file_location("easyiq_metrics", MODULE_PATH)
+metrics = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = metrics
+assert SPEC.loader is not None
+SPEC.loader.exec_module(metrics)
+
+
+class PrometheusRenderTests(unittest.TestCase):
+    def test_renders_counters_ratios_and_cumulative_histograms_per_entry(self) -> None:
+        first = metrics.IntegrationMetrics()
+        first.inc("requests_total", {"endpoint": "CalendarGetWeekplanEvents", "status": 403})
+        first.inc("requests_total", {"endpoint": "CalendarGetWeekplanEvents", "status": 200})
+        first.inc("response_bytes_total", {"endpoint": "CalendarGetWeekplanEvents"}, 2048)
+        first.cache_lookup("html", True)
+        first.cache_lookup("html", True)
+        first.cache_lookup("html", False)
+        first.cache_lookup("html", True)
+        first.observe("request_duration_seconds", 0.02, {"endpoint": "CalendarGetWeekplanEvents"})
+        first.observe("request_duration_seconds", 3.0, {"endpoint": "CalendarGetWeekplanEvents"})
+        first.observe("request_duration_seconds", 60.0, {"endpoint": "CalendarGetWeekplanEvents"})
+        second = metrics.IntegrationMetrics()
+        second.inc("token_refreshes_total", {"result": "success"})
+
+        text = metrics.render_prometheus({"entry-a": first, "entry-b": second})
+        lines = text.splitlines()
+
+        self.assertIn("# TYPE aula_easyiq_requests_total counter", lines)
+        self.assertIn(
+            'aula_easyiq_requests_total{entry_id="entry-a",endpoint="CalendarGetWeekplanEvents",status="403"} 1',
+            lines,
+        )
+        self.assertIn(
+            'aula_easyiq_response_bytes_total{entry_id="entry-a",endpoint="CalendarGetWeekplanEvents"} 2048',
+            lines,
+        )
+        self.assertIn('aula_easyiq_cache_hit_ratio{entry_id="entry-a",cache="html"} 0.75', lines)
+        self.assertIn('aula_easyiq_token_refreshes_total{entry_id="entry-b",result="success"} 1', lines)
+        bucket = 'aula_easyiq_request_duration_seconds_bucket{entry_id="entry-a",endpoint="CalendarGetWeekplanEvents",le="%s"} %d'
+        self.assertIn(bucket % ("0.01", 0), lines)
+        self.assertIn(bucket % ("0.025", 1), lines)
+        self.assertIn(bucket % ("5", 2), lines)
+        self.assertIn(bucket % ("+Inf", 3), lines)
+        self.assertIn(
+            'aula_easyiq_request_duration_seconds_count{entry_id="entry-a",endpoint="CalendarGetWeekplanEvents"} 3',
+            lines,
+        )
+        self.assertTrue(text.endswith("\n"))
+
+    def test_label_values_are_escaped(self) -> None:
+        source = metrics.IntegrationMetrics()
+        source.inc("calendar_variant_probes_total", {"variant": 'a"b\\c', "status": 200})
+
+        text = metrics.render_prometheus({"entry": source})
+
+        self.assertIn('variant="a\\"b\\\\c"', text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -63,6 +63,9 @@ class MitIDAuthViewTests(unittest.TestCase):
         self.assertFalse(views.MitIDAuthStatusView.requires_auth)
         self.assertFalse(views.MitIDAuthCompleteView.requires_auth)
 
+    def test_metrics_view_requires_home_assistant_login(self) -> None:
+        self.assertTrue(views.EasyIQMetricsView.requires_auth)
+
 
 if __name__ == "__main__":
     unittest.main()
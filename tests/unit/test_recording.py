@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import sys
+import time
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+INTEGRATION_DIR = ROOT / "custom_components" / "aula_easyiq"
+SCRIPTS_DIR = ROOT / "scripts"
+if str(INTEGRATION_DIR) in sys.path:
+    sys.path.remove(str(INTEGRATION_DIR))
+import calendar as _stdlib_calendar  # noqa: E402,F401 - keep stdlib calendar loaded
+
+
+def load_module(name: str, path: Path):
+    sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+recording = load_module("easyiq_recording", INTEGRATION_DIR / "recording.py")
+standin = load_module("standin_server", SCRIPTS_DIR / "standin_server.py")
+mitid_auth = load_module("mitid_auth", INTEGRATION_DIR / "mitid_auth.py")
+client_module = load_module("easyiq_client_recording_test", INTEGRATION_DIR / "client.py")
+
+BASE_URL = "http://standin.test"
+USERNAME = "guardian@example.test"
+
+
+def make_client(backend, **kwargs):
+    return client_module.EasyIQClient(
+        USERNAME,
+        mitid_auth.AulaTokenState(
+            access_token=backend.access_token,
+            refresh_token=backend.refresh_token,
+            expires_at=time.time() + 3600,
+        ),
+        session_factory=lambda: standin.StandInSession(backend),
+        api_base_url=f"{BASE_URL}/api/v",
+        calendar_url=f"{BASE_URL}{standin.CALENDAR_PATH}",
+        **kwargs,
+    )
+
+
+class RecordReplayTests(unittest.TestCase):
+    def test_recorded_cycle_is_sanitized_and_replays_with_original_timing(self) -> None:
+        live = standin.StandInBackend(
+            standin.StandInConfig(
+                children=2,
+                unread_threads=1,
+                accepted_variant="user-login/user-child",
+                latency=0.002,
+            )
+        )
+        recorder = recording.TrafficRecorder()
+        recorded_client = make_client(live, recorder=recorder)
+        asyncio.run(recorded_client.update_data_selective())
+
+        bundle = json.loads(json.dumps(recorder.as_har()))
+        text = json.dumps(bundle, ensure_ascii=False)
+        for secret in (live.access_token, USERNAME, "Child 1", "Child 2", "Besked 1", "Kære forældre", "Bearer widget-"):
+            self.assertNotIn(secret, text)
+        entries = bundle["log"]["entries"]
+        self.assertEqual(sum(live.stats.values()), len(entries))
+        self.assertTrue(all(entry["time"] >= 2 for entry in entries))
+
+        replay = standin.ReplayBackend(bundle, speed=2.0)
+        replayed_client = make_client(replay)
+        asyncio.run(replayed_client.update_data_selective())
+
+        # Pseudonyms keep lengths, so payload sizes stay realistic.
+        self.assertEqual(
+            [recording.pseudonym(child["name"]) for child in recorded_client.children],
+            [child["name"] for child in replayed_client.children],
+        )
+        for child_id in ("1000", "1001"):
+            self.assertEqual(
+                recorded_client.weekplan_data[child_id]["event_ids"],
+                replayed_client.weekplan_data[child_id]["event_ids"],
+            )
+        self.assertEqual(
+            recording.pseudonym(recorded_client.message["subject"]),
+            replayed_client.message["subject"],
+        )
+        self.assertEqual(0, sum(count for (_endpoint, status), count in replay.stats.items() if status == 404))
+
+        status, _payload, delay = replay.respond(
+            "GET",
+            "/api/v22",
+            {"method": "profiles.getProfilesByLogin"},
+            {},
+        )
+        self.assertEqual(200, status)
+        self.assertAlmostEqual(entries[0]["time"] / 2000, delay)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import types
+import unittest
+from pathlib import Path
+from typing import Any
+
+
+ROOT = Path(__file__).resolve().parents[2]
+INTEGRATION_DIR = ROOT / "custom_components" / "aula_easyiq"
+
+
+class CoordinatorEntity:
+    def __init__(self, coordinator: Any) -> None:
+        self.coordinator = coordinator
+        self.writes = 0
+
+    def _handle_coordinator_update(self) -> None:
+        self.async_write_ha_state()
+
+    def async_write_ha_state(self) -> None:
+        self.writes += 1
+
+
+def install_dependency_stubs() -> None:
+    """Install tiny stubs for the Home Assistant modules sensor.py imports."""
+    modules = {
+        name: types.ModuleType(name)
+        for name in (
+            "homeassistant",
+            "homeassistant.components",
+            "homeassistant.components.sensor",
+            "homeassistant.config_entries",
+            "homeassistant.core",
+            "homeassistant.exceptions",
+            "homeassistant.helpers",
+            "homeassistant.helpers.entity_platform",
+            "homeassistant.helpers.update_coordinator",
+        )
+    }
+    modules["homeassistant.components.sensor"].SensorEntity = object
+    modules["homeassistant.config_entries"].ConfigEntry = object
+    modules["homeassistant.core"].HomeAssistant = object
+    modules["homeassistant.core"].callback = lambda func: func
+    modules["homeassistant.exceptions"].ConfigEntryAuthFailed = type(
+        "ConfigEntryAuthFailed", (Exception,), {}
+    )
+    modules["homeassistant.helpers.entity_platform"].AddEntitiesCallback = object
+    update_coordinator = modules["homeassistant.helpers.update_coordinator"]
+    update_coordinator.CoordinatorEntity = CoordinatorEntity
+    update_coordinator.DataUpdateCoordinator = object
+    update_coordinator.UpdateFailed = type("UpdateFailed", (Exception,), {})
+    sys.modules.update(modules)
+
+    custom_components = types.ModuleType("custom_components")
+    custom_components.__path__ = [str(ROOT / "custom_components")]
+    aula_easyiq = types.ModuleType("custom_components.aula_easyiq")
+    aula_easyiq.__path__ = [str(INTEGRATION_DIR)]
+    sys.modules["custom_components"] = custom_components
+    sys.modules["custom_components.aula_easyiq"] = aula_easyiq
+
+
+def load_sensor_platform():
+    previous_modules = dict(sys.modules)
+    try:
+        install_dependency_stubs()
+        module_name = "custom_components.aula_easyiq.sensor"
+        spec = importlib.util.spec_from_file_location(module_name, INTEGRATION_DIR / "sensor.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        assert spec.loader is not None
+        spec.loader.exec_module(module)
+        return module
+    finally:
+        for name in set(sys.modules) - set(previous_modules):
+            del sys.modules[name]
+        sys.modules.update(previous_modules)
+
+
+sensor = load_sensor_platform()
+
+
+class FakeCoordinator:
+    def __init__(self) -> None:
+        self.last_update_success = True
+        self.data = {
+            "weekplan_data": {"100": {"revision": "r1", "event_ids": []}},
+            "calendar_diagnostics": {
+                "100": {
+                    "business_day_event_count": 3,
+                    "refreshed_weeks": ["2026-W43"],
+                    "last_updated": "2026-10-19T07:00:00",
+                    "week_offsets": {"0": {"stage": "success"}},
+                }
+            },
+        }
+
+
+class WeekplanSensorUpdateTests(unittest.TestCase):
+    def test_availability_and_diagnostics_changes_are_written_with_the_same_revision(self) -> None:
+        coordinator = FakeCoordinator()
+        entities = [
+            sensor.EasyIQChildSensor(coordinator, "100", "Child"),
+            sensor.EasyIQWeekplanSensor(coordinator, "100", "Child"),
+        ]
+
+        def refresh() -> list[int]:
+            for entity in entities:
+                entity._handle_coordinator_update()
+            return [entity.writes for entity in entities]
+
+        self.assertEqual([0, 0], refresh())
+        coordinator.last_update_success = False
+        self.assertEqual([1, 1], refresh())
+        coordinator.last_update_success = True
+        self.assertEqual([2, 2], refresh())
+        coordinator.data["calendar_diagnostics"]["100"]["business_day_event_count"] = 4
+        self.assertEqual([3, 3], refresh())
+        self.assertEqual([3, 3], refresh())
+
+    def test_a_calendar_fetch_with_an_unchanged_week_is_not_written(self) -> None:
+        coordinator = FakeCoordinator()
+        entity = sensor.EasyIQWeekplanSensor(coordinator, "100", "Child")
+        child_diagnostics = coordinator.data["calendar_diagnostics"]["100"]
+
+        child_diagnostics["last_updated"] = "2026-10-19T07:15:00"
+        child_diagnostics["refreshed_weeks"] = ["2026-W43", "2026-W44"]
+        entity._handle_coordinator_update()
+        self.assertEqual(0, entity.writes)
+        child_diagnostics["week_offsets"]["0"]["stage"] = "http_failed"
+        entity._handle_coordinator_update()
+        self.assertEqual(1, entity.writes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import sys
+import time
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+INTEGRATION_DIR = ROOT / "custom_components" / "aula_easyiq"
+SCRIPTS_DIR = ROOT / "scripts"
+if str(INTEGRATION_DIR) in sys.path:
+    sys.path.remove(str(INTEGRATION_DIR))
+import calendar as _stdlib_calendar  # noqa: E402,F401 - keep stdlib calendar loaded
+
+
+def load_module(name: str, path: Path):
+    sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+standin = load_module("standin_server", SCRIPTS_DIR / "standin_server.py")
+mitid_auth = load_module("mitid_auth", INTEGRATION_DIR / "mitid_auth.py")
+client_module = load_module("easyiq_client_standin_test", INTEGRATION_DIR / "client.py")
+
+BASE_URL = "http://standin.test"
+
+
+class FixtureResponse:
+    def __init__(self, status: int, payload: object) -> None:
+        self.status = status
+        self._payload = payload
+
+    async def __aenter__(self) -> "FixtureResponse":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    async def json(self) -> object:
+        return self._payload
+
+
+class FixtureSession:
+    """aiohttp-like session that answers fixture-mode requests from a backend."""
+
+    closed = False
+
+    def __init__(self, backend: object) -> None:
+        self.backend = backend
+
+    def get(self, url: str, **kwargs: object) -> FixtureResponse:
+        status, payload = self.backend.handle("GET", url[len(BASE_URL):], {}, {})
+        return FixtureResponse(status, payload)
+
+
+class StandInServerTests(unittest.TestCase):
+    def _client(self, backend):
+        return client_module.EasyIQClient(
+            "guardian@example.test",
+            mitid_auth.AulaTokenState(
+                access_token="expired",
+                refresh_token=backend.refresh_token,
+                expires_at=time.time() - 60,
+            ),
+            token_refresher=mitid_auth.AulaTokenRefresher(
+                f"{BASE_URL}{standin.TOKEN_PATH}",
+                session_factory=lambda: standin.StandInSession(backend),
+            ),
+            session_factory=lambda: standin.StandInSession(backend),
+            api_base_url=f"{BASE_URL}/api/v",
+            calendar_url=f"{BASE_URL}{standin.CALENDAR_PATH}",
+        )
+
+    def test_client_update_cycle_runs_against_standin_backend(self) -> None:
+        backend = standin.StandInBackend(
+            standin.StandInConfig(
+                children=2,
+                min_api_version=standin.CLIENT_API_VERSION + 1,
+                accepted_variant="user-login/user-child",
+                unread_threads=1,
+            )
+        )
+        client = self._client(backend)
+
+        asyncio.run(client.update_data_selective(weekplan_days=5, homework_days=5))
+
+        self.assertEqual(["1000", "1001"], [child["id"] for child in client.children])
+        self.assertTrue(client.apiurl.endswith(f"/api/v{standin.CLIENT_API_VERSION + 1}"))
+        self.assertEqual(backend.access_token, client.token_state.access_token)
+        self.assertEqual("Besked 1", client.message["subject"])
+        self.assertEqual(1, client.unread_messages)
+        self.assertEqual(30, len(client.weekplan_data["1000"]["event_ids"]))
+        self.assertEqual("KOMMET/TIL STEDE", client.presence_data["1000"]["status"])
+
+        stats = backend.stats
+        self.assertEqual(1, stats[("profiles.getProfilesByLogin", 410)])
+        self.assertEqual(1, stats[("oidc.token", 200)])
+        self.assertGreater(stats[("CalendarGetWeekplanEvents", 403)], 0)
+        self.assertGreater(stats[("CalendarGetWeekplanEvents", 200)], 0)
+
+        timings = client.update_diagnostics["timings"]
+        self.assertEqual(sum(stats.values()), timings["requests"])
+        # Token refresh bodies are read by the refresher, outside the counted session.
+        self.assertTrue(0 < timings["bytes"] <= backend.bytes_sent)
+        for phase in ("authenticate", "token_refresh", "widget_token", "calendar_week",
+                      "calendar_variant", "normalize", "presence", "messages"):
+            self.assertIn(phase, timings["phases"])
+        self.assertEqual(
+            {403, 200},
+            {span["status_code"] for span in timings["spans"] if span["phase"] == "calendar_variant"},
+        )
+        self.assertEqual(1, client.update_timings["percentiles"]["cycle"]["cycles"])
+
+        self.assertEqual(
+            stats[("CalendarGetWeekplanEvents", 200)],
+            client.metrics.counter_value(
+                "requests_total", {"endpoint": "CalendarGetWeekplanEvents", "status": 200}
+            ),
+        )
+        self.assertEqual(
+            1, client.metrics.counter_value("token_refreshes_total", {"result": "success"})
+        )
+
+    def test_fixture_documents_drive_a_fixture_mode_cycle(self) -> None:
+        backend = standin.StandInBackend(standin.StandInConfig(children=3))
+        client = client_module.EasyIQClient("fixture", None, fixture_base_url=BASE_URL)
+        client.session = FixtureSession(backend)
+
+        asyncio.run(client.update_data())
+        # The first cycle after a restart or reload is a silent baseline.
+        self.assertEqual({}, client.calendar_changes)
+        self.assertEqual(3, len(client.event_store))
+        first_stores = dict(client.event_store)
+        asyncio.run(client.update_data())
+
+        self.assertEqual(["1000", "1001", "1002"], [child["id"] for child in client.children])
+        self.assertEqual({}, client.calendar_changes)
+        for child_id, store in first_stores.items():
+            self.assertIs(store, client.event_store[child_id])
+        self.assertTrue(all(client.event_store[child_id] for child_id in ("1000", "1001", "1002")))
+        self.assertEqual(3, client.presence_data["1001"]["status_code"])
+        self.assertEqual(backend.config.unread_threads, client.unread_messages)
+        # One snapshot per cycle replaces the per-path documents.
+        self.assertEqual({("fixture.snapshot", 200): 2}, dict(backend.stats))
+
+        backend.config.fixture_snapshot = False
+        client._fixture_snapshot_supported = None
+        asyncio.run(client.update_data())
+        self.assertEqual(1, backend.stats[("fixture.profile", 200)])
+        self.assertEqual(3, backend.stats[("fixture.calendar", 200)])
+
+    def test_failing_snapshot_falls_back_to_per_path_documents_for_one_cycle(self) -> None:
+        backend = standin.StandInBackend(standin.StandInConfig(children=2))
+        session = FixtureSession(backend)
+        snapshot_status = [500]
+
+        def get(url: str, **kwargs: object) -> FixtureResponse:
+            if url.endswith("/snapshot") and snapshot_status[0] != 200:
+                return FixtureResponse(snapshot_status[0], {"error": "server error"})
+            return FixtureSession.get(session, url, **kwargs)
+
+        session.get = get
+        client = client_module.EasyIQClient("fixture", None, fixture_base_url=BASE_URL)
+        client.session = session
+
+        asyncio.run(client.update_data())
+
+        self.assertEqual(["1000", "1001"], [child["id"] for child in client.children])
+        self.assertEqual(1, backend.stats[("fixture.profile", 200)])
+        self.assertEqual(2, backend.stats[("fixture.calendar", 200)])
+        self.assertIsNot(False, client._fixture_snapshot_supported)
+
+        snapshot_status[0] = 200
+        asyncio.run(client.update_data())
+        self.assertEqual(1, backend.stats[("fixture.snapshot", 200)])
+        self.assertEqual(1, backend.stats[("fixture.profile", 200)])
+
+    def test_injected_errors_and_latency(self) -> None:
+        backend = standin.StandInBackend(
+            standin.StandInConfig(error_rate=1.0, latency=0.01, jitter=0.005)
+        )
+        status, _payload = backend.handle(
+            "GET",
+            f"/api/v{standin.CLIENT_API_VERSION}",
+            {"method": "profiles.getProfilesByLogin", "access_token": backend.access_token},
+            {},
+        )
+        self.assertEqual(503, status)
+        self.assertTrue(0.005 <= backend.delay() <= 0.015)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+MODULE_PATH = ROOT / "custom_components" / "aula_easyiq" / "state_summary.py"
+SPEC = importlib.util.spec_from_file_location("easyiq_state_summary", MODULE_PATH)
+state_summary = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = state_summary
+assert SPEC.loader is not None
+SPEC.loader.exec_module(state_summary)
+
+
+class StateSummaryTests(unittest.TestCase):
+    def test_calendar_summary_drops_attempts_and_previews(self) -> None:
+        child_diagnostics = {
+            "business_day_event_count": 12,
+            "raw_event_count": 14,
+            "duplicate_event_count": 1,
+            "refreshed_weeks": ["2026-W42", "2026-W43"],
+            "target_dates": ["2026-10-19", "2026-10-20"],
+            "raw_event_type_counts": {"lesson": 14},
+            "last_updated": "2026-10-19T07:00:00",
+            "week_offsets": {
+                "0": {
+                    "stage": "success",
+                    "attempts": [{"payload": {"sample_event": {"description": "x" * 160}}}],
+                },
+                "1": {"stage": "http_failed", "status": 503},
+            },
+        }
+
+        summary = state_summary.calendar_summary(child_diagnostics)
+
+        self.assertEqual(
+            {
+                "business_day_event_count": 12,
+                "raw_event_count": 14,
+                "duplicate_event_count": 1,
+                "last_updated": "2026-10-19T07:00:00",
+                "refreshed_weeks": 2,
+                "week_stages": {"0": "success", "1": "http_failed"},
+            },
+            summary,
+        )
+        self.assertLess(len(json.dumps(summary)), len(json.dumps(child_diagnostics)) / 2)
+        self.assertEqual({}, state_summary.calendar_summary(None))
+        key = state_summary.calendar_state_key(child_diagnostics)
+        self.assertNotIn("last_updated", key)
+        self.assertNotIn("refreshed_weeks", key)
+        self.assertEqual({"0": "success", "1": "http_failed"}, key["week_stages"])
+
+    def test_update_and_loop_blocking_summaries_keep_totals(self) -> None:
+        update = state_summary.update_summary(
+            {
+                "mode": "presence_messages",
+                "children": ["Child A"],
+                "last_update_started": "2026-10-19T07:00:00",
+                "timings": {"spans": [{"name": "request"}] * 50},
+            },
+            {"total_ms": 812.5, "requests": 6, "phases": {"children": {"ms": 10.0}}},
+        )
+        blocking = state_summary.loop_blocking_summary(
+            {
+                "threshold_ms": 50.0,
+                "slow_sections": 2,
+                "sections": {
+                    "coordinator_update": {"max_ms": 72.0},
+                    "EasyIQChildSensor.async_write_ha_state": {"max_ms": 130.0},
+                },
+                "recent_slow": [{"stack": ["client.py:1 update_data"]}],
+            }
+        )
+
+        self.assertEqual(
+            {
+                "mode": "presence_messages",
+                "last_update_started": "2026-10-19T07:00:00",
+                "total_ms": 812.5,
+                "requests": 6,
+            },
+            update,
+        )
+        self.assertEqual(
+            {
+                "threshold_ms": 50.0,
+                "slow_sections": 2,
+                "slowest_section": "EasyIQChildSensor.async_write_ha_state",
+                "slowest_ms": 130.0,
+            },
+            blocking,
+        )
+        self.assertEqual({}, state_summary.loop_blocking_summary({}))
+
+
+if __name__ == "__main__":
+    unittest.main()
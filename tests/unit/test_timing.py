@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+MODULE_PATH = ROOT / "custom_components" / "aula_easyiq" / "timing.py"
+SPEC = importlib.util.spec_from_file_location("easyiq_timing", MODULE_PATH)
+timing = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = timing
+assert SPEC.loader is not None
+SPEC.loader.exec_module(timing)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CycleTimingsTests(unittest.TestCase):
+    def test_nested_spans_split_network_and_local_time(self) -> None:
+        clock = FakeClock()
+        timings = timing.CycleTimings(clock=clock)
+
+        timings.start_cycle()
+        with timings.span("calendar_week", child="1000", week=0):
+            with timings.span("calendar_variant", variant="a") as attempt:
+                clock.now += 0.2
+                timings.record_request(0.2, 1500)
+                attempt["status_code"] = 200
+            with timings.span("normalize"):
+                clock.now += 0.05
+        clock.now += 0.01
+        cycle = timings.finish_cycle()
+
+        self.assertEqual(260.0, cycle["total_ms"])
+        self.assertEqual(200.0, cycle["network_ms"])
+        self.assertEqual((1, 1500), (cycle["requests"], cycle["bytes"]))
+        week = cycle["phases"]["calendar_week"]
+        self.assertEqual((250.0, 200.0, 1), (week["ms"], week["network_ms"], week["requests"]))
+        self.assertEqual(0.0, cycle["phases"]["normalize"]["network_ms"])
+        variant = next(span for span in cycle["spans"] if span["phase"] == "calendar_variant")
+        self.assertEqual(("a", 200), (variant["variant"], variant["status_code"]))
+
+    def test_percentiles_roll_over_recent_cycles_only(self) -> None:
+        clock = FakeClock()
+        timings = timing.CycleTimings(history=3, clock=clock)
+        for seconds in (1.0, 2.0, 3.0, 4.0):
+            timings.start_cycle()
+            with timings.span("presence"):
+                clock.now += seconds
+            timings.finish_cycle()
+
+        # Spans outside a cycle are not collected.
+        with timings.span("presence"):
+            clock.now += 100
+
+        percentiles = timings.percentiles()
+        self.assertEqual({"p50_ms": 3000.0, "p95_ms": 3900.0, "cycles": 3}, percentiles["cycle"])
+        self.assertEqual(3000.0, percentiles["presence"]["p50_ms"])
+
+
+if __name__ == "__main__":
+    unittest.main()
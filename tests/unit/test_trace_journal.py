@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+INTEGRATION_DIR = ROOT / "custom_components" / "aula_easyiq"
+SCRIPTS_DIR = ROOT / "scripts"
+if str(INTEGRATION_DIR) in sys.path:
+    sys.path.remove(str(INTEGRATION_DIR))
+import calendar as _stdlib_calendar  # noqa: E402,F401 - keep stdlib calendar loaded
+
+
+def load_module(name: str, path: Path):
+    sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+trace_journal = load_module("easyiq_trace_journal", INTEGRATION_DIR / "trace_journal.py")
+summarize_trace = load_module("summarize_trace", SCRIPTS_DIR / "summarize_trace.py")
+standin = load_module("standin_server", SCRIPTS_DIR / "standin_server.py")
+mitid_auth = load_module("mitid_auth", INTEGRATION_DIR / "mitid_auth.py")
+client_module = load_module("easyiq_client_trace_test", INTEGRATION_DIR / "client.py")
+
+BASE_URL = "http://standin.test"
+
+
+class TraceJournalTests(unittest.TestCase):
+    def test_flush_rotates_at_size_cap_and_keeps_backups(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "journal" / "trace.jsonl"
+            journal = trace_journal.TraceJournal(path, max_bytes=400, backups=2)
+
+            for _ in range(8):
+                journal.start_cycle()
+                for _ in range(3):
+                    journal.record("request", endpoint="presence.getDailyOverview", status=200, ms=12.5)
+                self.assertEqual(3, journal.flush())
+
+            self.assertEqual(
+                ["trace.jsonl", "trace.jsonl.1", "trace.jsonl.2"],
+                sorted(item.name for item in path.parent.iterdir()),
+            )
+            self.assertTrue(all(item.stat().st_size <= 400 for item in path.parent.iterdir()))
+            cycles = [record["cycle"] for record in summarize_trace.read_records(summarize_trace.journal_files(path))]
+            self.assertEqual(cycles, sorted(cycles))
+            self.assertEqual(8, cycles[-1])
+
+    def test_client_cycle_journal_is_summarized_without_personal_data(self) -> None:
+        backend = standin.StandInBackend(standin.StandInConfig(
+                children=2, unread_threads=1, accepted_variant="user-login/user-child"
+            ))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "trace.jsonl"
+            client = client_module.EasyIQClient(
+                "guardian@example.test",
+                mitid_auth.AulaTokenState(
+                    access_token="expired",
+                    refresh_token=backend.refresh_token,
+                    expires_at=time.time() - 60,
+                ),
+                token_refresher=mitid_auth.AulaTokenRefresher(
+                    f"{BASE_URL}{standin.TOKEN_PATH}",
+                    session_factory=lambda: standin.StandInSession(backend),
+                ),
+                session_factory=lambda: standin.StandInSession(backend),
+                api_base_url=f"{BASE_URL}/api/v",
+                calendar_url=f"{BASE_URL}{standin.CALENDAR_PATH}",
+                trace_journal=trace_journal.TraceJournal(path),
+            )
+
+            asyncio.run(client.update_data_selective())
+            asyncio.run(client.update_data_selective())
+
+            text = path.read_text()
+            for secret in (backend.access_token, backend.refresh_token, "guardian@example.test",
+                           client.children[0]["name"], "Besked 1"):
+                self.assertNotIn(secret, text)
+            summary = summarize_trace.summarize(summarize_trace.read_records([path]))
+
+        # The token refresher uses its own session, outside the journal.
+        requests = sum(
+            count for (endpoint, _status), count in backend.stats.items() if endpoint != "oidc.token"
+        )
+        self.assertEqual(2, summary["cycles"]["count"])
+        self.assertEqual(
+            requests,
+            sum(sum(values["statuses"].values()) for values in summary["endpoints"].values()),
+        )
+        self.assertIn("403", summary["endpoints"]["CalendarGetWeekplanEvents"]["statuses"])
+        self.assertIn("calendar_week", summary["phases"])
+        # The second cycle reuses the unchanged calendar payloads.
+        self.assertGreater(summary["cache_hit_ratio"]["calendar_response"], 0)
+        self.assertIn("cycles: 2 (0 failed)", summarize_trace.format_summary(summary))
+
+
+if __name__ == "__main__":
+    unittest.main()
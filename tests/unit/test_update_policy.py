@@ -81,5 +81,35 @@ class ShouldUpdateDataTypeTests(unittest.TestCase):
         )
 
 
+class CalendarWeekPolicyTests(unittest.TestCase):
+    def test_week_interval_grows_with_distance(self) -> None:
+        self.assertEqual(900, update_policy.calendar_week_interval(900, 0))
+        self.assertEqual(3600, update_policy.calendar_week_interval(900, 1))
+        self.assertEqual(14400, update_policy.calendar_week_interval(900, 2))
+        self.assertEqual(14400, update_policy.calendar_week_interval(900, 5))
+        self.assertIsNone(update_policy.calendar_week_interval(900, -1))
+
+    def test_later_weeks_skip_until_their_interval_elapses(self) -> None:
+        now = datetime(2026, 6, 20, 12, 0, 0)
+        last_update = now - timedelta(seconds=1800)
+
+        self.assertTrue(update_policy.should_update_calendar_week(0, 900, last_update, now))
+        self.assertFalse(update_policy.should_update_calendar_week(1, 900, last_update, now))
+        self.assertFalse(update_policy.should_update_calendar_week(2, 900, last_update, now))
+
+    def test_past_weeks_are_fetched_once(self) -> None:
+        now = datetime(2026, 6, 20, 12, 0, 0)
+
+        self.assertTrue(update_policy.should_update_calendar_week(-1, 900, None, now))
+        self.assertFalse(
+            update_policy.should_update_calendar_week(-1, 900, now - timedelta(days=30), now)
+        )
+
+    def test_missing_base_interval_always_updates(self) -> None:
+        now = datetime(2026, 6, 20, 12, 0, 0)
+
+        self.assertTrue(update_policy.should_update_calendar_week(2, None, now, now))
+
+
 if __name__ == "__main__":
     unittest.main()